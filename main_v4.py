@@ -13,17 +13,29 @@ Novidades da v4 em relação à v4:
 import speech_recognition as sr
 from openai import OpenAI
 import pyaudio
-import pygame
 import numpy as np
 import os
 import threading
 import time
-import tempfile
 import queue
-import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 from tools.jarvis_memoria import JarvisMemoria
+from tools.buffer_audio import BufferCircularAudio
+from tools.captura_audio import CapturaAudio
+from tools.nivel_ruido import EstimadorRuido, calcular_rms
+from tools.detector_voz import DetectorVoz
+from tools.fim_de_fala import DetectorFimFala
+from tools.cancelador_eco import CanceladorEco, reamostrar
+from tools.fala_pipeline import AudioEmFluxo, CancelamentoFala, FaladorPipeline, SegmentadorFrases, dividir_frases
+from tools.saida_audio import SaidaAudio
+from tools.cache_fala import CacheFala
+from tools.gerenciador_contexto import GerenciadorContexto
+from tools.resumidor_conversa import ResumidorConversa
+from tools.roteador_intencoes import RoteadorIntencoes
+from tools.reconhecedor_chamada import ChamadaFerramenta, ReconhecedorChamada, reconhecer_chamada
 
 # Importa o orquestrador diretamente
 import sys
@@ -33,19 +45,92 @@ from tools.orquestrador_tools import OrquestradorDeTools
 load_dotenv()
 
 # ========== CONFIGURAÇÕES ==========
-LIMIAR_INTERRUPCAO = 1500
+LIMIAR_INTERRUPCAO = 600  # Mínimo (RMS) - sobe sozinho com o ruído do ambiente
 TAXA_AMOSTRAGEM = 16000
-TAMANHO_CHUNK = 1024
+TAMANHO_CHUNK = 512  # 32 ms por quadro
+SEGUNDOS_PRE_ROLL = 2  # Áudio guardado enquanto o JARVIS fala
+MARGEM_PRE_ROLL = 0.3  # Segundos mantidos antes do início detectado da fala
+CAPACIDADE_FILA_AUDIO = 64  # Quadros pendentes (~2s) antes de descartar
+
+# Detector de voz (subquadros de 16 ms)
+VAD_JANELA_VOTOS = 8   # Subquadros considerados (~128 ms)
+VAD_VOTOS_MINIMOS = 5  # Votos de fala para confirmar a interrupção (~80 ms)
+
+# OpenAI chat
+CHAT_MODEL = "gpt-5-mini"
+RESPOSTA_EM_FLUXO = True  # Fala cada frase assim que o modelo termina de escrevê-la
+FERRAMENTAS_PARALELO = 4  # Chamadas de ferramenta executadas ao mesmo tempo
+PROCESSOS_FERRAMENTAS = 0  # Processos que executam as ferramentas (0 = threads do próprio JARVIS)
 
 # OpenAI TTS
 TTS_MODEL = "gpt-4o-mini-tts"
 TTS_VOICE = "shimmer"
+TAXA_TTS = 24000  # Formato "pcm" da OpenAI: 24 kHz, 16 bits, mono
+TTS_PARALELO = 2  # Frases sintetizadas ao mesmo tempo
+TTS_INSTRUCTIONS = "Speak in a cheerful and positive tone."
+
+# Cache de fala (frases repetidas tocam sem chamar a API)
+PASTA_CACHE_FALA = "cache_fala"
+LIMITE_CACHE_FALA_DISCO = 50 * 1024 * 1024    # ~18 min de áudio
+LIMITE_CACHE_FALA_MEMORIA = 8 * 1024 * 1024   # Camada quente em RAM
+FRASES_AQUECIMENTO = [  # Pré-sintetizadas ao iniciar ({saudacao} e {nome} são preenchidos)
+    "{saudacao} Como posso te ajudar hoje?",
+    "Até logo, {nome}! Foi um prazer conversar com você!",
+    "Tem certeza que quer que eu esqueça nossas conversas anteriores?",
+    "Ok, memória limpa. Começamos do zero!",
+    "Ok, vou manter tudo guardado!",
+    "Olá! Eu sou o JARVIS, seu assistente pessoal. Prazer em conhecê-lo!",
+    "Para começarmos, qual é o seu nome?",
+    "Ok, vamos tentar novamente. Qual é o seu nome?",
+    "Tudo bem, vamos começar sem o nome por enquanto. Você pode me dizer depois!",
+]
+
+# Cancelamento de eco (voz do JARVIS voltando pelo microfone)
+ATRASO_ECO = 0.08  # Latência estimada alto-falante → microfone (s)
+
+# Fim de fala (compartilhado por ouvir() e pela interrupção)
+SILENCIO_MINIMO = 0.5   # Silêncio (s) que encerra uma frase curta
+SILENCIO_MAXIMO = 1.5   # Silêncio (s) máximo exigido, mesmo em frases longas
+ESPERA_INICIO_FALA = 15  # Segundos aguardando o usuário começar a falar
+FALA_MAXIMA = 30         # Duração máxima de uma frase (s)
+
+# Interrupção
+ESPERA_MAXIMA_INTERRUPCAO = 30  # Segundos aguardando a transcrição da interrupção
 
 # Memória
-LIMITE_HISTORICO = 50  # Últimas 50 mensagens carregadas do banco
+CAUDA_HISTORICO = 10     # Mensagens recentes que o resumidor deixa fora do resumo
+RESUMO_LOTE_MINIMO = 20  # Mensagens antigas acumuladas antes de atualizar o resumo
+ORCAMENTO_CONTEXTO = 6000         # Tokens máximos do histórico enviado ao modelo
+LIMITE_RESULTADO_FERRAMENTA = 400  # Caracteres mantidos de resultados antigos de ferramentas
+
+# Cache de ferramentas
+CACHE_FERRAMENTAS_DB = "cache_ferramentas.db"  # None = só em memória
+CAPACIDADE_CACHE_FERRAMENTAS = 256             # Resultados guardados (LRU)
 # ===================================
 
-pygame.mixer.init()
+
+class PassagemInterrupcao:
+    """
+    Entrega da frase da interrupção do monitor para o loop principal
+    
+    Criada no instante em que a interrupção é detectada; o loop principal
+    aguarda nela e acorda assim que a transcrição fica pronta
+    (ou logo que se sabe que nada foi reconhecido).
+    """
+    
+    def __init__(self):
+        self._pronto = threading.Event()
+        self.texto = None
+    
+    def entregar(self, texto):
+        """Publica o resultado (None se nada foi reconhecido)"""
+        self.texto = texto
+        self._pronto.set()
+    
+    def aguardar(self, timeout: float = None):
+        """Bloqueia até o resultado chegar e o retorna (None se vazio ou expirou)"""
+        self._pronto.wait(timeout)
+        return self.texto
 
 
 class ClienteOrquestrador:
@@ -55,7 +140,10 @@ class ClienteOrquestrador:
         """Inicializa o orquestrador diretamente"""
         print("🔌 Iniciando Orquestrador de Tools...")
         
-        self.orquestrador = OrquestradorDeTools()
+        self.orquestrador = OrquestradorDeTools(
+            CAPACIDADE_CACHE_FERRAMENTAS, CACHE_FERRAMENTAS_DB,
+            max_paralelo=FERRAMENTAS_PARALELO, processos=PROCESSOS_FERRAMENTAS
+        )
 
         ferramentas = list(self.orquestrador.ferramentas.keys())
         print(f"✅ Orquestrador pronto! Ferramentas: {', '.join(ferramentas)}")
@@ -66,6 +154,10 @@ class ClienteOrquestrador:
         self.ferramentas = self.orquestrador.obter_lista_ferramentas()
         return self.ferramentas
     
+    def listar_ferramentas_openai(self) -> list:
+        """Ferramentas no formato do parâmetro `tools` da API"""
+        return self.orquestrador.obter_ferramentas_openai()
+    
     def chamar_ferramenta(self, nome: str, argumentos: dict) -> any:
         """Chama uma ferramenta pelo nome"""
         resposta = self.orquestrador.chamar_ferramenta(nome, argumentos)
@@ -76,8 +168,31 @@ class ClienteOrquestrador:
         
         return resposta.get("result")
     
+    def chamar_ferramenta_async(self, nome: str, argumentos: dict):
+        """Começa a chamada no pool do orquestrador (Future com result/error)"""
+        print(f"   🔧 Chamando: {nome}")
+        print(f"   📋 Args: {argumentos}")
+        return self.orquestrador.chamar_ferramenta_async(nome, argumentos)
+    
+    def cancelar_chamadas(self) -> int:
+        """Cancela as ferramentas em andamento (interrupção do usuário)"""
+        return self.orquestrador.cancelar_chamadas()
+    
+    def estatisticas_cache(self) -> dict:
+        """Acertos/faltas do cache de resultados das ferramentas"""
+        return self.orquestrador.estatisticas_cache()
+    
     def fechar(self):
         """Cleanup"""
+        execucao = self.orquestrador
+        if execucao.prazos_esgotados or execucao.chamadas_canceladas:
+            print(f"⏱️ Ferramentas: {execucao.prazos_esgotados} fora do prazo | "
+                  f"{execucao.chamadas_canceladas} canceladas")
+        if execucao.pool is not None:
+            pool = execucao.pool.estatisticas()
+            print(f"🧩 Processos de ferramentas: {pool['chamadas']} chamadas | {pool['reciclados']} reciclados | "
+                  f"{pool['mortos_por_prazo']} mortos por prazo | {pool['quebras']} quebras")
+        self.orquestrador.fechar()
         print("🔌 Orquestrador finalizado")
 
 
@@ -91,6 +206,22 @@ class JarvisComMemoria:
         self.reconhecedor = sr.Recognizer()
         print("   ✓ Reconhecedor criado")
         self.pyaudio = pyaudio.PyAudio()
+        self.captura = CapturaAudio(self.pyaudio, TAXA_AMOSTRAGEM, TAMANHO_CHUNK)
+        self.fila_monitor = self.captura.inscrever("monitor", CAPACIDADE_FILA_AUDIO)
+        self.fila_ouvir = self.captura.inscrever("ouvir", CAPACIDADE_FILA_AUDIO, ativa=False)
+        self.ruido = EstimadorRuido(
+            janela_quadros=int(10 * TAXA_AMOSTRAGEM / TAMANHO_CHUNK),
+            limiar_interrupcao_minimo=LIMIAR_INTERRUPCAO
+        )
+        self.vad = DetectorVoz(TAXA_AMOSTRAGEM, janela_votos=VAD_JANELA_VOTOS, votos_minimos=VAD_VOTOS_MINIMOS)
+        self.cancelador = CanceladorEco(TAXA_AMOSTRAGEM, atraso=ATRASO_ECO)
+        self.cache_fala = CacheFala(
+            PASTA_CACHE_FALA, TTS_MODEL, TTS_VOICE, TTS_INSTRUCTIONS,
+            limite_disco=LIMITE_CACHE_FALA_DISCO, limite_memoria=LIMITE_CACHE_FALA_MEMORIA
+        )
+        self.saida = SaidaAudio(self.pyaudio, TAXA_TTS, ao_tocar=self._referencia_eco)
+        self.falador = FaladorPipeline(self._sintetizar, self._reproduzir, max_paralelo=TTS_PARALELO)
+        self.vad_ouvir = DetectorVoz(TAXA_AMOSTRAGEM, janela_votos=VAD_JANELA_VOTOS, votos_minimos=VAD_VOTOS_MINIMOS)
         print("   ✓ PyAudio criado")
         
         # NOVO v5: Inicializa MEMÓRIA
@@ -106,32 +237,49 @@ class JarvisComMemoria:
         print("   ✓ Orquestrador criado")
         print("   → Listando ferramentas...")
         self.ferramentas_disponiveis = self.orquestrador.listar_ferramentas()
+        self.ferramentas_openai = self.orquestrador.listar_ferramentas_openai()
+        self.roteador = RoteadorIntencoes(self.orquestrador.chamar_ferramenta)
         print(f"   ✓ {len(self.ferramentas_disponiveis)} ferramentas carregadas")
         
         # Controle de estado (igual v4)
         self.falando = False
-        self.interromper = threading.Event()
+        self.interromper = CancelamentoFala()  # Trocado a cada falar()
         self.executando = True
-        self.buffer_audio = []
-        self.trava_audio = threading.Lock()
-        self.comando_interrompido = None
+        self.buffer_audio = BufferCircularAudio(int(SEGUNDOS_PRE_ROLL * TAXA_AMOSTRAGEM))
         
-        # Configura reconhecimento
-        self.reconhecedor.energy_threshold = 150
-        self.reconhecedor.dynamic_energy_threshold = True
-        self.reconhecedor.pause_threshold = 2.0
-        self.reconhecedor.non_speaking_duration = 0.8
+        # Transcrição das interrupções fora da thread do monitor
+        self.executor_transcricao = ThreadPoolExecutor(max_workers=2, thread_name_prefix="transcricao")
+        self.fila_interrupcoes = queue.Queue()
         
         # NOVO v5: Carrega nome do usuário (se existir)
         self.nome_usuario = self.memoria.obter_nome_usuario()
         
-        # Histórico da sessão atual (memória RAM)
+        # Histórico da sessão atual (memória RAM), limitado a ORCAMENTO_CONTEXTO tokens
+        self.contexto = GerenciadorContexto(ORCAMENTO_CONTEXTO, LIMITE_RESULTADO_FERRAMENTA)
         self.historico = [
             {"role": "system", "content": self._criar_prompt_sistema()}
         ]
         
-        # NOVO v5: Carrega histórico recente do banco
-        historico_banco = self.memoria.obter_historico_recente(LIMITE_HISTORICO)
+        # Memória de longo prazo: resumo das conversas antigas + cauda recente
+        self.resumidor = ResumidorConversa(
+            self._completar_resumo, self.memoria.db_path,
+            cauda=CAUDA_HISTORICO, lote_minimo=RESUMO_LOTE_MINIMO
+        )
+        resumo = self.memoria.obter_resumo()
+        if resumo:
+            print(f"   ✓ Resumo das conversas anteriores carregado ({len(resumo['conteudo'])} caracteres)")
+            self.historico.append({
+                "role": "system",
+                "content": f"RESUMO DAS CONVERSAS ANTERIORES:\n{resumo['conteudo']}"
+            })
+        
+        # Tudo que o resumo ainda não cobre (a cauda e o lote que ainda não
+        # juntou para resumir - até CAUDA + LOTE - 1 mensagens); cortar na
+        # cauda perderia esse lote. O GerenciadorContexto respeita o orçamento.
+        historico_banco = [
+            {"role": m["role"], "content": m["content"]}
+            for m in self.memoria.obter_mensagens_apos(resumo["ate_mensagem"] if resumo else 0)
+        ]
         if historico_banco:
             print(f"   ✓ Carregadas {len(historico_banco)} mensagens do histórico")
             print(f"   📝 Primeira: {historico_banco[0]['content'][:50]}...")
@@ -140,6 +288,9 @@ class JarvisComMemoria:
         else:
             print(f"   ⚠️ Nenhuma mensagem no histórico")
         
+        # Incorpora ao resumo o que ficou de fora da cauda (sessões anteriores)
+        self.resumidor.agendar()
+        
         print("🎤 JARVIS v5 - Memória Persistente + Personalização!")
         print(f"🔊 Voz: {TTS_VOICE} | Modelo: {TTS_MODEL}")
         print(f"🛠️ Ferramentas: {len(self.ferramentas_disponiveis)}")
@@ -162,24 +313,9 @@ Você pode se referir a conversas passadas, ferramentas que já usou, e coisas q
 Seja amigável, use o nome do usuário nas respostas quando apropriado.
 Responda em português de forma concisa e natural.
 
-Quando precisar usar uma ferramenta, responda APENAS o JSON com o formato EXATO abaixo:
-{{
-    "tool": "nome_exato_da_ferramenta",
-    "arguments": {{"param1": "valor1"}}
-}}
-
-IMPORTANTE: Use o nome EXATO da ferramenta conforme listado abaixo.
-
-Ferramentas disponíveis:
-"""
-        
-        for ferramenta in self.ferramentas_disponiveis:
-            prompt += f"\n- {ferramenta['name']}: {ferramenta['description']}"
-            parametros = ferramenta.get('parameters', {})
-            if parametros:
-                prompt += f"\n  Parâmetros: {', '.join(parametros.keys())}"
-        
-        prompt += f"""
+Você tem ferramentas (horário, clima, buscas, arquivos) disponíveis como funções.
+Se o pedido precisar de várias informações, chame TODAS as ferramentas necessárias
+de uma vez, na mesma resposta (ex.: clima de duas cidades e a hora = três chamadas).
 
 IMPORTANTE:
 1. Use ferramentas quando apropriado (horário, cálculos, clima, buscas)
@@ -229,101 +365,241 @@ IMPORTANTE:
         self.falar("Tudo bem, vamos começar sem o nome por enquanto. Você pode me dizer depois!")
     
     def monitorar_audio(self):
-        """Thread que monitora áudio (idêntico v4)"""
+        """Thread que analisa os quadros entregues pelo barramento de captura"""
         print("👂 Monitor de áudio iniciado")
         
-        fluxo = self.pyaudio.open(
-            format=pyaudio.paInt16,
-            channels=1,
-            rate=TAXA_AMOSTRAGEM,
-            input=True,
-            frames_per_buffer=TAMANHO_CHUNK
-        )
-        
-        contagem_alta = 0
-        CONTAGEM_MINIMA = 3
+        estava_falando = False
         gravando_interrupcao = False
         frames_interrupcao = []
-        frames_silencio = 0
-        FRAMES_SILENCIO_MAX = 15
+        fim_fala = self._criar_detector_fim_fala()
+        duracao_quadro = TAMANHO_CHUNK / TAXA_AMOSTRAGEM
+        passagem = None
         
-        try:
-            while self.executando:
-                dados = fluxo.read(TAMANHO_CHUNK, exception_on_overflow=False)
-                dados_audio = np.frombuffer(dados, dtype=np.int16)
-                nivel = np.abs(dados_audio).mean()
+        while self.executando:
+            quadro = self.fila_monitor.ler(timeout=0.5)
+            if quadro is None:
+                continue
+            
+            dados, instante = quadro
+            dados_audio = np.frombuffer(dados, dtype=np.int16)
+            
+            # Tira a voz do JARVIS antes do VAD (usa o áudio tocado como referência)
+            if self.cancelador.ativo:
+                dados_audio = self.cancelador.processar(dados_audio, instante)
+                dados = dados_audio.tobytes()
+            
+            # Fora da fala do JARVIS o microfone só tem ambiente + usuário:
+            # atualiza o piso de ruído (o ouvir() lê o limiar de fala dele)
+            if not self.falando and not gravando_interrupcao:
+                nivel = self.ruido.atualizar(dados_audio)
+            else:
+                nivel = calcular_rms(dados_audio)
+            
+            # Com o JARVIS falando, exige o limiar de interrupção (voz dele vaza no microfone)
+            limiar = self.ruido.limiar_interrupcao if self.falando else self.ruido.limiar_fala
+            
+            if self.falando and not estava_falando:
+                self.vad.reiniciar()
+            estava_falando = self.falando
+            
+            tem_fala = False
+            if self.falando or gravando_interrupcao:
+                tem_fala = self.vad.processar(dados_audio, limiar)
+            
+            if self.falando:
+                self.buffer_audio.escrever(dados_audio)
                 
-                if self.falando:
-                    with self.trava_audio:
-                        self.buffer_audio.append(dados)
-                        max_frames = int(5 * TAXA_AMOSTRAGEM / TAMANHO_CHUNK)
-                        if len(self.buffer_audio) > max_frames:
-                            self.buffer_audio.pop(0)
-                    
-                    if nivel > LIMIAR_INTERRUPCAO:
-                        contagem_alta += 1
-                        if contagem_alta >= CONTAGEM_MINIMA and not self.interromper.is_set():
-                            print(f"🛑 INTERRUPÇÃO! Nível: {nivel:.0f}")
-                            self.interromper.set()
-                            pygame.mixer.music.stop()
-                            gravando_interrupcao = True
-                            frames_interrupcao = list(self.buffer_audio)
-                    else:
-                        contagem_alta = 0
+                interromper = self.interromper  # A da fala que está tocando
+                if tem_fala and not gravando_interrupcao and not interromper.is_set():
+                    print(f"🛑 INTERRUPÇÃO! Nível: {nivel:.0f}")
+                    # Publica a passagem ANTES de avisar o falar(), assim o
+                    # loop principal sempre a encontra ao voltar
+                    passagem = PassagemInterrupcao()
+                    self.fila_interrupcoes.put(passagem)
+                    interromper.set()  # Também fecha o stream do modelo
+                    self.saida.parar()
+                    self.orquestrador.cancelar_chamadas()
+                    gravando_interrupcao = True
+                    frames_interrupcao = [self._recortar_pre_roll(limiar)]
+                    fim_fala.reiniciar()
+                    fim_fala.processar(True, duracao_quadro)
+                    continue
+            
+            if gravando_interrupcao:
+                frames_interrupcao.append(dados)
                 
-                if gravando_interrupcao:
-                    frames_interrupcao.append(dados)
+                if fim_fala.processar(tem_fala, duracao_quadro):
+                    gravando_interrupcao = False
                     
-                    if nivel < LIMIAR_INTERRUPCAO / 2:
-                        frames_silencio += 1
-                    else:
-                        frames_silencio = 0
+                    # Reconhecimento vai para o pool - o monitor continua lendo quadros
+                    bytes_audio = b''.join(frames_interrupcao)
+                    self.executor_transcricao.submit(self._transcrever_interrupcao, bytes_audio, passagem)
                     
-                    if frames_silencio >= FRAMES_SILENCIO_MAX:
-                        gravando_interrupcao = False
-                        frames_silencio = 0
-                        
-                        bytes_audio = b''.join(frames_interrupcao)
-                        audio_sr = sr.AudioData(bytes_audio, TAXA_AMOSTRAGEM, 2)
-                        
-                        try:
-                            texto = self.reconhecedor.recognize_google(audio_sr, language='pt-BR')
-                            print(f"👤 Interrupção capturada: {texto}")
-                            self.comando_interrompido = texto
-                        except:
-                            print("❓ Não entendi a interrupção")
-                            self.comando_interrompido = None
-                        
-                        frames_interrupcao = []
-                
-                time.sleep(0.03)
-                
+                    frames_interrupcao = []
+    
+    def _criar_detector_fim_fala(self) -> DetectorFimFala:
+        """Mesmo endpointing para o ouvir() e para a frase da interrupção"""
+        return DetectorFimFala(
+            silencio_minimo=SILENCIO_MINIMO,
+            silencio_maximo=SILENCIO_MAXIMO,
+            fala_maxima=FALA_MAXIMA
+        )
+    
+    def _recortar_pre_roll(self, limiar: float) -> bytes:
+        """
+        Mantém do pre-roll só o trecho a partir do início da fala do usuário
+        (menos a margem) - o resto é a voz do próprio JARVIS vazando no microfone
+        """
+        pre_roll = self.buffer_audio.copiar()
+        inicio = self.vad.encontrar_inicio(pre_roll, limiar)
+        inicio = max(0, inicio - int(MARGEM_PRE_ROLL * TAXA_AMOSTRAGEM))
+        print(f"   ✂️ Pre-roll: {len(pre_roll) / TAXA_AMOSTRAGEM:.2f}s → "
+              f"{(len(pre_roll) - inicio) / TAXA_AMOSTRAGEM:.2f}s")
+        return pre_roll[inicio:].tobytes()
+    
+    def _transcrever_interrupcao(self, bytes_audio: bytes, passagem: PassagemInterrupcao):
+        """Reconhece a frase da interrupção (roda no pool de transcrição)"""
+        audio_sr = sr.AudioData(bytes_audio, TAXA_AMOSTRAGEM, 2)
+        texto = None
+        
+        try:
+            texto = self.reconhecedor.recognize_google(audio_sr, language='pt-BR')
+            print(f"👤 Interrupção capturada: {texto}")
+        except sr.UnknownValueError:
+            print("❓ Não entendi a interrupção")
+        except Exception as e:
+            print(f"❌ Erro ao reconhecer interrupção: {e}")
         finally:
-            fluxo.stop_stream()
-            fluxo.close()
+            passagem.entregar(texto)
     
     def ouvir(self):
-        """Captura comando de voz (idêntico v4)"""
+        """
+        Captura comando de voz a partir do barramento (sem reabrir o microfone)
+        
+        O fim da frase é decidido pelo DetectorFimFala: o silêncio exigido
+        se adapta ao tamanho da frase em vez do pause_threshold fixo.
+        """
         print("\n🎧 Fale seu comando...")
         
-        mic = sr.Microphone()
-        with mic as source:
-            self.reconhecedor.adjust_for_ambient_noise(source, duration=0.3)
-            
-            try:
-                audio = self.reconhecedor.listen(source, timeout=15, phrase_time_limit=30)
-                texto = self.reconhecedor.recognize_google(audio, language='pt-BR')
-                print(f"👤 Você: {texto}")
-                return texto
+        duracao_quadro = TAMANHO_CHUNK / TAXA_AMOSTRAGEM
+        fim_fala = self._criar_detector_fim_fala()
+        self.vad_ouvir.reiniciar()
+        
+        # Guarda um pouco antes da confirmação do VAD (começo da primeira palavra)
+        antes_da_fala = deque(maxlen=int(MARGEM_PRE_ROLL / duracao_quadro) + 1)
+        frames = []
+        inicio_espera = time.monotonic()
+        
+        self.fila_ouvir.ativar()
+        try:
+            while self.executando:
+                quadro = self.fila_ouvir.ler(timeout=0.5)
                 
-            except sr.WaitTimeoutError:
-                return None
-            except sr.UnknownValueError:
-                print("❓ Não entendi...")
-                return None
-            except Exception as e:
-                print(f"❌ Erro: {e}")
-                return None
+                if quadro is not None:
+                    dados, _ = quadro
+                    dados_audio = np.frombuffer(dados, dtype=np.int16)
+                    tem_fala = self.vad_ouvir.processar(dados_audio, self.ruido.limiar_fala)
+                    
+                    if fim_fala.iniciou:
+                        frames.append(dados)
+                    else:
+                        antes_da_fala.append(dados)
+                    
+                    terminou = fim_fala.processar(tem_fala, duracao_quadro)
+                    if fim_fala.iniciou and not frames:
+                        frames.extend(antes_da_fala)
+                    if terminou:
+                        break
+                
+                if not fim_fala.iniciou and time.monotonic() - inicio_espera > ESPERA_INICIO_FALA:
+                    return None
+        finally:
+            self.fila_ouvir.desativar()
+        
+        if not frames:
+            return None
+        
+        try:
+            audio = sr.AudioData(b''.join(frames), TAXA_AMOSTRAGEM, 2)
+            texto = self.reconhecedor.recognize_google(audio, language='pt-BR')
+            print(f"👤 Você: {texto}")
+            return texto
+            
+        except sr.UnknownValueError:
+            print("❓ Não entendi...")
+            return None
+        except Exception as e:
+            print(f"❌ Erro: {e}")
+            return None
+    
+    def _registrar_comando(self, comando: str):
+        """Adiciona o comando do usuário ao histórico (RAM e BANCO)"""
+        self.historico.append({"role": "user", "content": comando})
+        self.memoria.adicionar_mensagem("user", comando)
+        self.contador_mensagens += 1
+    
+    def _registrar_resposta(self, texto: str):
+        """Adiciona a resposta do JARVIS ao histórico (RAM e BANCO)"""
+        self.historico.append({"role": "assistant", "content": texto})
+        self.memoria.adicionar_mensagem("assistant", texto)
+        self.contador_mensagens += 1
+        self.resumidor.agendar()
+    
+    def _completar_resumo(self, mensagens: list) -> str:
+        """Chamada ao modelo usada pelo resumidor (roda na thread dele)"""
+        resposta = self.cliente.chat.completions.create(model=CHAT_MODEL, messages=mensagens)
+        return resposta.choices[0].message.content
+    
+    def _disparar_ferramenta(self, chamada: ChamadaFerramenta):
+        """Começa a executar a chamada no orquestrador (não espera o resultado)"""
+        if chamada.execucao is None:
+            chamada.execucao = self.orquestrador.chamar_ferramenta_async(chamada.nome, chamada.argumentos)
+    
+    def _registrar_ferramentas(self, chamadas: list, texto: str = None):
+        """
+        Espera as chamadas terminarem e coloca chamadas e resultados no
+        histórico para a resposta final (apenas RAM, não salva no banco)
+        
+        Args:
+            chamadas: chamadas da resposta (já disparadas ou não)
+            texto: texto que o modelo escreveu junto com as chamadas
+        """
+        for chamada in chamadas:
+            chamada.finalizar()
+            self._disparar_ferramenta(chamada)
+        
+        self.historico.append({
+            "role": "assistant",
+            "content": texto or None,
+            "tool_calls": [chamada.como_tool_call() for chamada in chamadas]
+        })
+        
+        for chamada in chamadas:
+            # Termina no prazo da ferramenta, mesmo que ela trave
+            resposta = chamada.execucao.result()
+            if resposta.get("error"):
+                print(f"   ❌ Erro: {resposta['error']}")
+                resultado = (f"[ERRO]: {resposta['error']}. Informe o usuário que houve um problema "
+                             "e você não conseguiu executar a ação.")
+            else:
+                resultado = resposta.get("result")
+                print(f"   ✅ Resultado: {resultado}")
+            self.historico.append({
+                "role": "tool",
+                "tool_call_id": chamada.id,
+                "content": str(resultado)
+            })
+    
+    def _criar_resposta(self, usar_ferramentas: bool, **opcoes):
+        """Chama o modelo com as ferramentas (a segunda rodada só responde em texto)"""
+        self.contexto.ajustar(self.historico)
+        return self.cliente.chat.completions.create(
+            model=CHAT_MODEL,
+            messages=self.historico,
+            tools=self.ferramentas_openai,
+            tool_choice="auto" if usar_ferramentas else "none",
+            **opcoes
+        )
     
     def pensar(self, comando):
         """
@@ -331,62 +607,31 @@ IMPORTANTE:
         NOVO v5: Salva mensagens na memória persistente
         """
         print("🤖 Processando...")
-        
-        # Adiciona comando do usuário ao histórico (RAM e BANCO)
-        self.historico.append({"role": "user", "content": comando})
-        self.memoria.adicionar_mensagem("user", comando)
-        self.contador_mensagens += 1
+        self._registrar_comando(comando)
         
         try:
-            # Chama OpenAI
-            resposta = self.cliente.chat.completions.create(
-                model="gpt-5-mini",
-                messages=self.historico
-            )
+            mensagem = self._criar_resposta(usar_ferramentas=True).choices[0].message
+            texto_resposta = mensagem.content or ""
             
-            texto_resposta = resposta.choices[0].message.content
+            # Chamadas nativas (podem ser várias) ou, por compatibilidade, o JSON em texto
+            chamadas = []
+            for chamada_api in mensagem.tool_calls or []:
+                chamada = ChamadaFerramenta(chamada_api.id, chamada_api.function.name)
+                chamada.receber(None, None, chamada_api.function.arguments)
+                chamadas.append(chamada)
+            if not chamadas:
+                legado = reconhecer_chamada(texto_resposta)
+                if legado is not None:
+                    chamadas.append(ChamadaFerramenta.de_texto(legado, 0))
             
-            # Verifica se é uma chamada de ferramenta
-            if self._e_chamada_ferramenta(texto_resposta):
-                print("🛠️ Detectada chamada de ferramenta...")
-                resultado = self._executar_ferramenta(texto_resposta)
-                
-                # Adiciona a tentativa ao histórico (apenas RAM, não salva no banco)
-                self.historico.append({"role": "assistant", "content": texto_resposta})
+            if chamadas:
+                print(f"🛠️ {len(chamadas)} chamada(s) de ferramenta...")
+                self._registrar_ferramentas(chamadas, mensagem.content if mensagem.tool_calls else None)
                 
-                if resultado is not None:
-                    # Sucesso - adiciona resultado e pede resposta natural
-                    self.historico.append({
-                        "role": "user", 
-                        "content": f"[RESULTADO DA FERRAMENTA]: {resultado}\n\nAgora responda naturalmente ao usuário sobre isso."
-                    })
-                else:
-                    # Erro - informa o GPT
-                    self.historico.append({
-                        "role": "user",
-                        "content": "[ERRO]: A ferramenta falhou. Informe o usuário que houve um problema e você não conseguiu executar a ação."
-                    })
-                
-                # Nova chamada para resposta final
-                resposta2 = self.cliente.chat.completions.create(
-                    model="gpt-5-mini",
-                    messages=self.historico
-                )
-                
-                resposta_final = resposta2.choices[0].message.content
-                
-                # Salva resposta final (RAM e BANCO)
-                self.historico.append({"role": "assistant", "content": resposta_final})
-                self.memoria.adicionar_mensagem("assistant", resposta_final)
-                self.contador_mensagens += 1
-                
-                return resposta_final
-            
-            # Resposta normal (RAM e BANCO)
-            self.historico.append({"role": "assistant", "content": texto_resposta})
-            self.memoria.adicionar_mensagem("assistant", texto_resposta)
-            self.contador_mensagens += 1
+                # Uma única chamada para a resposta final
+                texto_resposta = self._criar_resposta(usar_ferramentas=False).choices[0].message.content
             
+            self._registrar_resposta(texto_resposta)
             return texto_resposta
             
         except Exception as e:
@@ -395,96 +640,226 @@ IMPORTANTE:
             self.memoria.adicionar_mensagem("assistant", resposta_erro)
             return resposta_erro
     
-    def _e_chamada_ferramenta(self, texto: str) -> bool:
-        """Detecta se a resposta é uma chamada de ferramenta (formato JSON)"""
-        texto = texto.strip()
-        # Aceita qualquer JSON que tenha "tool" e "arguments"
-        return ('{' in texto and 
-                '"tool"' in texto and 
-                '"arguments"' in texto)
+    def _resposta_em_fluxo(self, partes: list, usar_ferramentas: bool, cancelar: CancelamentoFala):
+        """
+        Uma rodada em fluxo: gera as frases faladas e devolve as chamadas
+        
+        - Texto: o ReconhecedorChamada decide nos primeiros tokens se é fala
+          (vai para o segmentador) ou o JSON antigo de ferramenta
+        - tool_calls: cada chamada é disparada assim que seus argumentos
+          fecham, enquanto o resto da resposta ainda chega
+        - Cancelado: o stream HTTP é fechado na hora (mesmo no meio de uma
+          leitura) e a rodada termina sem devolver chamadas
+        
+        Args:
+            partes: recebe o texto gerado pelo modelo
+            usar_ferramentas: False na resposta final (só texto)
+            cancelar: interrupção da fala atual
+        
+        Returns:
+            Lista de ChamadaFerramenta (vazia se a resposta foi só fala)
+        """
+        reconhecedor = ReconhecedorChamada()
+        segmentador = SegmentadorFrases()
+        chamadas = []
+        por_indice = {}
+        
+        fluxo = self._criar_resposta(usar_ferramentas, stream=True)
+        remover = cancelar.ao_cancelar(fluxo.close)
+        try:
+            for pedaco in fluxo:
+                if cancelar.is_set():
+                    break
+                if not pedaco.choices:
+                    continue
+                delta = pedaco.choices[0].delta
+                
+                for parcial in delta.tool_calls or []:
+                    chamada = por_indice.get(parcial.index)
+                    if chamada is None:
+                        chamada = por_indice[parcial.index] = ChamadaFerramenta()
+                        chamadas.append(chamada)
+                    funcao = parcial.function
+                    chamada.receber(parcial.id, funcao and funcao.name, funcao and funcao.arguments)
+                    if chamada.pronta:
+                        self._disparar_ferramenta(chamada)
+                
+                if not delta.content:
+                    continue
+                if reconhecedor.tipo == ReconhecedorChamada.FALA:
+                    partes.append(delta.content)
+                    yield from segmentador.adicionar(delta.content)
+                    continue
+                
+                legado = reconhecedor.adicionar(delta.content)
+                if legado is not None and usar_ferramentas:
+                    chamada = ChamadaFerramenta.de_texto(legado, len(chamadas))
+                    chamadas.append(chamada)
+                    self._disparar_ferramenta(chamada)
+                if reconhecedor.tipo == ReconhecedorChamada.FALA:
+                    partes.append(reconhecedor.texto)
+                    yield from segmentador.adicionar(reconhecedor.texto)
+        finally:
+            remover()
+            fluxo.close()
+        
+        if cancelar.is_set():
+            return []
+        if reconhecedor.tipo == ReconhecedorChamada.FALA:
+            yield from segmentador.finalizar()
+        elif reconhecedor.texto and not (usar_ferramentas and reconhecedor.finalizar()):
+            # JSON que não virou chamada: fala como texto
+            partes.append(reconhecedor.texto)
+            yield from dividir_frases(reconhecedor.texto)
+        return chamadas
     
-    def _executar_ferramenta(self, texto_json: str) -> any:
-        """Executa ferramenta via Orquestrador"""
+    def pensar_em_fluxo(self, cancelar: CancelamentoFala):
+        """
+        Como pensar(), mas devolve as frases conforme o modelo as escreve
+        
+        Gerador de frases para o falar(): a primeira frase toca enquanto
+        o resto da resposta ainda está sendo gerado. As ferramentas pedidas
+        rodam em paralelo e a resposta final vem numa única chamada extra.
+        
+        Roda na thread produtora da fala, então não grava nada no banco:
+        quem chama registra o comando antes e, depois do falar(), só as
+        frases que chegaram a tocar.
+        
+        Args:
+            cancelar: interrupção da fala que consome estas frases
+        """
+        print("🤖 Processando...")
+        
+        partes = []
         try:
-            # Extrai o JSON da resposta (caso tenha texto antes/depois)
-            inicio = texto_json.find('{')
-            fim = texto_json.rfind('}') + 1
-            
-            if inicio == -1 or fim == 0:
-                print("   ❌ JSON não encontrado na resposta")
-                return None
-            
-            json_extraido = texto_json[inicio:fim]
-            chamada = json.loads(json_extraido)
-            
-            nome_ferramenta = chamada.get("tool")
-            argumentos = chamada.get("arguments", {})
-            
-            print(f"   🔧 Chamando: {nome_ferramenta}")
-            print(f"   📋 Args: {argumentos}")
-            
-            # Chama via Orquestrador
-            resultado = self.orquestrador.chamar_ferramenta(nome_ferramenta, argumentos)
-            
-            print(f"   ✅ Resultado: {resultado}")
-            return resultado
-            
+            chamadas = yield from self._resposta_em_fluxo(partes, True, cancelar)
+            if chamadas and not cancelar.is_set():
+                print(f"🛠️ {len(chamadas)} chamada(s) de ferramenta...")
+                self._registrar_ferramentas(chamadas, "".join(partes))
+                partes.clear()
+                if not cancelar.is_set():
+                    yield from self._resposta_em_fluxo(partes, False, cancelar)
         except Exception as e:
-            print(f"   ❌ Erro: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+            if cancelar.is_set():
+                return  # Stream fechado pela interrupção
+            print(f"❌ Erro OpenAI: {e}")
+            yield "Desculpe, tive um problema técnico."
     
-    def falar(self, texto):
-        """Fala usando OpenAI TTS (idêntico v4)"""
-        print(f"🔊 JARVIS: {texto}\n")
+    def falar(self, texto, interromper: CancelamentoFala = None, faladas: list = None):
+        """
+        Fala usando OpenAI TTS, frase por frase
+        
+        A primeira frase começa a tocar enquanto as seguintes ainda estão
+        sendo sintetizadas - o tempo até o primeiro som não depende do
+        tamanho da resposta. Só volta quando nada desta fala está mais
+        rodando (nem o gerador de frases).
+        
+        Args:
+            texto: texto completo, ou gerador de frases (ex.: pensar_em_fluxo)
+            interromper: interrupção desta fala (o gerador deve usar a mesma)
+            faladas: recebe as frases que chegaram a tocar
+        """
+        if isinstance(texto, str):
+            print(f"🔊 JARVIS: {texto}\n")
+            frases = dividir_frases(texto)
+        else:
+            frases = self._mostrar_frases(texto)
         
+        # Uma interrupção nova por fala: a de uma fala antiga continua
+        # valendo para quem ainda a estiver olhando
+        self.interromper = interromper or CancelamentoFala()
         self.falando = True
-        self.interromper.clear()
-        self.comando_interrompido = None
         
-        with self.trava_audio:
-            self.buffer_audio = []
+        # Descarta interrupções antigas que ninguém usou
+        while not self.fila_interrupcoes.empty():
+            self.fila_interrupcoes.get_nowait()
         
-        arquivo_audio = os.path.join(tempfile.gettempdir(), "jarvis_fala.mp3")
+        self.buffer_audio.limpar()
+        self.cancelador.iniciar()
         
         try:
-            # Streaming recomendado pela OpenAI
-            with self.cliente.audio.speech.with_streaming_response.create(
-                model=TTS_MODEL,
-                voice=TTS_VOICE,
-                input=texto,
-                instructions="Speak in a cheerful and positive tone.",
-            ) as response:
-                response.stream_to_file(arquivo_audio)
-            
-            pygame.mixer.music.load(arquivo_audio)
-            pygame.mixer.music.play()
-            
-            while pygame.mixer.music.get_busy():
-                if self.interromper.is_set():
-                    pygame.mixer.music.stop()
-                    print("🛑 Fala interrompida!")
-                    break
-                time.sleep(0.05)
-            
+            if self.falador.falar(frases, self.interromper, faladas):
+                print("🛑 Fala interrompida!")
+            else:
+                self.saida.drenar()
         except Exception as e:
             print(f"❌ Erro na fala: {e}")
-        
         finally:
+            self.cancelador.parar()
             self.falando = False
-            try:
-                if os.path.exists(arquivo_audio):
-                    pygame.mixer.music.unload()
-                    os.remove(arquivo_audio)
-            except:
-                pass
-        
-        if self.interromper.is_set():
-            time.sleep(1.0)
         
         return self.interromper.is_set()
     
+    def _cronometrar_primeira_frase(self, frases, inicio: float):
+        """Registra no roteador quanto o modelo levou até a primeira frase"""
+        try:
+            for numero, frase in enumerate(frases):
+                if numero == 0:
+                    self.roteador.registrar_tempo_modelo(time.monotonic() - inicio)
+                yield frase
+        finally:
+            frases.close()
+    
+    def _mostrar_frases(self, frases):
+        """Mostra cada frase de um gerador conforme ela chega"""
+        try:
+            for frase in frases:
+                print(f"🔊 JARVIS: {frase}")
+                yield frase
+        finally:
+            frases.close()
+    
+    def _baixar_fala(self, frase: str):
+        """Blocos PCM da frase conforme chegam da API de TTS"""
+        with self.cliente.audio.speech.with_streaming_response.create(
+            model=TTS_MODEL,
+            voice=TTS_VOICE,
+            input=frase,
+            instructions=TTS_INSTRUCTIONS,
+            response_format="pcm",
+        ) as response:
+            yield from response.iter_bytes()
+    
+    def _sintetizar(self, frase: str, destino: AudioEmFluxo):
+        """
+        Gera o áudio de uma frase em PCM cru (roda no pool do FaladorPipeline)
+        
+        Frases do cache saem direto, sem rede. As outras são repassadas
+        conforme chegam - a reprodução começa antes da síntese terminar -
+        e guardadas no cache quando chegam inteiras.
+        """
+        audio = self.cache_fala.obter(frase)
+        if audio is not None:
+            destino.escrever(audio)
+            return
+        
+        blocos = []
+        for bloco in self._baixar_fala(frase):
+            if destino.cancelado:
+                return
+            destino.escrever(bloco)
+            blocos.append(bloco)
+        self.cache_fala.guardar(frase, b"".join(blocos))
+    
+    def _aquecer_cache_fala(self):
+        """Pré-sintetiza o banco de frases em segundo plano"""
+        saudacao = self.memoria.obter_saudacao_contextual(self.nome_usuario)
+        nome = self.nome_usuario or "amigo"
+        frases = []
+        for modelo in FRASES_AQUECIMENTO:
+            # Mesmo corte do falar(): a chave do cache é a frase sintetizada
+            frases.extend(dividir_frases(modelo.format(saudacao=saudacao, nome=nome)))
+        self.cache_fala.aquecer(frases, lambda frase: b"".join(self._baixar_fala(frase)))
+    
+    def _reproduzir(self, audio: AudioEmFluxo) -> bool:
+        """Toca uma frase direto na saída de áudio (True se foi interrompido)"""
+        return self.saida.tocar(audio, self.interromper)
+    
+    def _referencia_eco(self, pedaco: bytes, instante: float):
+        """Cada pedaço entregue ao alto-falante vira referência do cancelador de eco"""
+        amostras = reamostrar(np.frombuffer(pedaco, dtype=np.int16), TAXA_TTS, TAXA_AMOSTRAGEM)
+        self.cancelador.adicionar_referencia(amostras, instante)
+    
     def executar(self):
         """Loop principal - NOVO v5: com personalização e comandos de memória"""
         print("=" * 50)
@@ -496,10 +871,12 @@ IMPORTANTE:
         print("✨ Diga 'sair' para encerrar")
         print("=" * 50)
         
-        # Inicia monitor de áudio
+        self._aquecer_cache_fala()
+        
+        # Abre o microfone UMA vez - monitor e ouvir() leem do mesmo barramento
+        self.captura.iniciar()
         monitor = threading.Thread(target=self.monitorar_audio, daemon=True)
         monitor.start()
-        time.sleep(1)
         
         # NOVO v5: PRIMEIRA VEZ - Pergunta o nome
         if not self.nome_usuario:
@@ -512,11 +889,17 @@ IMPORTANTE:
         # Loop principal
         while self.executando:
             # Verifica comando de interrupção
-            if self.comando_interrompido:
-                comando = self.comando_interrompido
-                self.comando_interrompido = None
-                print(f"🔄 Usando comando da interrupção: {comando}")
-            else:
+            comando = None
+            try:
+                passagem = self.fila_interrupcoes.get_nowait()
+                print("⏳ Aguardando a frase da interrupção...")
+                comando = passagem.aguardar(ESPERA_MAXIMA_INTERRUPCAO)
+                if comando:
+                    print(f"🔄 Usando comando da interrupção: {comando}")
+            except queue.Empty:
+                pass
+            
+            if not comando:
                 comando = self.ouvir()
             
             if not comando:
@@ -550,9 +933,29 @@ IMPORTANTE:
                 self.falar(f"Histórico exportado para {arquivo}!")
                 continue
             
+            # Pedidos simples (hora, data, clima, arquivos): responde sem o modelo
+            resposta = self.roteador.rotear(comando)
+            if resposta is not None:
+                print("⚡ Respondido pelo atalho local")
+                self._registrar_comando(comando)
+                self._registrar_resposta(resposta)
+                self.falar(resposta)
+                continue
+            
             # Processa comando normalmente (pode usar ferramentas)
-            resposta = self.pensar(comando)
-            self.falar(resposta)
+            inicio = time.monotonic()
+            if RESPOSTA_EM_FLUXO:
+                self._registrar_comando(comando)
+                cancelar, faladas = CancelamentoFala(), []
+                frases = self._cronometrar_primeira_frase(self.pensar_em_fluxo(cancelar), inicio)
+                self.falar(frases, cancelar, faladas)
+                # Guarda só o que o usuário ouviu (tudo, se não interrompeu)
+                if faladas:
+                    self._registrar_resposta(" ".join(faladas))
+            else:
+                resposta = self.pensar(comando)
+                self.roteador.registrar_tempo_modelo(time.monotonic() - inicio)
+                self.falar(resposta)
         
         # NOVO v5: Cleanup e estatísticas
         print("\n" + "=" * 50)
@@ -564,12 +967,45 @@ IMPORTANTE:
         print(f"💾 Total no histórico: {resumo['total_mensagens']} mensagens")
         print(f"📅 Primeira mensagem: {resumo.get('primeira_mensagem', 'N/A')}")
         
+        captura = self.captura.estatisticas()
+        print(f"🎙️ Quadros capturados: {captura['quadros_capturados']} | "
+              f"descartados: {captura['quadros_descartados']} | "
+              f"overflows: {captura['overflows_entrada']} | "
+              f"underruns: {captura['underruns_consumidor']}")
+        
+        latencias = self.saida.latencias_parada
+        if latencias:
+            print(f"⏹️ Parada na interrupção: média {1000 * sum(latencias) / len(latencias):.0f} ms | "
+                  f"máx {1000 * max(latencias):.0f} ms ({len(latencias)} interrupções)")
+        
+        roteador = self.roteador.estatisticas()
+        economia = roteador["tempo_economizado"]
+        print(f"⚡ Atalho local: {roteador['acertos']}/{roteador['consultas']} pedidos "
+              f"({100 * roteador['taxa_acerto']:.0f}%) | "
+              f"tempo economizado: {'N/A' if economia is None else f'{economia:.1f}s'}")
+        
+        contexto = self.contexto.estatisticas()
+        print(f"🧠 Contexto: {contexto['tokens']}/{contexto['orcamento']} tokens | "
+              f"{contexto['mensagens_removidas']} mensagens antigas fora do contexto | "
+              f"{contexto['resultados_compactados']} resultados encurtados")
+        
+        cache = self.cache_fala.estatisticas()
+        print(f"🗣️ Cache de fala: {cache['acertos_memoria'] + cache['acertos_disco']} acertos | "
+              f"{cache['faltas']} sínteses | {cache['bytes_disco'] // 1024} KB em disco")
+        
+        cache = self.orquestrador.estatisticas_cache()
+        print(f"🧰 Cache de ferramentas: {cache['acertos']} acertos | {cache['faltas']} faltas "
+              f"({100 * cache['taxa_acerto']:.0f}%) | {cache['entradas']}/{cache['capacidade']} entradas")
+        
         self.memoria.finalizar_sessao(self.sessao_id, self.contador_mensagens)
         self.memoria.fechar()
         
         self.orquestrador.fechar()
+        self.executor_transcricao.shutdown(wait=False)
+        self.falador.fechar()
+        self.captura.parar()
+        self.saida.fechar()
         self.pyaudio.terminate()
-        pygame.mixer.quit()
         
         print("\n👋 JARVIS encerrado!")
 
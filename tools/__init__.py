@@ -1,12 +1,20 @@
 """
 Pacote de ferramentas MCP para JARVIS
 Cada ferramenta é um módulo separado para facilitar manutenção
+
+As classes são importadas só quando usadas (`from tools import
+FerramentaClima` continua funcionando), assim importar qualquer módulo
+do pacote não carrega requests/perplexity junto
 """
 
-from .hora import FerramentaHora
-from .clima import FerramentaClima
-from .buscar_web import FerramentaBuscarWeb
-from .sistema_arquivos import FerramentaSistemaArquivos
+import importlib
+
+_MODULOS = {
+    'FerramentaHora': '.hora',
+    'FerramentaClima': '.clima',
+    'FerramentaBuscarWeb': '.buscar_web',
+    'FerramentaSistemaArquivos': '.sistema_arquivos',
+}
 
 __all__ = [
     'FerramentaHora',
@@ -14,3 +22,9 @@ __all__ = [
     'FerramentaBuscarWeb',
     'FerramentaSistemaArquivos'
 ]
+
+
+def __getattr__(nome):
+    if nome in _MODULOS:
+        return getattr(importlib.import_module(_MODULOS[nome], __name__), nome)
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
@@ -0,0 +1,97 @@
+"""
+Benchmark de Inicialização do JARVIS
+Mede, em interpretadores novos, quanto custa subir o orquestrador (e o
+main_v4) com as ferramentas carregadas sob demanda e com todas
+importadas de início (como era antes do registro preguiçoso).
+O orquestrador é medido com a configuração do main_v4 e, à parte, com
+o pool de processos ligado (até a primeira resposta)
+
+Uso: python -m tools.benchmark_importacao [repeticoes]
+"""
+
+import ast
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+RAIZ = Path(__file__).parent.parent
+
+# Importar todas as ferramentas de início = comportamento antigo do tools/__init__.py
+IMPORTAR_TODAS = "import tools.hora, tools.clima, tools.buscar_web, tools.sistema_arquivos"
+
+MAIN = "import main_v4"
+
+
+def configuracao_main() -> dict:
+    """Constantes do orquestrador no main_v4.py (lidas sem importar o main_v4)"""
+    arvore = ast.parse((RAIZ / "main_v4.py").read_text(encoding="utf-8"))
+    nomes = {"FERRAMENTAS_PARALELO": "max_paralelo", "PROCESSOS_FERRAMENTAS": "processos"}
+    configuracao = {}
+    for no in arvore.body:
+        if isinstance(no, ast.Assign) and len(no.targets) == 1:
+            alvo = no.targets[0]
+            if isinstance(alvo, ast.Name) and alvo.id in nomes:
+                configuracao[nomes[alvo.id]] = ast.literal_eval(no.value)
+    return configuracao
+
+
+def orquestrador(max_paralelo: int = 8, processos: int = 0, chamar: bool = False) -> str:
+    """Código que sobe o orquestrador (e faz uma chamada, se pedido) e o fecha"""
+    chamada = "o.chamar_ferramenta('obter_hora', {}); " if chamar else ""
+    return ("from tools.orquestrador_tools import OrquestradorDeTools; "
+            f"o = OrquestradorDeTools(max_paralelo={max_paralelo}, processos={processos}); "
+            f"{chamada}o.fechar()")
+
+
+def medir(codigo: str, repeticoes: int = 5) -> Optional[float]:
+    """
+    Mediana (s) do tempo para executar `codigo` num Python recém-iniciado
+
+    Returns:
+        None se o código falhar (ex.: dependência não instalada)
+    """
+    script = (
+        "import time, sys\n"
+        "inicio = time.perf_counter()\n"
+        f"{codigo}\n"
+        "print(time.perf_counter() - inicio, file=sys.__stdout__)\n"
+    )
+    tempos = []
+    for _ in range(repeticoes):
+        processo = subprocess.run([sys.executable, "-c", script], cwd=RAIZ,
+                                  capture_output=True, text=True)
+        if processo.returncode != 0:
+            erro = processo.stderr.strip().splitlines()
+            print(f"   ⚠️ Falhou: {erro[-1] if erro else processo.returncode}")
+            return None
+        tempos.append(float(processo.stdout.strip().splitlines()[-1]))
+    return statistics.median(tempos)
+
+
+def comparar(rotulo: str, codigo: str, repeticoes: int) -> None:
+    print(f"\n⏱️ {rotulo}")
+    preguicoso = medir(codigo, repeticoes)
+    antecipado = medir(f"{IMPORTAR_TODAS}\n{codigo}", repeticoes)
+    if preguicoso is not None:
+        print(f"   Sob demanda:         {1000 * preguicoso:7.1f} ms")
+    if antecipado is not None:
+        print(f"   Tudo de início:      {1000 * antecipado:7.1f} ms")
+    if preguicoso is not None and antecipado is not None:
+        print(f"   Economia:            {1000 * (antecipado - preguicoso):7.1f} ms "
+              f"({100 * (1 - preguicoso / antecipado):.0f}%)")
+
+
+if __name__ == "__main__":
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"🧪 Benchmark de inicialização (mediana de {repeticoes} processos)")
+
+    configuracao = configuracao_main()
+    comparar(f"Orquestrador de Tools (como no main_v4: {configuracao})",
+             orquestrador(**configuracao), repeticoes)
+    comparar("Orquestrador com 2 processos, até a primeira resposta",
+             orquestrador(processos=2, chamar=True), repeticoes)
+    comparar("main_v4 (import completo)", MAIN, repeticoes)
+
+    print("\n✅ Benchmark concluído!")
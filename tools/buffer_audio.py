@@ -0,0 +1,126 @@
+"""
+Buffer Circular de Áudio do JARVIS
+Guarda os últimos segundos capturados pelo microfone (pre-roll da interrupção)
+sem alocar memória nova a cada quadro
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+class BufferCircularAudio:
+    """
+    Buffer circular pré-alocado de amostras int16
+
+    - Capacidade fixa (definida em amostras na criação)
+    - Escrita em O(1) por quadro, sem pop(0) nem cópias de lista
+    - Leitura por visões (sem cópia) ou cópia contígua quando necessário
+
+    Pensado para um único escritor (a thread do monitor de áudio).
+    Outras threads só pedem a limpeza, que é aplicada pelo escritor
+    na próxima escrita - por isso não precisa de trava.
+    """
+
+    def __init__(self, capacidade: int):
+        """
+        Inicializa o buffer
+
+        Args:
+            capacidade: número máximo de amostras guardadas
+        """
+        self.capacidade = capacidade
+        self._dados = np.zeros(capacidade, dtype=np.int16)
+        self._posicao = 0        # Próxima posição de escrita
+        self._tamanho = 0        # Amostras válidas no buffer
+        self._pedido_limpeza = False
+
+    def escrever(self, quadro) -> None:
+        """
+        Adiciona um quadro ao buffer, descartando as amostras mais antigas
+
+        Args:
+            quadro: bytes PCM 16 bits ou array int16
+        """
+        if self._pedido_limpeza:
+            self._aplicar_limpeza()
+
+        amostras = np.frombuffer(quadro, dtype=np.int16) if isinstance(quadro, (bytes, bytearray)) else quadro
+        n = len(amostras)
+
+        if n >= self.capacidade:
+            # Quadro maior que o buffer: fica só com o final
+            self._dados[:] = amostras[-self.capacidade:]
+            self._posicao = 0
+            self._tamanho = self.capacidade
+            return
+
+        fim = self._posicao + n
+        if fim <= self.capacidade:
+            self._dados[self._posicao:fim] = amostras
+        else:
+            primeira_parte = self.capacidade - self._posicao
+            self._dados[self._posicao:] = amostras[:primeira_parte]
+            self._dados[:n - primeira_parte] = amostras[primeira_parte:]
+
+        self._posicao = fim % self.capacidade
+        self._tamanho = min(self._tamanho + n, self.capacidade)
+
+    def visoes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna o conteúdo em ordem cronológica como duas visões (sem cópia)
+
+        Returns:
+            (parte_antiga, parte_recente) - concatenadas formam o buffer
+        """
+        if self._pedido_limpeza:
+            vazio = self._dados[:0]
+            return vazio, vazio
+
+        inicio = (self._posicao - self._tamanho) % self.capacidade
+        if inicio + self._tamanho <= self.capacidade:
+            return self._dados[inicio:inicio + self._tamanho], self._dados[:0]
+        return self._dados[inicio:], self._dados[:self._posicao]
+
+    def copiar(self) -> np.ndarray:
+        """Retorna uma cópia contígua do conteúdo (mais antiga primeiro)"""
+        antiga, recente = self.visoes()
+        if not len(recente):
+            return antiga.copy()
+        return np.concatenate((antiga, recente))
+
+    def limpar(self) -> None:
+        """Pede a limpeza do buffer (aplicada pelo escritor na próxima escrita)"""
+        self._pedido_limpeza = True
+
+    def _aplicar_limpeza(self) -> None:
+        """Zera os índices - a memória pré-alocada é reaproveitada"""
+        self._posicao = 0
+        self._tamanho = 0
+        self._pedido_limpeza = False
+
+    def __len__(self) -> int:
+        """Número de amostras válidas"""
+        return 0 if self._pedido_limpeza else self._tamanho
+
+
+# Teste rápido
+if __name__ == "__main__":
+    print("🧪 Testando buffer circular...")
+
+    buffer = BufferCircularAudio(capacidade=10)
+
+    buffer.escrever(np.arange(4, dtype=np.int16))
+    buffer.escrever(np.arange(4, 8, dtype=np.int16))
+    buffer.escrever(np.arange(8, 14, dtype=np.int16))
+    print(f"Conteúdo: {buffer.copiar().tolist()}")
+    assert buffer.copiar().tolist() == list(range(4, 14))
+
+    antiga, recente = buffer.visoes()
+    print(f"Visões: {antiga.tolist()} + {recente.tolist()}")
+
+    buffer.limpar()
+    assert len(buffer) == 0
+    buffer.escrever(np.array([1, 2], dtype=np.int16).tobytes())
+    assert buffer.copiar().tolist() == [1, 2]
+
+    print("✅ Teste concluído!")
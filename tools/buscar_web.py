@@ -33,6 +33,16 @@ class FerramentaBuscarWeb:
             }
         }
     
+    @staticmethod
+    def prazo() -> float:
+        """Segundos máximos de execução (a busca na Perplexity é lenta)"""
+        return 25
+    
+    @staticmethod
+    def ttl_cache(resultado: str) -> float:
+        """Segundos que o resultado pode ser reaproveitado (só buscas com resultado)"""
+        return 3 * 3600 if resultado.startswith("🌐") else 0
+    
     @staticmethod
     def executar(consulta: str) -> str:
         """
@@ -0,0 +1,231 @@
+"""
+Cache de Fala do JARVIS
+Guarda o áudio (PCM) de frases já sintetizadas para tocar de novo sem
+chamar a API de TTS - saudações, despedidas e avisos que se repetem
+"""
+
+import hashlib
+import json
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+
+def normalizar_frase(frase: str) -> str:
+    """Forma canônica da frase (Unicode NFC e espaços colapsados)"""
+    return " ".join(unicodedata.normalize("NFC", frase).split())
+
+
+class CacheFala:
+    """
+    Cache de áudio endereçado pelo conteúdo
+
+    - Chave: SHA-256 de (frase normalizada, modelo, voz, instruções) -
+      trocar a voz ou o modelo nunca toca um áudio antigo
+    - Disco: um arquivo .pcm por frase; acima de `limite_disco` bytes
+      os menos usados (mtime mais antigo) são apagados
+    - Memória: as frases mais recentes ficam numa camada quente (LRU)
+    - `aquecer()` sintetiza um banco de frases em segundo plano
+    """
+
+    def __init__(self, pasta: str = "cache_fala", modelo: str = "", voz: str = "",
+                 instrucoes: str = "", limite_disco: int = 50 * 1024 * 1024,
+                 limite_memoria: int = 8 * 1024 * 1024):
+        """
+        Args:
+            pasta: diretório dos arquivos de áudio
+            modelo: modelo de TTS (entra na chave)
+            voz: voz do TTS (entra na chave)
+            instrucoes: instruções de estilo do TTS (entram na chave)
+            limite_disco: bytes máximos no disco
+            limite_memoria: bytes máximos na camada quente
+        """
+        self.pasta = Path(pasta)
+        self.pasta.mkdir(parents=True, exist_ok=True)
+        self._identidade = [modelo, voz, instrucoes]
+        self.limite_disco = limite_disco
+        self.limite_memoria = limite_memoria
+
+        self._lock = threading.Lock()
+        self._memoria = OrderedDict()  # chave -> bytes
+        self._bytes_memoria = 0
+        self._bytes_disco = sum(arquivo.stat().st_size for arquivo in self.pasta.glob("*.pcm"))
+
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+
+    def chave(self, frase: str) -> str:
+        """Chave da frase com a identidade do TTS atual"""
+        conteudo = json.dumps([normalizar_frase(frase)] + self._identidade, ensure_ascii=False)
+        return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
+
+    def _caminho(self, chave: str) -> Path:
+        return self.pasta / f"{chave}.pcm"
+
+    def _lembrar(self, chave: str, audio: bytes) -> None:
+        """Coloca na camada quente (chamar com o lock)"""
+        if len(audio) > self.limite_memoria:
+            return
+        antigo = self._memoria.pop(chave, None)
+        if antigo is not None:
+            self._bytes_memoria -= len(antigo)
+        self._memoria[chave] = audio
+        self._bytes_memoria += len(audio)
+
+        while self._bytes_memoria > self.limite_memoria:
+            _, removido = self._memoria.popitem(last=False)
+            self._bytes_memoria -= len(removido)
+
+    def obter(self, frase: str) -> Optional[bytes]:
+        """
+        Busca o áudio de uma frase
+
+        Returns:
+            PCM da frase, ou None se não está no cache
+        """
+        chave = self.chave(frase)
+
+        with self._lock:
+            audio = self._memoria.get(chave)
+            if audio is not None:
+                self._memoria.move_to_end(chave)
+                self.acertos_memoria += 1
+                return audio
+
+        caminho = self._caminho(chave)
+        try:
+            audio = caminho.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self.faltas += 1
+            return None
+        try:
+            os.utime(caminho)  # Marca como usado agora (ordem do LRU no disco)
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            self.acertos_disco += 1
+            self._lembrar(chave, audio)
+        return audio
+
+    def guardar(self, frase: str, audio: bytes) -> None:
+        """Guarda o áudio completo de uma frase"""
+        if not audio:
+            return
+        chave = self.chave(frase)
+        caminho = self._caminho(chave)
+
+        # Escreve num temporário e troca: leitores nunca veem arquivo pela metade
+        temporario = caminho.with_name(f"{caminho.name}.{threading.get_ident()}.tmp")
+        temporario.write_bytes(audio)
+        tamanho_antigo = caminho.stat().st_size if caminho.exists() else 0
+        os.replace(temporario, caminho)
+
+        with self._lock:
+            self._bytes_disco += len(audio) - tamanho_antigo
+            self._lembrar(chave, audio)
+            if self._bytes_disco > self.limite_disco:
+                self._despejar_disco()
+
+    def _despejar_disco(self) -> None:
+        """Apaga os arquivos menos usados até caber no limite (chamar com o lock)"""
+        arquivos = []
+        for arquivo in self.pasta.glob("*.pcm"):
+            try:
+                info = arquivo.stat()
+            except FileNotFoundError:
+                continue
+            arquivos.append((info.st_mtime, info.st_size, arquivo))
+        arquivos.sort()
+
+        self._bytes_disco = sum(tamanho for _, tamanho, _ in arquivos)
+        for _, tamanho, arquivo in arquivos:
+            if self._bytes_disco <= self.limite_disco:
+                break
+            try:
+                arquivo.unlink()
+            except FileNotFoundError:
+                pass
+            self._bytes_disco -= tamanho
+            removido = self._memoria.pop(arquivo.stem, None)
+            if removido is not None:
+                self._bytes_memoria -= len(removido)
+
+    def aquecer(self, frases: Iterable[str], sintetizar: Callable[[str], bytes]) -> threading.Thread:
+        """
+        Sintetiza em segundo plano as frases que ainda não estão no cache
+
+        Args:
+            frases: banco de frases
+            sintetizar: função frase -> PCM completo
+
+        Returns:
+            A thread de aquecimento (daemon, já iniciada)
+        """
+        def aquecer():
+            novas = 0
+            for frase in frases:
+                if self._caminho(self.chave(frase)).exists():
+                    continue
+                try:
+                    self.guardar(frase, sintetizar(frase))
+                    novas += 1
+                except Exception as e:
+                    print(f"⚠️ Cache de fala: erro ao aquecer '{frase[:30]}': {e}")
+            if novas:
+                print(f"🔥 Cache de fala: {novas} frases pré-sintetizadas")
+
+        thread = threading.Thread(target=aquecer, daemon=True, name="aquecer-fala")
+        thread.start()
+        return thread
+
+    def estatisticas(self) -> dict:
+        """Acertos, faltas e ocupação do cache"""
+        with self._lock:
+            return {
+                "acertos_memoria": self.acertos_memoria,
+                "acertos_disco": self.acertos_disco,
+                "faltas": self.faltas,
+                "bytes_memoria": self._bytes_memoria,
+                "bytes_disco": self._bytes_disco,
+            }
+
+
+# Teste rápido
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    print("🧪 Testando cache de fala...")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        cache = CacheFala(pasta, "modelo", "voz", limite_disco=2500, limite_memoria=1500)
+
+        assert cache.obter("Olá!") is None
+        cache.guardar("Olá!", b"\x01" * 1000)
+        assert cache.obter("  Olá!  ") == b"\x01" * 1000  # Normalizado
+        assert CacheFala(pasta, "modelo", "outra voz").obter("Olá!") is None
+
+        # LRU no disco: "Olá!" foi usado depois de "Tchau!", então "Tchau!" sai primeiro
+        cache.guardar("Tchau!", b"\x02" * 1000)
+        time.sleep(0.01)
+        cache.obter("Olá!")
+        time.sleep(0.01)
+        cache.guardar("Até logo!", b"\x03" * 1000)
+        assert cache.obter("Tchau!") is None
+        assert cache.obter("Olá!") is not None
+
+        # Aquecimento: só sintetiza o que falta
+        sintetizadas = []
+        cache.aquecer(["Olá!", "Bom dia!"], lambda f: sintetizadas.append(f) or b"\x04" * 10).join()
+        assert sintetizadas == ["Bom dia!"]
+
+        print(f"Estatísticas: {cache.estatisticas()}")
+        assert cache.estatisticas()["bytes_disco"] <= 2500
+
+    print("✅ Teste concluído!")
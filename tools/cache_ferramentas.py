@@ -0,0 +1,188 @@
+"""
+Cache de Resultados de Ferramentas do JARVIS
+Guarda resultados por (ferramenta, argumentos) durante o tempo de vida
+que cada ferramenta declara - clima por minutos, buscas por horas
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def _canonizar(valor: Any) -> Any:
+    """Strings sem espaços sobrando; o resto como está (chaves ordenadas no dumps)"""
+    if isinstance(valor, str):
+        return " ".join(valor.split())
+    if isinstance(valor, dict):
+        return {chave: _canonizar(item) for chave, item in valor.items()}
+    if isinstance(valor, list):
+        return [_canonizar(item) for item in valor]
+    return valor
+
+
+def chave_cache(nome: str, argumentos: Dict[str, Any]) -> str:
+    """Chave canônica: nome + argumentos com chaves ordenadas"""
+    return nome + ":" + json.dumps(_canonizar(argumentos or {}), sort_keys=True,
+                                   ensure_ascii=False, separators=(",", ":"))
+
+
+class CacheResultados:
+    """
+    Cache LRU com tempo de vida por entrada
+
+    - Tamanho limitado: acima de `capacidade` sai a menos usada
+    - Entradas vencidas contam como falta e são apagadas ao serem lidas
+    - Com `caminho_db`, as entradas também vão para o SQLite e
+      sobrevivem a reinícios (o tempo de vida usa o relógio de parede)
+    - Seguro para chamadas de várias threads
+    """
+
+    def __init__(self, capacidade: int = 256, caminho_db: Optional[str] = None):
+        """
+        Args:
+            capacidade: número máximo de resultados guardados
+            caminho_db: arquivo SQLite para persistir (None = só memória)
+        """
+        self.capacidade = capacidade
+        self._lock = threading.Lock()
+        self._entradas = OrderedDict()  # chave -> (expira_em, resultado)
+        self.acertos = {}
+        self.faltas = {}
+
+        self._conn = None
+        if caminho_db:
+            self._conn = sqlite3.connect(caminho_db, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_ferramentas (
+                    chave TEXT PRIMARY KEY,
+                    resultado TEXT NOT NULL,
+                    expira_em REAL NOT NULL
+                )
+            """)
+            self._conn.execute("DELETE FROM cache_ferramentas WHERE expira_em <= ?", (time.time(),))
+            linhas = self._conn.execute("""
+                SELECT chave, resultado, expira_em FROM cache_ferramentas
+                ORDER BY expira_em DESC
+                LIMIT ?
+            """, (capacidade,)).fetchall()
+            for chave, resultado, expira_em in reversed(linhas):
+                self._entradas[chave] = (expira_em, json.loads(resultado))
+            self._conn.commit()
+
+    def _contar(self, contador: Dict[str, int], nome: str) -> None:
+        contador[nome] = contador.get(nome, 0) + 1
+
+    def _apagar_persistido(self, chave: str) -> None:
+        if self._conn is not None:
+            self._conn.execute("DELETE FROM cache_ferramentas WHERE chave = ?", (chave,))
+            self._conn.commit()
+
+    def obter(self, nome: str, argumentos: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Busca um resultado
+
+        Returns:
+            (True, resultado) se há um resultado válido; (False, None) se não
+        """
+        chave = chave_cache(nome, argumentos)
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is not None and entrada[0] > time.time():
+                self._entradas.move_to_end(chave)
+                self._contar(self.acertos, nome)
+                return True, entrada[1]
+            if entrada is not None:
+                del self._entradas[chave]
+                self._apagar_persistido(chave)
+            self._contar(self.faltas, nome)
+            return False, None
+
+    def guardar(self, nome: str, argumentos: Dict[str, Any], resultado: Any, ttl: float) -> None:
+        """Guarda um resultado por `ttl` segundos (ttl <= 0 não guarda)"""
+        if ttl <= 0:
+            return
+        chave = chave_cache(nome, argumentos)
+        expira_em = time.time() + ttl
+        with self._lock:
+            self._entradas[chave] = (expira_em, resultado)
+            self._entradas.move_to_end(chave)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_ferramentas (chave, resultado, expira_em) VALUES (?, ?, ?)",
+                    (chave, json.dumps(resultado, ensure_ascii=False), expira_em)
+                )
+                self._conn.commit()
+            while len(self._entradas) > self.capacidade:
+                antiga, _ = self._entradas.popitem(last=False)
+                self._apagar_persistido(antiga)
+
+    def limpar(self) -> None:
+        """Esquece todos os resultados"""
+        with self._lock:
+            self._entradas.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM cache_ferramentas")
+                self._conn.commit()
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Acertos e faltas (total e por ferramenta) e ocupação"""
+        with self._lock:
+            acertos = sum(self.acertos.values())
+            faltas = sum(self.faltas.values())
+            return {
+                "acertos": acertos,
+                "faltas": faltas,
+                "taxa_acerto": acertos / (acertos + faltas) if acertos + faltas else 0.0,
+                "entradas": len(self._entradas),
+                "capacidade": self.capacidade,
+                "persistente": self._conn is not None,
+                "por_ferramenta": {
+                    nome: {"acertos": self.acertos.get(nome, 0), "faltas": self.faltas.get(nome, 0)}
+                    for nome in sorted(set(self.acertos) | set(self.faltas))
+                },
+            }
+
+    def fechar(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# Teste rápido
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    print("🧪 Testando cache de ferramentas...")
+
+    caminho = os.path.join(tempfile.mkdtemp(), "teste_cache.db")
+    cache = CacheResultados(capacidade=2, caminho_db=caminho)
+
+    cache.guardar("obter_clima", {"cidade": "Recife"}, "Clima em Recife: +29°C", ttl=600)
+    assert cache.obter("obter_clima", {"cidade": "  Recife "}) == (True, "Clima em Recife: +29°C")
+    assert cache.obter("obter_clima", {"cidade": "Natal"}) == (False, None)
+
+    # Vencido
+    cache.guardar("buscar_web", {"consulta": "python"}, "resultado", ttl=0.05)
+    time.sleep(0.1)
+    assert cache.obter("buscar_web", {"consulta": "python"}) == (False, None)
+
+    # LRU: Recife foi usado, então sai a entrada mais antiga sem uso
+    cache.guardar("buscar_web", {"consulta": "a"}, "A", ttl=600)
+    cache.obter("obter_clima", {"cidade": "Recife"})
+    cache.guardar("buscar_web", {"consulta": "b"}, "B", ttl=600)
+    assert cache.obter("buscar_web", {"consulta": "a"}) == (False, None)
+    cache.fechar()
+
+    # Persistência: outro processo encontra o que ficou
+    outro = CacheResultados(capacidade=2, caminho_db=caminho)
+    assert outro.obter("obter_clima", {"cidade": "Recife"})[0]
+    assert outro.obter("buscar_web", {"consulta": "b"}) == (True, "B")
+    print(f"Estatísticas: {cache.estatisticas()}")
+    outro.fechar()
+    os.remove(caminho)
+
+    print("✅ Teste concluído!")
@@ -0,0 +1,195 @@
+"""
+Cancelador de Eco do JARVIS
+Remove do microfone a voz do próprio JARVIS usando o áudio que está
+sendo tocado como referência (filtro adaptativo NLMS em blocos)
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def reamostrar(amostras: np.ndarray, taxa_origem: int, taxa_destino: int) -> np.ndarray:
+    """Reamostragem linear de int16 (ex.: TTS a 24 kHz → microfone a 16 kHz)"""
+    if taxa_origem == taxa_destino or not len(amostras):
+        return amostras
+    total = int(len(amostras) * taxa_destino / taxa_origem)
+    posicoes = np.arange(total) * (taxa_origem / taxa_destino)
+    return np.interp(posicoes, np.arange(len(amostras)), amostras).astype(np.int16)
+
+
+class CanceladorEco:
+    """
+    Supressão de eco acústico com NLMS em blocos
+
+    - Referência: o áudio do TTS, entregue aos poucos conforme é tocado
+      e alinhado pelo relógio da reprodução
+    - `atraso` compensa a latência de saída + entrada do sistema de áudio
+    - O filtro (taps) cobre o atraso residual e a reverberação da sala
+    - Adaptação congelada durante fala dupla (detector de Geigel),
+      para o filtro não "aprender" a voz do usuário
+    """
+
+    def __init__(self, taxa: int = 16000, taps: int = 512, passo: float = 0.1,
+                 atraso: float = 0.08, tamanho_bloco: int = 128,
+                 fator_geigel: float = 0.6):
+        """
+        Args:
+            taxa: taxa de amostragem do microfone (Hz)
+            taps: tamanho do filtro em amostras (512 = 32 ms a 16 kHz)
+            passo: passo de adaptação do NLMS (0-1)
+            atraso: atraso estimado entre tocar e o som voltar ao microfone (s)
+            tamanho_bloco: amostras por atualização do filtro
+            fator_geigel: fala dupla se |mic| > fator * max|referência|
+        """
+        self.taxa = taxa
+        self.taps = taps
+        self.passo = passo
+        self.atraso = int(atraso * taxa)
+        self.tamanho_bloco = tamanho_bloco
+        self.fator_geigel = fator_geigel
+
+        self._pesos = np.zeros(taps, dtype=np.float32)
+        self._sessao = None  # (referencia_float, instante_inicio)
+        self._tamanho = 0    # Amostras válidas na referência
+
+    def iniciar(self, instante: Optional[float] = None, capacidade: float = 30.0) -> None:
+        """
+        Começa uma nova reprodução (referência vazia)
+
+        Args:
+            instante: time.monotonic() do início da reprodução
+            capacidade: segundos pré-alocados (cresce se precisar)
+        """
+        referencia = np.zeros(int(capacidade * self.taxa), dtype=np.float32)
+        self._tamanho = 0
+        self._sessao = (referencia, time.monotonic() if instante is None else instante)
+
+    def adicionar_referencia(self, amostras: np.ndarray, instante: Optional[float] = None) -> None:
+        """
+        Registra um trecho que acabou de ser entregue à saída de áudio
+
+        Args:
+            amostras: áudio int16 na taxa do microfone
+            instante: time.monotonic() da entrega (buracos viram silêncio)
+        """
+        sessao = self._sessao
+        if sessao is None:
+            return
+        referencia, inicio = sessao
+
+        # Se a saída ficou sem áudio (rede atrasou), o alto-falante tocou silêncio
+        posicao = int(((time.monotonic() if instante is None else instante) - inicio) * self.taxa)
+        posicao = max(posicao, self._tamanho)
+
+        fim = posicao + len(amostras)
+        if fim > len(referencia):
+            maior = np.zeros(max(fim, 2 * len(referencia)), dtype=np.float32)
+            maior[:self._tamanho] = referencia[:self._tamanho]
+            referencia = maior
+            self._sessao = (referencia, inicio)
+
+        referencia[self._tamanho:posicao] = 0.0
+        referencia[posicao:fim] = amostras.astype(np.float32) / 32768.0
+        self._tamanho = fim
+
+    def parar(self) -> None:
+        """A reprodução terminou (o filtro aprendido é mantido para a próxima fala)"""
+        self._sessao = None
+
+    @property
+    def ativo(self) -> bool:
+        return self._sessao is not None
+
+    def _trecho_referencia(self, referencia: np.ndarray, tamanho: int,
+                           inicio: int, fim: int) -> np.ndarray:
+        """Recorta referencia[inicio:fim] completando com zeros fora do intervalo"""
+        trecho = np.zeros(fim - inicio, dtype=np.float32)
+        origem_ini, origem_fim = max(inicio, 0), min(fim, tamanho)
+        if origem_fim > origem_ini:
+            trecho[origem_ini - inicio:origem_fim - inicio] = referencia[origem_ini:origem_fim]
+        return trecho
+
+    def processar(self, quadro: np.ndarray, instante: float) -> np.ndarray:
+        """
+        Remove o eco de um quadro capturado
+
+        Args:
+            quadro: quadro int16 do microfone
+            instante: time.monotonic() de quando o quadro chegou (fim do quadro)
+
+        Returns:
+            Quadro int16 sem o eco (o próprio quadro se não há reprodução)
+        """
+        sessao = self._sessao
+        if sessao is None:
+            return quadro
+        referencia, inicio_reproducao = sessao
+        # A thread da saída pode estar crescendo a referência agora
+        tamanho = min(self._tamanho, len(referencia))
+
+        n = len(quadro)
+        fim = int((instante - inicio_reproducao) * self.taxa) - self.atraso
+        inicio = fim - n
+        if fim <= 0 or inicio >= tamanho:
+            return quadro
+
+        # Linha i da matriz = [ref[i], ref[i-1], ..., ref[i-taps+1]]
+        trecho = self._trecho_referencia(referencia, tamanho, inicio - self.taps + 1, fim)
+        matriz = sliding_window_view(trecho, self.taps)[:, ::-1]
+
+        mic = quadro.astype(np.float32) / 32768.0
+        saida = np.empty_like(mic)
+
+        for ini_bloco in range(0, n, self.tamanho_bloco):
+            fim_bloco = min(ini_bloco + self.tamanho_bloco, n)
+            x = matriz[ini_bloco:fim_bloco]
+            d = mic[ini_bloco:fim_bloco]
+
+            erro = d - x @ self._pesos
+            saida[ini_bloco:fim_bloco] = erro
+
+            fala_dupla = np.abs(d).max() > self.fator_geigel * (np.abs(x[:, 0]).max() + 1e-6)
+            if not fala_dupla:
+                # Normaliza pela energia média de uma linha (‖x‖² do NLMS)
+                energia = float(np.sum(x * x)) / len(x) + 1e-6
+                self._pesos += (self.passo / energia) * (x.T @ erro)
+
+        return np.clip(saida * 32768.0, -32768, 32767).astype(np.int16)
+
+
+# Teste rápido
+if __name__ == "__main__":
+    print("🧪 Testando cancelador de eco...")
+
+    taxa = 16000
+    rng = np.random.default_rng(0)
+
+    # "Voz do JARVIS" e o eco dela na sala (atrasado, atenuado e com reflexão)
+    tts = (rng.normal(0, 6000, 3 * taxa)).astype(np.int16)
+    atraso = int(0.09 * taxa)
+    eco = np.zeros(len(tts))
+    eco[atraso:] += 0.4 * tts[:-atraso]
+    eco[atraso + 40:] += 0.15 * tts[:-atraso - 40]
+    microfone = (eco + rng.normal(0, 30, len(eco))).astype(np.int16)
+
+    cancelador = CanceladorEco(taxa)
+    cancelador.iniciar(instante=0.0, capacidade=1.0)
+
+    energia_antes, energia_depois = [], []
+    for fim in range(512, len(microfone), 512):
+        # A referência chega aos poucos, um pouco antes de tocar
+        cancelador.adicionar_referencia(tts[fim - 512:fim], instante=(fim - 512) / taxa)
+        quadro = microfone[fim - 512:fim]
+        limpo = cancelador.processar(quadro, instante=fim / taxa)
+        if fim > 2 * taxa:
+            energia_antes.append(np.mean(quadro.astype(np.float64) ** 2))
+            energia_depois.append(np.mean(limpo.astype(np.float64) ** 2))
+
+    atenuacao = 10 * np.log10(np.mean(energia_antes) / np.mean(energia_depois))
+    print(f"Atenuação do eco: {atenuacao:.1f} dB")
+    assert atenuacao > 15
+
+    print("✅ Teste concluído!")
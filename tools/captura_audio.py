@@ -0,0 +1,179 @@
+"""
+Captura de Áudio do JARVIS
+Barramento único do microfone: captura em modo callback (PyAudio) e
+distribui cada quadro para as filas inscritas (monitor, ouvir, ...)
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+import pyaudio
+
+
+class FilaQuadros:
+    """
+    Fila limitada de quadros de áudio
+
+    - Produtor: callback do PyAudio (thread do PortAudio)
+    - Consumidor: thread de análise
+    - Sem trava: deque.append/popleft são atômicos no CPython
+    - Quando cheia, descarta o quadro mais antigo e conta o descarte
+    - Inativa, ignora os quadros (consumidor que só escuta às vezes)
+    """
+
+    def __init__(self, capacidade: int, ativa: bool = True):
+        """
+        Args:
+            capacidade: número máximo de quadros aguardando consumo
+            ativa: se já começa recebendo quadros
+        """
+        self._quadros = deque(maxlen=capacidade)
+        self._disponivel = threading.Event()
+        self.ativa = ativa
+        self.descartados = 0
+        self.underruns = 0
+
+    def colocar(self, dados: bytes, instante: float) -> None:
+        """Adiciona um quadro (chamado pelo produtor)"""
+        if not self.ativa:
+            return
+        if len(self._quadros) == self._quadros.maxlen:
+            self.descartados += 1
+        self._quadros.append((dados, instante))
+        self._disponivel.set()
+
+    def ler(self, timeout: float = 0.5) -> Optional[Tuple[bytes, float]]:
+        """
+        Retorna o próximo quadro, aguardando até `timeout` segundos
+
+        Returns:
+            (dados, instante_captura) ou None se nenhum quadro chegou
+        """
+        while True:
+            try:
+                return self._quadros.popleft()
+            except IndexError:
+                pass
+
+            # Limpa o aviso e confere de novo antes de dormir
+            # (evita perder um quadro que chegou no meio do caminho)
+            self._disponivel.clear()
+            if self._quadros:
+                continue
+
+            if not self._disponivel.wait(timeout):
+                self.underruns += 1
+                return None
+
+    def esvaziar(self) -> None:
+        """Descarta os quadros pendentes"""
+        self._quadros.clear()
+
+    def ativar(self) -> None:
+        """Passa a receber quadros a partir de agora (descarta os antigos)"""
+        self._quadros.clear()
+        self.ativa = True
+
+    def desativar(self) -> None:
+        """Para de receber quadros"""
+        self.ativa = False
+        self._quadros.clear()
+
+    def __len__(self) -> int:
+        return len(self._quadros)
+
+
+class CapturaAudio:
+    """
+    Barramento de captura contínua do microfone
+
+    É o único dono do dispositivo de entrada. O PortAudio chama
+    `_callback` a cada quadro; o callback só empurra os bytes nas
+    filas inscritas, sem bloquear nem dormir.
+    """
+
+    def __init__(self, pyaudio_instancia: pyaudio.PyAudio, taxa: int = 16000,
+                 tamanho_quadro: int = 1024):
+        """
+        Args:
+            pyaudio_instancia: instância do PyAudio já criada
+            taxa: taxa de amostragem (Hz)
+            tamanho_quadro: amostras por quadro
+        """
+        self.pyaudio = pyaudio_instancia
+        self.taxa = taxa
+        self.tamanho_quadro = tamanho_quadro
+        self.filas = {}
+        self.fluxo = None
+
+        # Contadores
+        self.quadros_capturados = 0
+        self.overflows_entrada = 0
+        self.underflows_entrada = 0
+
+    def _callback(self, dados, total_quadros, info_tempo, status):
+        """Callback do PortAudio - precisa ser rápido"""
+        if status & pyaudio.paInputOverflow:
+            self.overflows_entrada += 1
+        if status & pyaudio.paInputUnderflow:
+            self.underflows_entrada += 1
+
+        self.quadros_capturados += 1
+        instante = time.monotonic()
+        for fila in tuple(self.filas.values()):
+            fila.colocar(dados, instante)
+        return (None, pyaudio.paContinue)
+
+    def inscrever(self, nome: str, capacidade: int = 32, ativa: bool = True) -> FilaQuadros:
+        """
+        Cria uma fila que recebe uma cópia de cada quadro capturado
+
+        Args:
+            nome: identificador do consumidor (usado nas estatísticas)
+            capacidade: quadros que podem ficar pendentes
+            ativa: se já começa recebendo quadros
+
+        Returns:
+            Fila do consumidor
+        """
+        fila = FilaQuadros(capacidade, ativa)
+        self.filas = {**self.filas, nome: fila}
+        return fila
+
+    def iniciar(self) -> None:
+        """Abre o dispositivo e começa a capturar"""
+        self.fluxo = self.pyaudio.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=self.taxa,
+            input=True,
+            frames_per_buffer=self.tamanho_quadro,
+            stream_callback=self._callback
+        )
+        self.fluxo.start_stream()
+
+    def parar(self) -> None:
+        """Para a captura e libera o dispositivo"""
+        if self.fluxo is not None:
+            try:
+                self.fluxo.stop_stream()
+                self.fluxo.close()
+            finally:
+                self.fluxo = None
+
+    def estatisticas(self) -> Dict:
+        """Contadores de captura e de perda de quadros (somando os consumidores)"""
+        filas = self.filas.values()
+        return {
+            "quadros_capturados": self.quadros_capturados,
+            "quadros_descartados": sum(fila.descartados for fila in filas),
+            "overflows_entrada": self.overflows_entrada,
+            "underflows_entrada": self.underflows_entrada,
+            "underruns_consumidor": sum(fila.underruns for fila in filas),
+            "por_consumidor": {
+                nome: {"descartados": fila.descartados, "underruns": fila.underruns}
+                for nome, fila in self.filas.items()
+            }
+        }
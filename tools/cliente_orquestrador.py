@@ -0,0 +1,195 @@
+"""
+Cliente Assíncrono do Orquestrador de Tools
+Roda o orquestrador num processo separado e conversa com ele pelo modo
+JSON-RPC do stdio - várias chamadas em andamento ao mesmo tempo, cada
+resposta entregue a quem pediu, na ordem em que ficar pronta
+"""
+
+import asyncio
+import itertools
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+RAIZ = Path(__file__).parent.parent
+
+
+class ClienteOrquestradorAsync:
+    """
+    Cliente asyncio do orquestrador (processo filho)
+
+    - chamar_ferramenta() devolve o mesmo dicionário do orquestrador local:
+      {"result": ..., "error": ...} (+ "error_code" em timeout/cancelamento)
+    - Cancelar a task que aguarda uma chamada envia "cancel" ao orquestrador
+    """
+
+    def __init__(self, comando: Optional[List[str]] = None):
+        """
+        Args:
+            comando: linha de comando do servidor (padrão: python -m tools.orquestrador_tools)
+        """
+        self.comando = comando or [sys.executable, "-m", "tools.orquestrador_tools"]
+        self.ferramentas = []
+        self._processo = None
+        self._leitor = None
+        self._ids = itertools.count(1)
+        self._pendentes = {}  # id -> Future asyncio da resposta
+
+    async def iniciar(self) -> List[str]:
+        """
+        Sobe o processo e espera o orquestrador ficar pronto
+
+        Returns:
+            Nomes das ferramentas disponíveis
+        """
+        self._processo = await asyncio.create_subprocess_exec(
+            *self.comando, cwd=RAIZ,
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE
+        )
+        while True:
+            linha = await self._processo.stdout.readline()
+            if not linha:
+                raise RuntimeError("Orquestrador encerrou antes de ficar pronto")
+            mensagem = json.loads(linha)
+            if mensagem.get("status") == "ready":
+                break
+        self.ferramentas = mensagem.get("tools", [])
+        self._leitor = asyncio.create_task(self._ler_respostas())
+        return self.ferramentas
+
+    async def _ler_respostas(self):
+        """Entrega cada resposta ao Future do id correspondente"""
+        try:
+            async for linha in self._processo.stdout:
+                try:
+                    mensagem = json.loads(linha)
+                except ValueError:
+                    continue
+                futuro = self._pendentes.pop(mensagem.get("id"), None)
+                if futuro is not None and not futuro.done():
+                    futuro.set_result(mensagem)
+        finally:
+            # Processo saiu: ninguém fica esperando para sempre
+            for futuro in self._pendentes.values():
+                if not futuro.done():
+                    futuro.set_exception(ConnectionError("Orquestrador encerrado"))
+            self._pendentes.clear()
+
+    async def _enviar(self, metodo: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Envia uma requisição e aguarda a mensagem de resposta (JSON-RPC)"""
+        id_requisicao = next(self._ids)
+        futuro = asyncio.get_running_loop().create_future()
+        self._pendentes[id_requisicao] = futuro
+
+        try:
+            await self._escrever(id_requisicao, metodo, params)
+        except asyncio.CancelledError:
+            self._pendentes.pop(id_requisicao, None)
+            futuro.cancel()
+            raise
+        except Exception as e:
+            # Não chegou ao orquestrador (ex.: processo encerrado): nenhuma
+            # resposta virá para este id - falha como os demais pendentes
+            self._pendentes.pop(id_requisicao, None)
+            if not futuro.done():
+                futuro.set_exception(ConnectionError(f"Falha ao enviar ao orquestrador: {e}"))
+        try:
+            return await futuro
+        except asyncio.CancelledError:
+            self._pendentes.pop(id_requisicao, None)
+            if metodo != "cancel" and self._processo.returncode is None:
+                # Avisa o orquestrador; a resposta do cancel é ignorada
+                try:
+                    await self._escrever(next(self._ids), "cancel", {"id": id_requisicao})
+                except Exception:
+                    pass  # Orquestrador já encerrado: não há o que cancelar
+            raise
+
+    async def _escrever(self, id_requisicao: int, metodo: str, params: Dict[str, Any] = None) -> None:
+        requisicao = {"jsonrpc": "2.0", "id": id_requisicao, "method": metodo, "params": params or {}}
+        self._processo.stdin.write((json.dumps(requisicao, ensure_ascii=False) + "\n").encode())
+        await self._processo.stdin.drain()
+
+    @staticmethod
+    def _como_resposta(mensagem: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON-RPC -> {"result", "error"} (formato do orquestrador local)"""
+        erro = mensagem.get("error")
+        if not erro:
+            return {"result": mensagem.get("result"), "error": None}
+        resposta = {"result": None, "error": erro.get("message")}
+        codigo = (erro.get("data") or {}).get("error_code")
+        if codigo:
+            resposta["error_code"] = codigo
+        return resposta
+
+    async def chamar_ferramenta(self, nome: str, argumentos: Dict[str, Any]) -> Dict[str, Any]:
+        """Chama uma ferramenta (pode haver muitas em andamento ao mesmo tempo)"""
+        return self._como_resposta(await self._enviar("call_tool", {"name": nome, "arguments": argumentos}))
+
+    async def listar_ferramentas(self) -> List[Dict]:
+        """Ferramentas com descrição e parâmetros"""
+        return (await self._enviar("list_tools"))["result"]
+
+    async def estatisticas_cache(self) -> Dict[str, Any]:
+        """Acertos/faltas do cache de resultados do orquestrador"""
+        return (await self._enviar("cache_stats"))["result"]
+
+    async def fechar(self) -> None:
+        """Fecha a entrada do orquestrador e espera o processo terminar"""
+        if self._processo is None:
+            return
+        if self._processo.returncode is None:
+            self._processo.stdin.close()
+            await self._processo.wait()
+        if self._leitor is not None:
+            await self._leitor
+        self._processo = None
+
+
+# Teste rápido
+if __name__ == "__main__":
+    import time
+
+    async def testar():
+        print("🧪 Testando cliente assíncrono do orquestrador...")
+        cliente = ClienteOrquestradorAsync()
+        print(f"Ferramentas: {', '.join(await cliente.iniciar())}")
+
+        inicio = time.perf_counter()
+        respostas = await asyncio.gather(
+            cliente.chamar_ferramenta("obter_hora", {"formato": "hora"}),
+            cliente.chamar_ferramenta("obter_hora", {"formato": "data"}),
+            cliente.chamar_ferramenta("listar_arquivos", {}),
+            cliente.chamar_ferramenta("nao_existe", {}),
+            cliente.listar_ferramentas(),
+        )
+        print(f"{len(respostas)} respostas em {1000 * (time.perf_counter() - inicio):.0f} ms")
+        for resposta in respostas[:4]:
+            print(f"  {resposta}")
+        assert respostas[1]["result"].count("/") == 2
+        assert respostas[3]["error"] and respostas[3]["result"] is None
+
+        # Cancelar a task envia "cancel" ao orquestrador
+        chamada = asyncio.create_task(cliente.chamar_ferramenta("obter_hora", {}))
+        await asyncio.sleep(0)
+        chamada.cancel()
+        try:
+            await chamada
+        except asyncio.CancelledError:
+            print("  Chamada cancelada")
+
+        print(f"Cache: {await cliente.estatisticas_cache()}")
+
+        # Orquestrador morto: a chamada falha na hora e não fica pendente
+        cliente._processo.kill()
+        await cliente._processo.wait()
+        try:
+            await cliente.chamar_ferramenta("obter_hora", {})
+        except ConnectionError as e:
+            print(f"  Sem orquestrador: {e}")
+        assert not cliente._pendentes
+        await cliente.fechar()
+        print("✅ Teste concluído!")
+
+    asyncio.run(testar())
@@ -29,6 +29,16 @@ class FerramentaClima:
             }
         }
     
+    @staticmethod
+    def prazo() -> float:
+        """Segundos máximos de execução (a requisição já expira em 5s)"""
+        return 8
+    
+    @staticmethod
+    def ttl_cache(resultado: str) -> float:
+        """Segundos que o resultado pode ser reaproveitado (só respostas válidas)"""
+        return 600 if resultado.startswith("Clima em") else 0
+    
     @staticmethod
     def executar(cidade: str = "São Paulo") -> str:
         """
@@ -41,8 +51,8 @@ class FerramentaClima:
             Informações de clima
         """
         try:
-            # API wttr.in - não precisa de chave!
-            url = f"https://wttr.in/{cidade}?format=%C+%t+%h+%w"
+            # API wttr.in - não precisa de chave! (lang=pt: condição em português)
+            url = f"https://wttr.in/{cidade}?format=%C+%t+%h+%w&lang=pt"
             headers = {'User-Agent': 'curl/7.68.0'}
             
             resposta = requests.get(url, headers=headers, timeout=5)
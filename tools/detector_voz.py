@@ -0,0 +1,230 @@
+"""
+Detector de Voz (VAD) do JARVIS
+Decide se há fala no microfone usando várias características por
+subquadro, calculadas de forma vetorizada com NumPy
+"""
+
+import sys
+import wave
+from collections import deque
+from typing import Dict
+
+import numpy as np
+
+
+def calcular_caracteristicas(amostras: np.ndarray, taxa: int = 16000,
+                             tamanho_subquadro: int = 256,
+                             banda: tuple = (100, 4000)) -> Dict[str, np.ndarray]:
+    """
+    Calcula as características de cada subquadro de uma vez
+
+    Args:
+        amostras: áudio int16
+        taxa: taxa de amostragem (Hz)
+        tamanho_subquadro: amostras por subquadro (256 = 16 ms a 16 kHz)
+        banda: faixa de frequências da voz (Hz)
+
+    Returns:
+        Dicionário com vetores (um valor por subquadro):
+        - rms: energia
+        - zcr: taxa de cruzamentos por zero (0-1)
+        - razao_banda: fração da energia dentro da faixa de voz (0-1)
+    """
+    total = len(amostras) // tamanho_subquadro
+    if total == 0:
+        vazio = np.zeros(0, dtype=np.float32)
+        return {"rms": vazio, "zcr": vazio, "razao_banda": vazio}
+
+    subquadros = amostras[:total * tamanho_subquadro].reshape(total, tamanho_subquadro).astype(np.float32)
+
+    rms = np.sqrt(np.mean(subquadros * subquadros, axis=1))
+
+    sinais = np.signbit(subquadros)
+    zcr = np.count_nonzero(sinais[:, 1:] != sinais[:, :-1], axis=1) / (tamanho_subquadro - 1)
+
+    espectro = np.abs(np.fft.rfft(subquadros, axis=1)) ** 2
+    frequencias = np.fft.rfftfreq(tamanho_subquadro, d=1.0 / taxa)
+    na_banda = (frequencias >= banda[0]) & (frequencias <= banda[1])
+    energia_total = espectro.sum(axis=1) + 1e-9
+    razao_banda = espectro[:, na_banda].sum(axis=1) / energia_total
+
+    return {"rms": rms, "zcr": zcr, "razao_banda": razao_banda}
+
+
+class PoliticaEnergia:
+    """Política simples: só o RMS acima do limiar (comportamento antigo)"""
+
+    def avaliar(self, caracteristicas: Dict[str, np.ndarray], limiar: float) -> np.ndarray:
+        return caracteristicas["rms"] > limiar
+
+
+class PoliticaMultiCaracteristica:
+    """
+    Política padrão: energia + ZCR + energia na banda de voz
+
+    - Ruído contínuo de banda larga (ventilador, chiado) falha na razão de banda
+    - Estalos e batidas falham no ZCR/banda e não duram o bastante para a votação
+    """
+
+    def __init__(self, zcr_minimo: float = 0.01, zcr_maximo: float = 0.45,
+                 razao_banda_minima: float = 0.6):
+        self.zcr_minimo = zcr_minimo
+        self.zcr_maximo = zcr_maximo
+        self.razao_banda_minima = razao_banda_minima
+
+    def avaliar(self, caracteristicas: Dict[str, np.ndarray], limiar: float) -> np.ndarray:
+        return ((caracteristicas["rms"] > limiar)
+                & (caracteristicas["zcr"] >= self.zcr_minimo)
+                & (caracteristicas["zcr"] <= self.zcr_maximo)
+                & (caracteristicas["razao_banda"] >= self.razao_banda_minima))
+
+
+class DetectorVoz:
+    """
+    Detector de atividade de voz com votação entre subquadros
+
+    Cada subquadro recebe um voto (fala/não fala) da política; a fala é
+    confirmada quando `votos_minimos` dos últimos `janela_votos`
+    subquadros votaram fala.
+    """
+
+    def __init__(self, taxa: int = 16000, tamanho_subquadro: int = 256,
+                 janela_votos: int = 8, votos_minimos: int = 5, politica=None):
+        """
+        Args:
+            taxa: taxa de amostragem (Hz)
+            tamanho_subquadro: amostras por subquadro
+            janela_votos: subquadros considerados na decisão
+            votos_minimos: votos de fala necessários na janela
+            politica: objeto com avaliar(caracteristicas, limiar) -> vetor bool
+        """
+        self.taxa = taxa
+        self.tamanho_subquadro = tamanho_subquadro
+        self.votos_minimos = votos_minimos
+        self.politica = politica or PoliticaMultiCaracteristica()
+        self._votos = deque(maxlen=janela_votos)
+        self._resto = np.zeros(0, dtype=np.int16)
+
+    def processar(self, amostras: np.ndarray, limiar: float) -> bool:
+        """
+        Processa um quadro e diz se há fala confirmada
+
+        Args:
+            amostras: quadro int16 (qualquer tamanho)
+            limiar: limiar de RMS atual (ex.: do EstimadorRuido)
+
+        Returns:
+            True se a janela de votação confirma fala
+        """
+        if len(self._resto):
+            amostras = np.concatenate((self._resto, amostras))
+        usadas = len(amostras) - len(amostras) % self.tamanho_subquadro
+        self._resto = amostras[usadas:]
+
+        caracteristicas = calcular_caracteristicas(amostras[:usadas], self.taxa, self.tamanho_subquadro)
+        votos = self.politica.avaliar(caracteristicas, limiar)
+
+        confirmado = False
+        for voto in votos.tolist():
+            self._votos.append(voto)
+            if sum(self._votos) >= self.votos_minimos:
+                confirmado = True
+        return confirmado
+
+    def encontrar_inicio(self, amostras: np.ndarray, limiar: float,
+                         tolerancia_subquadros: int = 6) -> int:
+        """
+        Encontra onde começa a fala que termina no fim do trecho
+
+        Percorre os votos de trás para frente a partir do último subquadro
+        com fala, aceitando pausas curtas (entre palavras) de até
+        `tolerancia_subquadros`.
+
+        Args:
+            amostras: trecho int16 (ex.: pre-roll do buffer circular)
+            limiar: limiar de RMS atual
+            tolerancia_subquadros: maior pausa aceita dentro da fala
+
+        Returns:
+            Índice da amostra onde a fala começa (len(amostras) se não há fala)
+        """
+        caracteristicas = calcular_caracteristicas(amostras, self.taxa, self.tamanho_subquadro)
+        votos = np.flatnonzero(self.politica.avaliar(caracteristicas, limiar))
+        if not len(votos):
+            return len(amostras)
+
+        # Quebra onde a distância entre votos consecutivos passa da tolerância
+        quebras = np.flatnonzero(np.diff(votos) > tolerancia_subquadros + 1)
+        primeiro = votos[quebras[-1] + 1] if len(quebras) else votos[0]
+        return int(primeiro) * self.tamanho_subquadro
+
+    def reiniciar(self) -> None:
+        """Esquece os votos anteriores"""
+        self._votos.clear()
+        self._resto = np.zeros(0, dtype=np.int16)
+
+
+def _ler_wav(caminho: str) -> tuple:
+    """Lê um WAV mono 16 bits (para testar com gravações reais)"""
+    with wave.open(caminho, "rb") as arquivo:
+        taxa = arquivo.getframerate()
+        amostras = np.frombuffer(arquivo.readframes(arquivo.getnframes()), dtype=np.int16)
+        if arquivo.getnchannels() > 1:
+            amostras = amostras[::arquivo.getnchannels()]
+    return amostras, taxa
+
+
+# Teste rápido
+if __name__ == "__main__":
+    print("🧪 Testando detector de voz...")
+
+    taxa = 16000
+    tempo = np.arange(int(0.5 * taxa)) / taxa
+    rng = np.random.default_rng(0)
+
+    def detecta(sinal, limiar=300.0):
+        detector = DetectorVoz(taxa)
+        for inicio in range(0, len(sinal), 512):
+            if detector.processar(sinal[inicio:inicio + 512], limiar):
+                return inicio / taxa
+        return None
+
+    # "Voz": harmônicos de 150 Hz modulados em amplitude
+    voz = sum(np.sin(2 * np.pi * 150 * h * tempo) / h for h in range(1, 12))
+    voz *= 0.6 + 0.4 * np.sin(2 * np.pi * 4 * tempo)
+    voz = (voz / np.abs(voz).max() * 6000).astype(np.int16)
+
+    # Batida de porta: rajada curta de ruído que decai
+    batida = np.zeros(len(tempo))
+    batida[:480] = rng.normal(0, 12000, 480) * np.exp(-np.arange(480) / 120)
+    batida = batida.astype(np.int16)
+
+    # Ventilador: ruído branco contínuo e alto
+    ventilador = rng.normal(0, 3000, len(tempo)).astype(np.int16)
+
+    print(f"Voz detectada em: {detecta(voz)}s")
+    print(f"Batida de porta: {detecta(batida)}")
+    print(f"Ventilador: {detecta(ventilador)}")
+    assert detecta(voz) is not None and detecta(voz) < 0.15
+    assert detecta(batida) is None
+    assert detecta(ventilador) is None
+
+    # Início da fala: 1s de ruído baixo seguido de voz
+    trecho = np.concatenate((rng.normal(0, 50, taxa).astype(np.int16), voz))
+    inicio = DetectorVoz(taxa).encontrar_inicio(trecho, 300.0)
+    print(f"Início da fala em: {inicio / taxa:.3f}s")
+    assert abs(inicio - taxa) <= 256
+
+    # Gravações reais: python tools/detector_voz.py arquivo.wav [limiar]
+    for caminho in sys.argv[1:2]:
+        amostras, taxa_wav = _ler_wav(caminho)
+        limiar = float(sys.argv[2]) if len(sys.argv) > 2 else 300.0
+        detector = DetectorVoz(taxa_wav)
+        for inicio in range(0, len(amostras), 512):
+            if detector.processar(amostras[inicio:inicio + 512], limiar):
+                print(f"🎤 {caminho}: fala em {inicio / taxa_wav:.2f}s")
+                break
+        else:
+            print(f"🔇 {caminho}: nenhuma fala")
+
+    print("✅ Teste concluído!")
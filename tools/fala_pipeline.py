@@ -0,0 +1,375 @@
+"""
+Fala em Pipeline do JARVIS
+Divide a resposta em frases, sintetiza várias ao mesmo tempo e começa
+a tocar a primeira (já enquanto os bytes dela chegam) enquanto as
+seguintes ainda estão sendo geradas
+"""
+
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional
+
+
+# Fim de frase: pontuação seguida de espaço, ou quebra de linha
+_FIM_DE_FRASE = re.compile(r'(?<=[.!?…:;])\s+|\n+')
+
+
+class SegmentadorFrases:
+    """
+    Divide em frases um texto que chega aos poucos (tokens do LLM)
+
+    Uma frase só sai quando o que vem depois dela já chegou - "3." pode
+    ser o começo de "3.5", então a pontuação precisa do espaço seguinte.
+    """
+
+    def __init__(self, tamanho_minimo: int = 20):
+        """
+        Args:
+            tamanho_minimo: frases menores são juntadas à seguinte
+                            (evita chamadas de TTS para "Ok." sozinho)
+        """
+        self.tamanho_minimo = tamanho_minimo
+        self._texto = ""
+        self._pendente = ""
+
+    def _juntar(self, parte: str) -> List[str]:
+        parte = parte.strip()
+        if not parte:
+            return []
+        self._pendente = f"{self._pendente} {parte}" if self._pendente else parte
+        if len(self._pendente) >= self.tamanho_minimo:
+            frase, self._pendente = self._pendente, ""
+            return [frase]
+        return []
+
+    def adicionar(self, pedaco: str) -> List[str]:
+        """
+        Acrescenta um pedaço do texto
+
+        Returns:
+            Frases que ficaram completas (pode ser vazia)
+        """
+        partes = _FIM_DE_FRASE.split(self._texto + pedaco)
+        self._texto = partes.pop()  # A última ainda pode crescer
+        frases = []
+        for parte in partes:
+            frases.extend(self._juntar(parte))
+        return frases
+
+    def finalizar(self) -> List[str]:
+        """O texto acabou: devolve o que sobrou"""
+        frases = self._juntar(self._texto)
+        self._texto = ""
+        if self._pendente:
+            frases.append(self._pendente)
+            self._pendente = ""
+        return frases
+
+
+def dividir_frases(texto: str, tamanho_minimo: int = 20) -> List[str]:
+    """
+    Divide um texto em frases para sintetizar separadamente
+
+    Args:
+        texto: texto completo
+        tamanho_minimo: frases menores são juntadas à seguinte
+                        (evita chamadas de TTS para "Ok." sozinho)
+
+    Returns:
+        Lista de frases na ordem original
+    """
+    segmentador = SegmentadorFrases(tamanho_minimo)
+    return segmentador.adicionar(texto.strip()) + segmentador.finalizar()
+
+
+class CancelamentoFala(threading.Event):
+    """
+    Interrupção de UMA fala (cada falar() usa o seu)
+
+    É um Event comum - quem só precisa saber se foi interrompido usa
+    is_set(). Quem fica bloqueado fora do alcance do evento (ex.: lendo
+    o stream HTTP do modelo) registra em ao_cancelar() como se soltar.
+    Depois de cancelado continua cancelado: uma thread atrasada de uma
+    fala antiga nunca "perde" a interrupção.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock_acoes = threading.Lock()
+        self._acoes = []
+
+    def set(self) -> None:
+        with self._lock_acoes:
+            super().set()
+            acoes, self._acoes = self._acoes, []
+        for acao in acoes:
+            try:
+                acao()
+            except Exception:
+                pass  # Só serve para soltar quem está bloqueado
+
+    def ao_cancelar(self, acao: Callable[[], None]) -> Callable[[], None]:
+        """
+        Registra uma ação para o cancelamento (roda na hora se já foi cancelado)
+
+        Returns:
+            Função que remove o registro
+        """
+        with self._lock_acoes:
+            if not self.is_set():
+                self._acoes.append(acao)
+                return lambda: self._remover(acao)
+        acao()
+        return lambda: None
+
+    def _remover(self, acao) -> None:
+        with self._lock_acoes:
+            if acao in self._acoes:
+                self._acoes.remove(acao)
+
+
+class AudioEmFluxo:
+    """
+    Áudio de uma frase que vai chegando aos poucos
+
+    - Escrito pela thread de síntese (bloco a bloco, conforme a rede entrega)
+    - Lido pela thread de reprodução (itera e bloqueia até o próximo bloco)
+    """
+
+    def __init__(self, frase: str):
+        self.frase = frase
+        self.cancelado = False
+        self.erro = None
+        self._blocos = queue.Queue()
+
+    def escrever(self, bloco: bytes) -> None:
+        """Adiciona um bloco de áudio"""
+        self._blocos.put(bloco)
+
+    def finalizar(self, erro: Exception = None) -> None:
+        """Marca o fim do áudio (com erro, se a síntese falhou)"""
+        self.erro = erro
+        self._blocos.put(None)
+
+    def cancelar(self) -> None:
+        """Pede para a síntese parar de baixar o áudio"""
+        self.cancelado = True
+        self._blocos.put(None)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            bloco = self._blocos.get()
+            if bloco is None:
+                if self.erro is not None:
+                    raise self.erro
+                return
+            yield bloco
+
+
+class FaladorPipeline:
+    """
+    Sintetiza e toca frases em pipeline
+
+    - Uma thread produtora envia as frases para o pool de síntese
+    - A thread que chamou falar() toca os áudios na ordem original,
+      começando cada um assim que o primeiro bloco chega
+    - No máximo `max_adiantadas` frases ficam sintetizadas/sendo
+      sintetizadas à frente da que está tocando
+    - Interrupção: para de tocar, cancela as sínteses pendentes e espera
+      a thread produtora sair - falar() só volta quando nada mais desta
+      fala está rodando
+    """
+
+    def __init__(self, sintetizar: Callable[[str, AudioEmFluxo], None],
+                 reproduzir: Callable[[AudioEmFluxo], bool],
+                 max_paralelo: int = 2, max_adiantadas: int = 3,
+                 espera_produtor: float = 5.0):
+        """
+        Args:
+            sintetizar: função (frase, destino) que escreve os blocos no destino (roda no pool)
+            reproduzir: função áudio -> True se foi interrompido (roda na thread chamadora)
+            max_paralelo: sínteses simultâneas
+            max_adiantadas: frases à frente da que está tocando
+            espera_produtor: segundos esperando o gerador de frases parar após a interrupção
+        """
+        self.sintetizar = sintetizar
+        self.reproduzir = reproduzir
+        self.max_adiantadas = max_adiantadas
+        self.espera_produtor = espera_produtor
+        self.executor = ThreadPoolExecutor(max_workers=max_paralelo, thread_name_prefix="tts")
+
+    def _produzir(self, frases: Iterable[str], fila: queue.Queue,
+                  vagas: threading.Semaphore, interromper: threading.Event):
+        """Envia as frases para síntese conforme há vaga (thread produtora)"""
+        try:
+            for frase in frases:
+                while not vagas.acquire(timeout=0.1):
+                    if interromper.is_set():
+                        return
+                if interromper.is_set():
+                    return
+                audio = AudioEmFluxo(frase)
+                self.executor.submit(self._sintetizar, frase, audio)
+                fila.put(audio)
+        except Exception as e:
+            print(f"❌ Erro ao gerar frases: {e}")
+        finally:
+            # Gerador interrompido no meio: roda o finally dele agora
+            if hasattr(frases, "close"):
+                frases.close()
+            fila.put(None)
+
+    def _sintetizar(self, frase: str, audio: AudioEmFluxo):
+        """Roda a síntese no pool e sempre finaliza o áudio"""
+        if audio.cancelado:
+            return
+        try:
+            self.sintetizar(frase, audio)
+            audio.finalizar()
+        except Exception as e:
+            audio.finalizar(e)
+
+    def falar(self, frases: Iterable[str], interromper: threading.Event,
+              faladas: Optional[List[str]] = None) -> bool:
+        """
+        Fala as frases em ordem
+
+        Args:
+            frases: frases (lista ou gerador - pode ir chegando aos poucos)
+            interromper: evento de interrupção (barge-in) exclusivo desta fala
+            faladas: recebe as frases que chegaram a tocar (a interrompida
+                     no meio conta - o usuário ouviu parte dela)
+
+        Returns:
+            True se foi interrompido
+        """
+        fila = queue.Queue()
+        vagas = threading.Semaphore(self.max_adiantadas)
+        produtor = threading.Thread(
+            target=self._produzir, args=(frases, fila, vagas, interromper), daemon=True
+        )
+        produtor.start()
+
+        while True:
+            try:
+                # Com timeout: a interrupção pode vir antes da primeira frase
+                # (modelo pensando, ferramenta rodando)
+                audio = fila.get(timeout=0.1)
+            except queue.Empty:
+                if interromper.is_set():
+                    break
+                continue
+            if audio is None:
+                break
+
+            if interromper.is_set():
+                audio.cancelar()
+                break
+
+            try:
+                interrompido = self.reproduzir(audio)
+                if faladas is not None:
+                    faladas.append(audio.frase)
+            except Exception as e:
+                print(f"❌ Erro na fala: {e}")
+                interrompido = False
+            finally:
+                vagas.release()
+
+            if interrompido:
+                audio.cancelar()
+                break
+
+        if interromper.is_set():
+            # O produtor vê a interrupção e fecha o gerador de frases
+            produtor.join(self.espera_produtor)
+            if produtor.is_alive():
+                print("⚠️ Gerador de frases não parou a tempo")
+            # Cancela o que ficou na fila sem tocar
+            while True:
+                try:
+                    audio = fila.get_nowait()
+                except queue.Empty:
+                    break
+                if audio is not None:
+                    audio.cancelar()
+            return True
+        produtor.join()
+        return False
+
+    def fechar(self):
+        """Encerra o pool de síntese"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Teste rápido
+if __name__ == "__main__":
+    import time
+
+    print("🧪 Testando fala em pipeline...")
+
+    texto = ("Olá! Eu sou o JARVIS, seu assistente pessoal. Hoje o dia está ótimo "
+             "para programar. Posso ajudar com mais alguma coisa? Ok.")
+    frases = dividir_frases(texto)
+    print(f"Frases: {frases}")
+
+    tocadas = []
+    inicio = time.monotonic()
+
+    def sintetizar(frase, destino):
+        time.sleep(0.2)  # Simula a latência do TTS
+        for palavra in frase.split():
+            destino.escrever(palavra.encode())
+            time.sleep(0.01)
+
+    def reproduzir(audio):
+        tocadas.append((round(time.monotonic() - inicio, 1), audio.frase))
+        for _ in audio:
+            time.sleep(0.05)  # Simula a duração do áudio
+        return False
+
+    falador = FaladorPipeline(sintetizar, reproduzir)
+    falador.falar(frases, threading.Event())
+    falador.fechar()
+
+    for instante, frase in tocadas:
+        print(f"  {instante}s: {frase}")
+    assert [frase for _, frase in tocadas] == frases
+    assert tocadas[0][0] < 0.3
+
+    # Texto chegando token a token dá as mesmas frases
+    segmentador = SegmentadorFrases()
+    em_fluxo = []
+    for inicio in range(0, len(texto), 3):
+        em_fluxo.extend(segmentador.adicionar(texto[inicio:inicio + 3]))
+    em_fluxo.extend(segmentador.finalizar())
+    assert em_fluxo == frases
+    assert dividir_frases("O valor é 3.5 reais, certo? Sim.") == ["O valor é 3.5 reais, certo?", "Sim."]
+
+    # Interrupção: falar() só volta depois que o gerador parou
+    geradas, sintetizadas = [], []
+
+    def gerar(cancelar):
+        try:
+            for numero in range(5):
+                if cancelar.wait(0.3):  # Simula o modelo (e sai ao ser cancelado)
+                    return
+                geradas.append(numero)
+                yield f"Frase número {numero} da resposta."
+        finally:
+            geradas.append("fechado")
+
+    interromper = CancelamentoFala()
+    threading.Timer(0.5, interromper.set).start()
+    faladas = []
+    falador = FaladorPipeline(lambda frase, destino: sintetizadas.append(frase), reproduzir)
+    assert falador.falar(gerar(interromper), interromper, faladas)
+    fim = list(geradas)
+    time.sleep(0.5)
+    falador.fechar()
+    print(f"  Interrompido: faladas={faladas} geradas={geradas}")
+    assert fim[-1] == "fechado" and geradas == fim and len(sintetizadas) <= 1
+
+    print("✅ Teste concluído!")
@@ -0,0 +1,119 @@
+"""
+Detector de Fim de Fala do JARVIS
+Decide quando o usuário terminou de falar, adaptando o silêncio
+exigido ao tamanho da frase e ao ritmo de quem fala
+"""
+
+from collections import deque
+
+
+class DetectorFimFala:
+    """
+    Endpointing adaptativo
+
+    - Frases curtas ("sim", "que horas são?") encerram com pouco silêncio
+    - Frases longas ganham mais folga (a pessoa ainda está pensando)
+    - Quem faz pausas longas entre palavras ganha um limite maior
+    - O silêncio exigido fica sempre entre `silencio_minimo` e `silencio_maximo`
+    """
+
+    def __init__(self, silencio_minimo: float = 0.5, silencio_maximo: float = 1.5,
+                 ganho_duracao: float = 0.1, fator_pausa: float = 1.5,
+                 fala_maxima: float = 30.0):
+        """
+        Args:
+            silencio_minimo: menor silêncio (s) que encerra uma frase
+            silencio_maximo: maior silêncio (s) exigido, mesmo para quem fala devagar
+            ganho_duracao: segundos extras de silêncio por segundo de fala
+            fator_pausa: limite >= fator_pausa * pausas longas já observadas
+            fala_maxima: duração máxima da frase (s), encerra mesmo sem silêncio
+        """
+        self.silencio_minimo = silencio_minimo
+        self.silencio_maximo = silencio_maximo
+        self.ganho_duracao = ganho_duracao
+        self.fator_pausa = fator_pausa
+        self.fala_maxima = fala_maxima
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        """Prepara para uma nova frase"""
+        self.iniciou = False
+        self.duracao_fala = 0.0
+        self.duracao_total = 0.0
+        self._silencio_atual = 0.0
+        self._pausas = deque(maxlen=20)
+
+    def limite_silencio(self) -> float:
+        """Silêncio (s) que encerra a frase neste momento"""
+        limite = self.silencio_minimo + self.ganho_duracao * self.duracao_fala
+
+        if self._pausas:
+            # Percentil 90 das pausas entre palavras (ritmo de quem fala)
+            pausas = sorted(self._pausas)
+            p90 = pausas[min(len(pausas) - 1, int(0.9 * len(pausas)))]
+            limite = max(limite, self.fator_pausa * p90)
+
+        return min(max(limite, self.silencio_minimo), self.silencio_maximo)
+
+    def processar(self, tem_fala: bool, duracao: float) -> bool:
+        """
+        Processa um quadro
+
+        Args:
+            tem_fala: se o detector de voz marcou fala neste quadro
+            duracao: duração do quadro (s)
+
+        Returns:
+            True quando a frase terminou
+        """
+        if not self.iniciou:
+            if tem_fala:
+                self.iniciou = True
+                self.duracao_fala += duracao
+                self.duracao_total += duracao
+            return False
+
+        self.duracao_total += duracao
+
+        if tem_fala:
+            if self._silencio_atual > 0:
+                self._pausas.append(self._silencio_atual)
+            self._silencio_atual = 0.0
+            self.duracao_fala += duracao
+        else:
+            self._silencio_atual += duracao
+
+        if self.duracao_total >= self.fala_maxima:
+            return True
+        return self._silencio_atual >= self.limite_silencio()
+
+
+# Teste rápido
+if __name__ == "__main__":
+    print("🧪 Testando detector de fim de fala...")
+
+    quadro = 0.032
+
+    def silencio_ate_fim(padrao):
+        """padrao: lista de (tem_fala, segundos); retorna silêncio final necessário"""
+        detector = DetectorFimFala()
+        for tem_fala, segundos in padrao:
+            for _ in range(round(segundos / quadro)):
+                if detector.processar(tem_fala, quadro):
+                    return None
+        silencio = 0.0
+        while not detector.processar(False, quadro):
+            silencio += quadro
+        return silencio + quadro
+
+    curta = silencio_ate_fim([(True, 0.6)])
+    longa = silencio_ate_fim([(True, 2.0), (False, 0.3), (True, 2.0), (False, 0.3), (True, 2.0)])
+    lenta = silencio_ate_fim([(True, 0.5), (False, 0.4), (True, 0.5), (False, 0.45), (True, 0.5)])
+
+    print(f"Frase curta: {curta:.2f}s de silêncio")
+    print(f"Frase longa: {longa:.2f}s de silêncio")
+    print(f"Fala lenta: {lenta:.2f}s de silêncio")
+    assert curta < longa <= 1.5 + quadro
+    assert lenta > curta
+
+    print("✅ Teste concluído!")
@@ -0,0 +1,153 @@
+"""
+Gerenciador de Contexto do JARVIS
+Mantém o histórico enviado ao modelo dentro de um orçamento de tokens:
+primeiro encurta resultados antigos de ferramentas, depois descarta
+os turnos mais antigos - o prompt do sistema fica sempre
+"""
+
+import json
+from typing import Dict, List
+
+try:
+    import tiktoken
+    _CODIFICADOR = tiktoken.get_encoding("o200k_base")
+except Exception:  # tiktoken é opcional
+    _CODIFICADOR = None
+
+
+def contar_tokens(texto: str) -> int:
+    """Tokens de um texto (tiktoken se instalado; senão ~4 caracteres por token)"""
+    if not texto:
+        return 0
+    if _CODIFICADOR is not None:
+        return len(_CODIFICADOR.encode(texto, disallowed_special=()))
+    return (len(texto) + 3) // 4
+
+
+class GerenciadorContexto:
+    """
+    Orçamento de tokens do histórico
+
+    - Turno = mensagem do usuário + tudo até a próxima (chamadas de
+      ferramenta e seus resultados nunca são separados)
+    - Compactação: resultados de ferramenta dos turnos antigos são
+      cortados em `limite_resultado` caracteres
+    - Despejo: turnos inteiros, do mais antigo para o mais novo
+    - As mensagens de sistema do início (prompt, resumo da memória)
+      e o turno atual nunca saem
+    """
+
+    def __init__(self, orcamento_tokens: int = 8000, limite_resultado: int = 400,
+                 tokens_por_mensagem: int = 4):
+        """
+        Args:
+            orcamento_tokens: máximo de tokens do histórico enviado
+            limite_resultado: caracteres mantidos de resultados antigos de ferramentas
+            tokens_por_mensagem: custo fixo de cada mensagem (papel, separadores)
+        """
+        self.orcamento_tokens = orcamento_tokens
+        self.limite_resultado = limite_resultado
+        self.tokens_por_mensagem = tokens_por_mensagem
+
+        self.mensagens_removidas = 0
+        self.resultados_compactados = 0
+        self.ultimo_total = 0
+
+    def tokens_mensagem(self, mensagem: Dict) -> int:
+        """Tokens de uma mensagem (texto + chamadas de ferramenta)"""
+        total = self.tokens_por_mensagem + contar_tokens(mensagem.get("content") or "")
+        for chamada in mensagem.get("tool_calls") or []:
+            funcao = chamada.get("function", {})
+            total += contar_tokens(funcao.get("name", "")) + contar_tokens(funcao.get("arguments", ""))
+        return total
+
+    def _dividir_turnos(self, mensagens: List[Dict]) -> List[List[Dict]]:
+        turnos = []
+        for mensagem in mensagens:
+            if mensagem["role"] == "user" or not turnos:
+                turnos.append([])
+            turnos[-1].append(mensagem)
+        return turnos
+
+    def _compactar(self, mensagem: Dict) -> Dict:
+        conteudo = mensagem.get("content") or ""
+        if mensagem["role"] != "tool" or len(conteudo) <= self.limite_resultado:
+            return mensagem
+        self.resultados_compactados += 1
+        return dict(mensagem, content=conteudo[:self.limite_resultado] + "… [resultado encurtado]")
+
+    def ajustar(self, historico: List[Dict]) -> int:
+        """
+        Ajusta o histórico (no lugar) ao orçamento
+
+        Args:
+            historico: lista de mensagens; começa pelo prompt do sistema
+
+        Returns:
+            Total de tokens depois do ajuste
+        """
+        fixas = 0
+        while fixas < len(historico) and historico[fixas]["role"] == "system":
+            fixas += 1
+        turnos = self._dividir_turnos(historico[fixas:])
+        custos = [sum(self.tokens_mensagem(m) for m in turno) for turno in turnos]
+        total = sum(self.tokens_mensagem(m) for m in historico[:fixas]) + sum(custos)
+
+        if total > self.orcamento_tokens:
+            # 1) Encurta resultados de ferramentas dos turnos antigos
+            for i in range(len(turnos) - 1):
+                turnos[i] = [self._compactar(m) for m in turnos[i]]
+                novo_custo = sum(self.tokens_mensagem(m) for m in turnos[i])
+                total -= custos[i] - novo_custo
+                custos[i] = novo_custo
+
+            # 2) Descarta os turnos mais antigos
+            while total > self.orcamento_tokens and len(turnos) > 1:
+                self.mensagens_removidas += len(turnos[0])
+                total -= custos.pop(0)
+                turnos.pop(0)
+
+            historico[fixas:] = [m for turno in turnos for m in turno]
+
+        self.ultimo_total = total
+        return total
+
+    def estatisticas(self) -> dict:
+        return {
+            "tokens": self.ultimo_total,
+            "orcamento": self.orcamento_tokens,
+            "mensagens_removidas": self.mensagens_removidas,
+            "resultados_compactados": self.resultados_compactados,
+            "contador": "tiktoken" if _CODIFICADOR is not None else "aproximado",
+        }
+
+
+# Teste rápido
+if __name__ == "__main__":
+    print("🧪 Testando gerenciador de contexto...")
+
+    historico = [{"role": "system", "content": "Você é JARVIS." * 20}]
+    for i in range(30):
+        historico.append({"role": "user", "content": f"Pergunta {i} " * 10})
+        if i % 3 == 0:
+            historico.append({"role": "assistant", "content": None, "tool_calls": [{
+                "id": f"call_{i}", "type": "function",
+                "function": {"name": "buscar_web", "arguments": json.dumps({"consulta": f"assunto {i}"})}
+            }]})
+            historico.append({"role": "tool", "tool_call_id": f"call_{i}", "content": "resultado " * 300})
+        historico.append({"role": "assistant", "content": f"Resposta {i} " * 10})
+
+    gerenciador = GerenciadorContexto(orcamento_tokens=2000)
+    antes = sum(gerenciador.tokens_mensagem(m) for m in historico)
+    depois = gerenciador.ajustar(historico)
+    print(f"Tokens: {antes} -> {depois} ({gerenciador.estatisticas()})")
+
+    assert depois <= 2000
+    assert historico[0]["role"] == "system"
+    assert historico[1]["role"] == "user"
+    assert historico[-1]["content"].startswith("Resposta 29")
+    # Nenhum resultado de ferramenta ficou sem a chamada que o gerou
+    ids_chamados = {c["id"] for m in historico for c in m.get("tool_calls") or []}
+    assert all(m["tool_call_id"] in ids_chamados for m in historico if m["role"] == "tool")
+
+    print("✅ Teste concluído!")
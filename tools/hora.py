@@ -29,6 +29,11 @@ class FerramentaHora:
             }
         }
     
+    @staticmethod
+    def prazo() -> float:
+        """Segundos máximos de execução"""
+        return 2
+    
     @staticmethod
     def executar(formato: str = "completo") -> str:
         """
@@ -15,6 +15,7 @@ class JarvisMemoria:
     
     - Configurações do usuário (nome, preferências)
     - Histórico de conversas (últimas N mensagens)
+    - Resumo acumulado das conversas antigas
     - Contexto entre sessões
     """
     
@@ -26,6 +27,8 @@ class JarvisMemoria:
             db_path: Caminho para o arquivo do banco de dados
         """
         self.db_path = db_path
+        # Uma conexão por thread: o JARVIS só grava pela thread principal
+        # e o resumidor abre a sua (o sqlite acusa uso fora da thread dona)
         self.conn = sqlite3.connect(db_path)
         self.cursor = self.conn.cursor()
         self._criar_tabelas()
@@ -52,6 +55,16 @@ class JarvisMemoria:
             )
         """)
         
+        # Tabela de resumos (conversas antigas condensadas)
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS resumos (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                conteudo TEXT NOT NULL,
+                ate_mensagem INTEGER NOT NULL,
+                data_criacao TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
         # Tabela de sessões (para estatísticas)
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS sessoes (
@@ -135,9 +148,32 @@ class JarvisMemoria:
         # Inverte para ordem cronológica (mais antiga primeiro)
         return [{"role": role, "content": content} for role, content in reversed(mensagens)]
     
+    def obter_mensagens_apos(self, mensagem_id: int, limite: int = None) -> List[Dict]:
+        """
+        Obtém as mensagens posteriores a um id, em ordem cronológica
+        
+        Args:
+            mensagem_id: id da última mensagem já conhecida (0 = todas)
+            limite: se informado, só as N mais recentes
+        
+        Returns:
+            Lista de dicionários com id, role e content
+        """
+        self.cursor.execute("""
+            SELECT id, role, content FROM historico
+            WHERE id > ?
+            ORDER BY id DESC
+            LIMIT ?
+        """, (mensagem_id, -1 if limite is None else limite))
+        
+        mensagens = self.cursor.fetchall()
+        return [{"id": id_msg, "role": role, "content": content}
+                for id_msg, role, content in reversed(mensagens)]
+    
     def limpar_historico(self):
-        """Limpa todo o histórico de conversas"""
+        """Limpa todo o histórico de conversas (e os resumos dele)"""
         self.cursor.execute("DELETE FROM historico")
+        self.cursor.execute("DELETE FROM resumos")
         self.conn.commit()
         print("🗑️ Histórico de conversas limpo")
     
@@ -158,6 +194,48 @@ class JarvisMemoria:
             "primeira_mensagem": primeira
         }
     
+    # ========== RESUMOS ==========
+    
+    def salvar_resumo(self, conteudo: str, ate_mensagem: int) -> bool:
+        """
+        Salva uma nova versão do resumo
+        
+        Só grava se a mensagem ate_mensagem ainda existe: um resumo feito
+        antes de limpar_historico() não pode trazer a memória de volta
+        (os ids não são reaproveitados, então a checagem é segura)
+        
+        Args:
+            conteudo: resumo de todas as mensagens até ate_mensagem
+            ate_mensagem: id da última mensagem incluída no resumo
+        
+        Returns:
+            True se o resumo foi salvo
+        """
+        self.cursor.execute("""
+            INSERT INTO resumos (conteudo, ate_mensagem, data_criacao)
+            SELECT ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM historico WHERE id = ?)
+        """, (conteudo, ate_mensagem, datetime.now().isoformat(), ate_mensagem))
+        self.conn.commit()
+        return self.cursor.rowcount > 0
+    
+    def obter_resumo(self) -> Optional[Dict]:
+        """
+        Obtém o resumo mais recente
+        
+        Returns:
+            {"conteudo", "ate_mensagem"} ou None se ainda não há resumo
+        """
+        self.cursor.execute("""
+            SELECT conteudo, ate_mensagem FROM resumos
+            ORDER BY id DESC
+            LIMIT 1
+        """)
+        resultado = self.cursor.fetchone()
+        if not resultado:
+            return None
+        return {"conteudo": resultado[0], "ate_mensagem": resultado[1]}
+    
     # ========== SESSÕES ==========
     
     def iniciar_sessao(self) -> int:
@@ -257,6 +335,12 @@ if __name__ == "__main__":
     historico = memoria.obter_historico_recente(5)
     print(f"Histórico: {len(historico)} mensagens")
     
+    # Testa resumo
+    ultima = memoria.obter_mensagens_apos(0, limite=1)[-1]
+    memoria.salvar_resumo("João cumprimentou o JARVIS.", ultima["id"])
+    print(f"Resumo: {memoria.obter_resumo()}")
+    print(f"Depois do resumo: {len(memoria.obter_mensagens_apos(ultima['id']))} mensagens")
+    
     # Testa saudação
     print(memoria.obter_saudacao_contextual("João"))
     
@@ -0,0 +1,107 @@
+"""
+Estimador de Ruído de Fundo do JARVIS
+Acompanha continuamente o nível de ruído do ambiente e publica os
+limiares de fala e de interrupção (sem calibração a cada turno)
+"""
+
+import numpy as np
+
+
+def calcular_rms(amostras: np.ndarray) -> float:
+    """RMS de um quadro int16 (mesma medida do energy_threshold do SpeechRecognition)"""
+    if not len(amostras):
+        return 0.0
+    amostras = amostras.astype(np.float32)
+    return float(np.sqrt(np.mean(amostras * amostras)))
+
+
+class EstimadorRuido:
+    """
+    Estimativa contínua do piso de ruído
+
+    - Guarda o RMS dos quadros recentes num vetor circular pré-alocado
+    - Piso = percentil baixo da janela (ignora a fala, que é intermitente)
+    - Suavização exponencial (EMA) para o limiar não "pular"
+    - Limiares publicados como atributos: limiar_fala e limiar_interrupcao
+    """
+
+    def __init__(self, janela_quadros: int = 150, percentil: float = 20,
+                 alfa: float = 0.05, fator_fala: float = 2.5,
+                 fator_interrupcao: float = 6.0, limiar_fala_minimo: float = 100,
+                 limiar_interrupcao_minimo: float = 1500):
+        """
+        Args:
+            janela_quadros: quantos quadros recentes entram na estimativa
+            percentil: percentil do RMS usado como piso de ruído
+            alfa: peso da EMA (0-1, maior = adapta mais rápido)
+            fator_fala: limiar de fala = piso * fator_fala
+            fator_interrupcao: limiar de interrupção = piso * fator_interrupcao
+            limiar_fala_minimo: limiar de fala nunca fica abaixo disso
+            limiar_interrupcao_minimo: limiar de interrupção nunca fica abaixo disso
+        """
+        self.percentil = percentil
+        self.alfa = alfa
+        self.fator_fala = fator_fala
+        self.fator_interrupcao = fator_interrupcao
+        self.limiar_fala_minimo = limiar_fala_minimo
+        self.limiar_interrupcao_minimo = limiar_interrupcao_minimo
+
+        self._niveis = np.zeros(janela_quadros, dtype=np.float32)
+        self._posicao = 0
+        self._preenchidos = 0
+
+        self.piso = None
+        self.limiar_fala = limiar_fala_minimo
+        self.limiar_interrupcao = limiar_interrupcao_minimo
+
+    def atualizar(self, amostras: np.ndarray) -> float:
+        """
+        Adiciona um quadro de ruído/ambiente à estimativa
+
+        Args:
+            amostras: quadro int16 capturado (fora da fala do JARVIS)
+
+        Returns:
+            RMS do quadro
+        """
+        nivel = calcular_rms(amostras)
+
+        self._niveis[self._posicao] = nivel
+        self._posicao = (self._posicao + 1) % len(self._niveis)
+        self._preenchidos = min(self._preenchidos + 1, len(self._niveis))
+
+        estimativa = float(np.percentile(self._niveis[:self._preenchidos], self.percentil))
+
+        if self.piso is None:
+            self.piso = estimativa
+        else:
+            # Enquanto a janela enche, adapta mais rápido
+            alfa = max(self.alfa, 1.0 / self._preenchidos)
+            self.piso += alfa * (estimativa - self.piso)
+
+        self.limiar_fala = max(self.limiar_fala_minimo, self.piso * self.fator_fala)
+        self.limiar_interrupcao = max(self.limiar_interrupcao_minimo, self.piso * self.fator_interrupcao)
+        return nivel
+
+
+# Teste rápido
+if __name__ == "__main__":
+    print("🧪 Testando estimador de ruído...")
+
+    rng = np.random.default_rng(0)
+    estimador = EstimadorRuido(limiar_interrupcao_minimo=0)
+
+    # Escritório silencioso
+    for _ in range(100):
+        estimador.atualizar((rng.normal(0, 50, 1024)).astype(np.int16))
+    print(f"Silencioso: piso={estimador.piso:.0f} fala={estimador.limiar_fala:.0f}")
+    silencioso = estimador.piso
+
+    # Ambiente fica barulhento (com fala intermitente por cima)
+    for i in range(300):
+        desvio = 2000 if i % 10 == 0 else 300
+        estimador.atualizar((rng.normal(0, desvio, 1024)).astype(np.int16))
+    print(f"Barulhento: piso={estimador.piso:.0f} fala={estimador.limiar_fala:.0f}")
+    assert estimador.piso > 3 * silencioso
+
+    print("✅ Teste concluído!")
@@ -1,61 +1,105 @@
 """
 Orquestrador de Tools para JARVIS v4/v5
 Carrega e gerencia ferramentas de forma modular
-Cada ferramenta está em seu próprio arquivo na pasta tools/
+Cada ferramenta está em seu próprio arquivo na pasta tools/ e só é
+importada na primeira chamada (metadados vêm do manifesto)
 """
 
 import json
 import sys
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
-# Importa todas as ferramentas
-from tools import (
-    FerramentaHora,
-    FerramentaClima,
-    FerramentaBuscarWeb,
-    FerramentaSistemaArquivos
-)
+from tools.cache_ferramentas import CacheResultados
+from tools.pool_processos import ErroProcesso, PoolProcessos
+from tools.registro_ferramentas import carregar_registro
+
+
+PRAZO_PADRAO = 10.0  # Segundos para ferramentas que não declaram prazo()
+
+# Códigos de erro do modo JSON-RPC (-32xxx são os reservados pela especificação)
+ERRO_JSON_INVALIDO = -32700
+ERRO_REQUISICAO_INVALIDA = -32600
+ERRO_METODO_DESCONHECIDO = -32601
+ERRO_FERRAMENTA = -32000
+CODIGOS_ERRO = {"timeout": -32001, "cancelled": -32002}
 
 
 class OrquestradorDeTools:
     """
     Orquestrador de Ferramentas para JARVIS
     
-    Carrega ferramentas dinamicamente e gerencia comunicação via stdin/stdout
+    Carrega ferramentas sob demanda e gerencia comunicação via stdin/stdout
     
     Protocolo:
     - Cliente envia JSON: {"method": "call_tool", "params": {"name": "tool_name", "arguments": {...}}}
     - Servidor responde JSON: {"result": ..., "error": None} ou {"result": None, "error": "mensagem"}
+    - {"method": "cache_stats"} devolve acertos/faltas do cache de resultados
+    
+    Modo JSON-RPC 2.0 (mensagens com "jsonrpc": "2.0" e "id"):
+    - Várias requisições em andamento ao mesmo tempo; as respostas saem
+      na ordem em que ficam prontas, cada uma com o "id" do pedido
+    - Sucesso: {"jsonrpc": "2.0", "id": 7, "result": ...}
+    - Erro: {"jsonrpc": "2.0", "id": 7, "error": {"code": -32001, "message": ..., "data": {"error_code": "timeout"}}}
+    - {"method": "cancel", "params": {"id": 7}} cancela a chamada 7
+    - Linhas sem "jsonrpc" seguem o protocolo antigo (uma por vez, em ordem)
+    
+    Cache: cada ferramenta pode declarar ttl_cache(resultado) -> segundos
+    (0 = não guarda este resultado). Sem o método a ferramenta nunca passa
+    pelo cache - nem consulta, nem conta nas estatísticas.
+    
+    Execução: as ferramentas rodam num pool de threads. Cada uma pode
+    declarar prazo() -> segundos (padrão PRAZO_PADRAO); passado o prazo
+    a resposta é {"result": None, "error": ..., "error_code": "timeout"}
+    mesmo que a ferramenta continue presa. cancelar_chamadas() encerra
+    as chamadas em andamento com "error_code": "cancelled".
+    
+    Com processos > 0 as ferramentas executam num PoolProcessos (processos
+    já com os módulos importados): a ferramenta não disputa o GIL com o
+    processo principal, estourar o prazo mata o processo dela, e uma
+    ferramenta que derruba o processo vira "error_code": "crashed".
     """
     
-    def __init__(self):
-        """Inicializa o servidor e registra todas as ferramentas"""
+    def __init__(self, capacidade_cache: int = 256, caminho_cache: Optional[str] = None,
+                 max_paralelo: int = 8, processos: int = 0):
+        """
+        Inicializa o servidor e registra todas as ferramentas
+        
+        Args:
+            capacidade_cache: resultados guardados no máximo (LRU)
+            caminho_cache: arquivo SQLite para o cache sobreviver a reinícios (opcional)
+            max_paralelo: ferramentas executando ao mesmo tempo
+            processos: tamanho do pool de processos (0 = executa nas threads)
+        """
         self.ferramentas = {}
+        self.cache = CacheResultados(capacidade_cache, caminho_cache)
+        self._executor = ThreadPoolExecutor(max_workers=max_paralelo, thread_name_prefix="ferramenta")
+        self._lock = threading.Lock()
+        self._em_andamento = {}  # Future da resposta -> (Future do trabalho, temporizador)
+        self.prazos_esgotados = 0
+        self.chamadas_canceladas = 0
+        # Saída do protocolo (stdio): usada por processar_rpc() mesmo fora do executar()
+        self._saida = sys.stdout
+        self._lock_saida = threading.Lock()
+        self._chamadas_rpc = {}  # id JSON-RPC -> Future da resposta
+        self._cliente_rpc = False  # O cliente já falou JSON-RPC
         self._registrar_ferramentas()
+        self.pool = None
+        if processos > 0:
+            modulos = sorted({ferramenta.modulo for ferramenta in self.ferramentas.values()})
+            self.pool = PoolProcessos(processos, modulos)
     
     def _registrar_ferramentas(self):
-        """Registra todas as ferramentas disponíveis"""
-        # Lista de classes de ferramentas
-        classes_ferramentas = [
-            FerramentaHora,
-            FerramentaClima,
-            FerramentaBuscarWeb,
-        ]
-        
-        # Adiciona ferramentas de sistema de arquivos
-        classes_ferramentas.extend(FerramentaSistemaArquivos.obter_todas())
-        
-        # Registra cada ferramenta
-        for classe_ferramenta in classes_ferramentas:
-            nome = classe_ferramenta.nome()
-            self.ferramentas[nome] = classe_ferramenta
-            
+        """Registra as ferramentas do manifesto (nenhum módulo é importado aqui)"""
+        self.ferramentas = carregar_registro()
         print(f"✅ {len(self.ferramentas)} ferramentas registradas", file=sys.stderr)
     
     def chamar_ferramenta(self, nome: str, argumentos: Dict[str, Any]) -> Dict[str, Any]:
         """
         Chama uma ferramenta pelo nome com os argumentos fornecidos
+        (bloqueia no máximo o prazo da ferramenta)
         
         Args:
             nome: nome da ferramenta
@@ -64,16 +108,118 @@ class OrquestradorDeTools:
         Returns:
             Dicionário com result e error
         """
+        return self.chamar_ferramenta_async(nome, argumentos).result()
+    
+    def chamar_ferramenta_async(self, nome: str, argumentos: Dict[str, Any]) -> Future:
+        """
+        Começa a executar uma ferramenta sem esperar por ela
+        
+        Returns:
+            Future que termina com o dicionário de result e error - sempre
+            até o prazo da ferramenta (timeout) ou até cancelar_chamadas()
+        """
+        resposta = Future()
+        
         if nome not in self.ferramentas:
-            return {
+            resposta.set_result({
                 "result": None,
                 "error": f"Ferramenta '{nome}' não encontrada. Disponíveis: {list(self.ferramentas.keys())}"
-            }
+            })
+            return resposta
         
         try:
-            classe_ferramenta = self.ferramentas[nome]
-            resultado = classe_ferramenta.executar(**argumentos)
+            classe_ferramenta = self.ferramentas[nome].classe  # Importa na primeira chamada
+        except Exception as e:
+            resposta.set_result({"result": None, "error": f"Erro ao carregar {nome}: {str(e)}"})
+            return resposta
+        
+        if getattr(classe_ferramenta, "ttl_cache", None) is not None:
+            encontrado, resultado = self.cache.obter(nome, argumentos)
+            if encontrado:
+                resposta.set_result({"result": resultado, "error": None})
+                return resposta
+        
+        prazo = getattr(classe_ferramenta, "prazo", lambda: PRAZO_PADRAO)()
+        estouro = {
+            "result": None,
+            "error": f"A ferramenta {nome} não respondeu em {prazo:g} segundos",
+            "error_code": "timeout"
+        }
+        
+        # Registra antes de o trabalho poder terminar (o callback procura a entrada)
+        with self._lock:
+            trabalho = self._executor.submit(self._executar, nome, classe_ferramenta, argumentos, prazo)
+            temporizador = threading.Timer(prazo, self._resolver, (resposta, estouro))
+            temporizador.daemon = True
+            self._em_andamento[resposta] = (trabalho, temporizador)
+        temporizador.start()
+        trabalho.add_done_callback(
+            lambda feito: feito.cancelled() or self._resolver(resposta, feito.result())
+        )
+        return resposta
+    
+    def _resolver(self, resposta: Future, conteudo: Dict[str, Any]) -> bool:
+        """Entrega a resposta de uma chamada (só a primeira entrega vale)"""
+        with self._lock:
+            entrada = self._em_andamento.pop(resposta, None)
+            if entrada is None:
+                return False
+            if conteudo.get("error_code") == "timeout":
+                self.prazos_esgotados += 1
+            elif conteudo.get("error_code") == "cancelled":
+                self.chamadas_canceladas += 1
+        
+        trabalho, temporizador = entrada
+        temporizador.cancel()
+        trabalho.cancel()  # Só tem efeito se ainda não começou
+        resposta.set_result(conteudo)
+        return True
+    
+    def cancelar_chamadas(self) -> int:
+        """
+        Encerra todas as chamadas em andamento (ex.: usuário interrompeu)
+        
+        A thread de uma ferramenta já em execução não pode ser morta; ela
+        termina sozinha e o resultado é descartado.
+        
+        Returns:
+            Quantidade de chamadas canceladas
+        """
+        with self._lock:
+            pendentes = list(self._em_andamento)
+        return sum(self.cancelar_chamada(resposta) for resposta in pendentes)
+    
+    def cancelar_chamada(self, resposta: Future) -> bool:
+        """
+        Cancela uma chamada feita com chamar_ferramenta_async()
+        
+        Returns:
+            True se ela ainda estava em andamento
+        """
+        return self._resolver(resposta, {"result": None, "error": "Chamada cancelada", "error_code": "cancelled"})
+    
+    def _executar(self, nome: str, classe_ferramenta, argumentos: Dict[str, Any],
+                  prazo: float) -> Dict[str, Any]:
+        """Executa a ferramenta (roda no pool) e guarda o resultado no cache"""
+        ttl_cache = getattr(classe_ferramenta, "ttl_cache", None)
+        try:
+            if self.pool is not None:
+                resultado = self.pool.executar(
+                    classe_ferramenta.__module__, classe_ferramenta.__name__, argumentos, prazo
+                )
+            else:
+                resultado = classe_ferramenta.executar(**argumentos)
+            if ttl_cache is not None:
+                self.cache.guardar(nome, argumentos, resultado, ttl_cache(resultado))
             return {"result": resultado, "error": None}
+        except TimeoutError:
+            return {
+                "result": None,
+                "error": f"A ferramenta {nome} não respondeu em {prazo:g} segundos",
+                "error_code": "timeout"
+            }
+        except ErroProcesso as e:
+            return {"result": None, "error": str(e), "error_code": "crashed"}
         except TypeError as e:
             return {
                 "result": None,
@@ -94,16 +240,53 @@ class OrquestradorDeTools:
         """
         lista = []
         
-        for nome, classe_ferramenta in self.ferramentas.items():
+        for nome, ferramenta in self.ferramentas.items():
             info = {
                 "name": nome,
-                "description": classe_ferramenta.descricao(),
-                "parameters": classe_ferramenta.parametros()
+                "description": ferramenta.descricao,
+                "parameters": ferramenta.parametros
             }
             lista.append(info)
         
         return lista
     
+    def obter_ferramentas_openai(self) -> List[Dict]:
+        """
+        Retorna as ferramentas no formato do parâmetro `tools` da API da OpenAI
+        
+        Cada parâmetro vira uma propriedade do JSON Schema; os que não são
+        "optional" entram em "required".
+        
+        Returns:
+            Lista de {"type": "function", "function": {...}}
+        """
+        lista = []
+        
+        for info in self.obter_lista_ferramentas():
+            propriedades = {}
+            obrigatorios = []
+            for nome_param, definicao in info["parameters"].items():
+                propriedades[nome_param] = {
+                    chave: valor for chave, valor in definicao.items() if chave != "optional"
+                }
+                if not definicao.get("optional"):
+                    obrigatorios.append(nome_param)
+            
+            lista.append({
+                "type": "function",
+                "function": {
+                    "name": info["name"],
+                    "description": info["description"],
+                    "parameters": {
+                        "type": "object",
+                        "properties": propriedades,
+                        "required": obrigatorios
+                    }
+                }
+            })
+        
+        return lista
+    
     def processar_requisicao(self, requisicao: Dict[str, Any]) -> Dict[str, Any]:
         """
         Processa uma requisição do orquestrador
@@ -120,6 +303,9 @@ class OrquestradorDeTools:
         if metodo == "list_tools":
             return {"result": self.obter_lista_ferramentas(), "error": None}
         
+        elif metodo == "cache_stats":
+            return {"result": self.estatisticas_cache(), "error": None}
+        
         elif metodo == "call_tool":
             nome = parametros.get("name")
             argumentos = parametros.get("arguments", {})
@@ -128,37 +314,145 @@ class OrquestradorDeTools:
         else:
             return {"result": None, "error": f"Método '{metodo}' não reconhecido"}
     
+    def _responder(self, mensagem: Dict[str, Any]) -> None:
+        """Escreve uma linha de resposta (várias threads respondem no modo JSON-RPC)"""
+        linha = json.dumps(mensagem, ensure_ascii=False)
+        with self._lock_saida:
+            self._saida.write(linha + "\n")
+            self._saida.flush()
+    
+    def _responder_rpc(self, id_requisicao: Any, resposta: Dict[str, Any]) -> None:
+        """Converte {"result", "error"} para o formato JSON-RPC e responde"""
+        mensagem = {"jsonrpc": "2.0", "id": id_requisicao}
+        if resposta.get("error"):
+            codigo = resposta.get("error_code")
+            mensagem["error"] = {"code": CODIGOS_ERRO.get(codigo, ERRO_FERRAMENTA), "message": resposta["error"]}
+            if codigo:
+                mensagem["error"]["data"] = {"error_code": codigo}
+        else:
+            mensagem["result"] = resposta.get("result")
+        self._responder(mensagem)
+    
+    def _erro_rpc(self, id_requisicao: Any, codigo: int, mensagem: str) -> None:
+        self._responder({"jsonrpc": "2.0", "id": id_requisicao, "error": {"code": codigo, "message": mensagem}})
+    
+    def processar_rpc(self, requisicao: Dict[str, Any]) -> None:
+        """
+        Processa uma requisição JSON-RPC sem bloquear
+        
+        call_tool responde quando a ferramenta termina (pela thread que a
+        concluiu); os demais métodos respondem na hora
+        """
+        id_requisicao = requisicao.get("id")
+        metodo = requisicao.get("method")
+        parametros = requisicao.get("params") or {}
+        
+        if id_requisicao is None or not isinstance(metodo, str) or not isinstance(parametros, dict):
+            self._erro_rpc(id_requisicao, ERRO_REQUISICAO_INVALIDA, "Requisição precisa de 'id', 'method' e 'params' (objeto)")
+            return
+        
+        if metodo == "call_tool":
+            with self._lock_saida:
+                if id_requisicao in self._chamadas_rpc:
+                    repetido = True
+                else:
+                    repetido = False
+                    self._chamadas_rpc[id_requisicao] = None  # Reserva o id
+            if repetido:
+                self._erro_rpc(id_requisicao, ERRO_REQUISICAO_INVALIDA, f"Já existe uma chamada com id {id_requisicao!r}")
+                return
+            
+            resposta = self.chamar_ferramenta_async(parametros.get("name"), parametros.get("arguments") or {})
+            with self._lock_saida:
+                self._chamadas_rpc[id_requisicao] = resposta
+            
+            def concluir(feito):
+                with self._lock_saida:
+                    self._chamadas_rpc.pop(id_requisicao, None)
+                self._responder_rpc(id_requisicao, feito.result())
+            
+            resposta.add_done_callback(concluir)
+        
+        elif metodo == "cancel":
+            with self._lock_saida:
+                resposta = self._chamadas_rpc.get(parametros.get("id"))
+            cancelada = resposta is not None and self.cancelar_chamada(resposta)
+            self._responder({"jsonrpc": "2.0", "id": id_requisicao, "result": cancelada})
+        
+        elif metodo in ("list_tools", "cache_stats"):
+            self._responder_rpc(id_requisicao, self.processar_requisicao(requisicao))
+        
+        else:
+            self._erro_rpc(id_requisicao, ERRO_METODO_DESCONHECIDO, f"Método '{metodo}' não reconhecido")
+    
     def executar(self):
         """
         Loop principal do servidor - lê stdin, processa, escreve stdout
         """
+        # stdout é só do protocolo: prints das ferramentas vão para stderr
+        self._saida = sys.stdout
+        sys.stdout = sys.stderr
+        
         # Envia mensagem de inicialização
         mensagem_init = {
             "status": "ready",
-            "tools": list(self.ferramentas.keys())
+            "tools": list(self.ferramentas.keys()),
+            "protocols": ["legacy", "jsonrpc"]
         }
-        print(json.dumps(mensagem_init, ensure_ascii=False), flush=True)
+        self._responder(mensagem_init)
         
         # Loop de processamento
-        for linha in sys.stdin:
-            try:
-                requisicao = json.loads(linha.strip())
-                resposta = self.processar_requisicao(requisicao)
-                print(json.dumps(resposta, ensure_ascii=False), flush=True)
-            except json.JSONDecodeError as e:
-                resposta_erro = {
-                    "result": None,
-                    "error": f"JSON inválido: {str(e)}"
-                }
-                print(json.dumps(resposta_erro, ensure_ascii=False), flush=True)
-            except Exception as e:
-                resposta_erro = {
-                    "result": None,
-                    "error": f"Erro interno: {str(e)}"
-                }
-                print(json.dumps(resposta_erro, ensure_ascii=False), flush=True)
+        try:
+            for linha in sys.stdin:
+                if not linha.strip():
+                    continue
+                try:
+                    requisicao = json.loads(linha.strip())
+                    if isinstance(requisicao, dict) and requisicao.get("jsonrpc") == "2.0":
+                        self._cliente_rpc = True
+                        self.processar_rpc(requisicao)
+                    else:
+                        self._responder(self.processar_requisicao(requisicao))
+                except json.JSONDecodeError as e:
+                    if self._cliente_rpc or '"jsonrpc"' in linha:
+                        # Sem JSON não há id: a especificação manda responder com id null
+                        self._erro_rpc(None, ERRO_JSON_INVALIDO, f"JSON inválido: {str(e)}")
+                        continue
+                    resposta_erro = {
+                        "result": None,
+                        "error": f"JSON inválido: {str(e)}"
+                    }
+                    self._responder(resposta_erro)
+                except Exception as e:
+                    resposta_erro = {
+                        "result": None,
+                        "error": f"Erro interno: {str(e)}"
+                    }
+                    self._responder(resposta_erro)
+            
+            # Fim da entrada: responde o que ainda está rodando (no máximo até o prazo)
+            with self._lock_saida:
+                pendentes = [r for r in self._chamadas_rpc.values() if r is not None]
+            for resposta in pendentes:
+                resposta.result()
+        finally:
+            sys.stdout = self._saida
+            self.fechar()
+    
+    def estatisticas_cache(self) -> Dict[str, Any]:
+        """Acertos/faltas do cache de resultados (total e por ferramenta)"""
+        return self.cache.estatisticas()
+    
+    def fechar(self):
+        """Cancela chamadas pendentes e libera o pool e o cache"""
+        self.cancelar_chamadas()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self.pool is not None:
+            self.pool.fechar()
+        self.cache.fechar()
 
 
 if __name__ == "__main__":
-    orquestrador = OrquestradorDeTools()
+    # python -m tools.orquestrador_tools [processos]
+    orquestrador = OrquestradorDeTools(processos=int(sys.argv[1]) if len(sys.argv) > 1 else 0)
     orquestrador.executar()
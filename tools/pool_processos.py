@@ -0,0 +1,336 @@
+"""
+Pool de Processos para Ferramentas do JARVIS
+Executa as ferramentas em processos separados, já aquecidos (módulos das
+ferramentas importados) - uma ferramenta pesada não disputa o GIL com a
+captura de áudio e uma que quebra não derruba o assistente
+"""
+
+import importlib
+import multiprocessing
+import queue
+import signal
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+try:
+    import resource  # Só existe em sistemas POSIX
+except ImportError:
+    resource = None
+
+
+MAX_CHAMADAS_PROCESSO = 200       # Chamadas antes de trocar o processo por um novo
+LIMITE_MEMORIA_PROCESSO_MB = 256  # Crescimento de memória que força a troca
+ESPERA_MAXIMA_REPOSICAO = 30      # Segundos máximos entre tentativas de criar um processo
+
+
+class ErroProcesso(Exception):
+    """O processo da ferramenta morreu no meio da chamada"""
+
+
+def _memoria_kb() -> int:
+    """Pico de memória do processo atual em KB (0 sem o módulo resource)"""
+    if resource is None:
+        return 0
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB; macOS em bytes
+    return pico // 1024 if sys.platform == "darwin" else pico
+
+
+def _trabalhador(conexao, modulos: Sequence[str]) -> None:
+    """Laço do processo filho: recebe (módulo, classe, argumentos), devolve (ok, valor, memória)"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C é tratado pelo processo principal
+
+    for modulo in modulos:  # Já vêm carregados do forkserver; no spawn, aquece aqui
+        try:
+            importlib.import_module(modulo)
+        except Exception:
+            pass  # A ferramenta devolve o erro quando for chamada
+
+    while True:
+        try:
+            pedido = conexao.recv()
+        except (EOFError, OSError):
+            return
+        if pedido is None:
+            return
+
+        modulo, classe, argumentos = pedido
+        try:
+            valor = getattr(importlib.import_module(modulo), classe).executar(**argumentos)
+            ok = True
+        except Exception as e:
+            valor, ok = e, False
+
+        try:
+            conexao.send((ok, valor, _memoria_kb()))
+        except Exception as e:  # Resultado/exceção que não dá para serializar
+            conexao.send((False, RuntimeError(f"{type(valor).__name__}: {e}"), _memoria_kb()))
+
+
+class _Processo:
+    """Um processo do pool visto pelo processo principal"""
+
+    def __init__(self, contexto, modulos: Sequence[str]):
+        self.conexao, conexao_filho = contexto.Pipe()
+        self.processo = contexto.Process(target=_trabalhador, args=(conexao_filho, list(modulos)),
+                                         daemon=True, name="ferramenta")
+        self.processo.start()
+        conexao_filho.close()
+        self.chamadas = 0
+        self.memoria_inicial = None
+
+    def encerrar(self, forcar: bool = False) -> None:
+        if not forcar:
+            try:
+                self.conexao.send(None)
+                self.processo.join(1)
+            except (OSError, ValueError):
+                pass
+        if self.processo.is_alive():
+            self.processo.kill()
+            self.processo.join(1)
+        self.conexao.close()
+
+
+class PoolProcessos:
+    """
+    Processos pré-criados que executam ferramentas
+
+    - Cada processo nasce com os módulos das ferramentas já importados
+      (forkserver com pré-carga; spawn onde não há forkserver)
+    - Os processos sobem numa thread em segundo plano: criar o pool não
+      espera nenhum import; a primeira chamada espera o primeiro processo
+    - Troca o processo depois de `max_chamadas` ou se a memória dele
+      crescer mais que `limite_memoria_mb` (requer o módulo resource)
+    - Passado o prazo, o processo é morto e trocado (TimeoutError)
+    - Processo que morre devolve ErroProcesso; o pool repõe outro (se
+      criar o substituto falhar, tenta de novo em segundo plano)
+    """
+
+    def __init__(self, processos: int = 2, modulos: Sequence[str] = (),
+                 max_chamadas: int = MAX_CHAMADAS_PROCESSO,
+                 limite_memoria_mb: float = LIMITE_MEMORIA_PROCESSO_MB):
+        """
+        Args:
+            processos: quantidade de processos
+            modulos: módulos importados de início em cada processo
+            max_chamadas: chamadas por processo antes da troca
+            limite_memoria_mb: crescimento de memória tolerado por processo
+        """
+        metodos = multiprocessing.get_all_start_methods()
+        if "forkserver" in metodos:
+            self._contexto = multiprocessing.get_context("forkserver")
+            self._contexto.set_forkserver_preload(list(modulos))
+        else:
+            self._contexto = multiprocessing.get_context("spawn")
+
+        self.modulos = list(modulos)
+        self.max_chamadas = max_chamadas
+        self.limite_memoria_kb = limite_memoria_mb * 1024
+        self._livres = queue.Queue()
+        self._lock = threading.Lock()
+        self._todos = set()
+        self._fechado = False
+
+        self.chamadas = 0
+        self.reciclados = 0
+        self.mortos_por_prazo = 0
+        self.quebras = 0
+
+        threading.Thread(target=self._iniciar, args=(processos,), daemon=True,
+                         name="pool-processos").start()
+
+    def _iniciar(self, processos: int) -> None:
+        """Sobe os processos, tentando de novo os que falharem (thread em segundo plano)"""
+        espera = 1.0
+        while processos > 0 and not self._fechado:
+            try:
+                self._devolver(self._novo())
+                processos -= 1
+                espera = 1.0
+            except Exception as e:
+                print(f"❌ Erro ao iniciar processo de ferramentas: {e} "
+                      f"(nova tentativa em {espera:g}s)", file=sys.stderr)
+                time.sleep(espera)
+                espera = min(espera * 2, ESPERA_MAXIMA_REPOSICAO)
+
+    def _novo(self) -> _Processo:
+        processo = _Processo(self._contexto, self.modulos)
+        with self._lock:
+            self._todos.add(processo)
+        return processo
+
+    def _descartar(self, processo: _Processo, forcar: bool) -> None:
+        with self._lock:
+            self._todos.discard(processo)
+        processo.encerrar(forcar)
+
+    def _devolver(self, processo: Optional[_Processo]) -> None:
+        """Volta o processo para a fila de livres (None: não há o que devolver)"""
+        if processo is None:
+            return
+        if self._fechado:
+            self._descartar(processo, forcar=True)
+            return
+        self._livres.put(processo)
+
+    def _trocar(self, processo: _Processo, forcar: bool) -> Optional[_Processo]:
+        """
+        Encerra o processo e cria o substituto
+
+        Returns:
+            O substituto, ou None se não deu para criá-lo agora (a reposição
+            continua em segundo plano - o processo encerrado nunca volta à fila)
+        """
+        self._descartar(processo, forcar)
+        try:
+            return self._novo()
+        except Exception as e:
+            print(f"❌ Erro ao repor processo de ferramentas: {e}", file=sys.stderr)
+            threading.Thread(target=self._iniciar, args=(1,), daemon=True,
+                             name="pool-processos").start()
+            return None
+
+    def executar(self, modulo: str, classe: str, argumentos: Dict[str, Any], prazo: float) -> Any:
+        """
+        Executa classe.executar(**argumentos) num processo do pool
+
+        Raises:
+            TimeoutError: passou do prazo (o processo foi morto) ou nenhum
+                          processo ficou livre dentro dele
+            ErroProcesso: o processo morreu durante a chamada
+            Exception: a exceção levantada pela ferramenta
+        """
+        try:
+            processo = self._livres.get(timeout=prazo)
+        except queue.Empty:
+            raise TimeoutError(f"Nenhum processo livre para {classe} em {prazo:g} segundos") from None
+        try:
+            try:
+                processo.conexao.send((modulo, classe, argumentos))
+                resposta = processo.conexao.recv() if processo.conexao.poll(prazo) else None
+            except (EOFError, OSError) as e:
+                processo.processo.join(1)
+                codigo = processo.processo.exitcode
+                self.quebras += 1
+                processo = self._trocar(processo, forcar=True)
+                raise ErroProcesso(f"O processo de {classe} terminou inesperadamente (código {codigo})") from e
+
+            if resposta is None:
+                self.mortos_por_prazo += 1
+                processo = self._trocar(processo, forcar=True)
+                raise TimeoutError(f"{classe} não terminou em {prazo:g} segundos")
+
+            ok, valor, memoria = resposta
+            self.chamadas += 1
+            processo.chamadas += 1
+            if processo.memoria_inicial is None:
+                processo.memoria_inicial = memoria
+            if (processo.chamadas >= self.max_chamadas
+                    or memoria - processo.memoria_inicial > self.limite_memoria_kb):
+                self.reciclados += 1
+                processo = self._trocar(processo, forcar=False)
+        finally:
+            self._devolver(processo)
+
+        if ok:
+            return valor
+        raise valor
+
+    def estatisticas(self) -> dict:
+        return {
+            "processos": len(self._todos),
+            "chamadas": self.chamadas,
+            "reciclados": self.reciclados,
+            "mortos_por_prazo": self.mortos_por_prazo,
+            "quebras": self.quebras,
+            "memoria_monitorada": resource is not None,
+        }
+
+    def fechar(self) -> None:
+        """Encerra todos os processos (os ocupados são mortos)"""
+        self._fechado = True
+        while True:
+            try:
+                self._descartar(self._livres.get_nowait(), forcar=False)
+            except queue.Empty:
+                break
+        with self._lock:
+            restantes = list(self._todos)
+        for processo in restantes:
+            self._descartar(processo, forcar=True)
+
+
+class _FerramentaTeste:
+    """Ferramenta que se comporta mal de propósito (só para o teste rápido)"""
+
+    @staticmethod
+    def executar(acao: str) -> str:
+        import os
+        import time
+        if acao == "travar":
+            time.sleep(60)
+        elif acao == "quebrar":
+            os._exit(3)
+        elif acao == "erro":
+            raise ValueError("falhou de propósito")
+        return f"ok ({os.getpid()})"
+
+
+# Teste rápido
+if __name__ == "__main__":
+    import time
+
+    print("🧪 Testando pool de processos...")
+
+    pool = PoolProcessos(processos=2, modulos=["tools.hora"], max_chamadas=3)
+    print(f"Hora: {pool.executar('tools.hora', 'FerramentaHora', {'formato': 'hora'}, prazo=10)}")
+
+    pids = {pool.executar("tools.pool_processos", "_FerramentaTeste", {"acao": "ok"}, prazo=10) for _ in range(6)}
+    print(f"Processos usados (reciclando a cada 3): {sorted(pids)}")
+    assert len(pids) > 2 and pool.reciclados > 0
+
+    inicio = time.monotonic()
+    try:
+        pool.executar("tools.pool_processos", "_FerramentaTeste", {"acao": "travar"}, prazo=0.5)
+    except TimeoutError as e:
+        print(f"Prazo: {e} ({time.monotonic() - inicio:.1f}s)")
+
+    try:
+        pool.executar("tools.pool_processos", "_FerramentaTeste", {"acao": "quebrar"}, prazo=10)
+    except ErroProcesso as e:
+        print(f"Quebra isolada: {e}")
+
+    try:
+        pool.executar("tools.pool_processos", "_FerramentaTeste", {"acao": "erro"}, prazo=10)
+    except ValueError as e:
+        print(f"Exceção da ferramenta: {e}")
+
+    # O pool continua atendendo
+    assert pool.executar("tools.pool_processos", "_FerramentaTeste", {"acao": "ok"}, prazo=10).startswith("ok")
+    estatisticas = pool.estatisticas()
+    print(f"Estatísticas: {estatisticas}")
+    assert estatisticas["processos"] == 2 and estatisticas["quebras"] == 1 and estatisticas["mortos_por_prazo"] == 1
+
+    # Falha ao criar o substituto: o processo morto não volta e o pool se repõe
+    novo_original = pool._novo
+
+    def novo_falha_uma_vez():
+        pool._novo = novo_original
+        raise OSError("fork falhou de propósito")
+
+    pool._novo = novo_falha_uma_vez
+    try:
+        pool.executar("tools.pool_processos", "_FerramentaTeste", {"acao": "quebrar"}, prazo=10)
+    except ErroProcesso:
+        pass
+    for _ in range(4):
+        assert pool.executar("tools.pool_processos", "_FerramentaTeste", {"acao": "ok"}, prazo=10).startswith("ok")
+    time.sleep(1.5)
+    print(f"Reposto após falha: {pool.estatisticas()['processos']} processos")
+    assert pool.estatisticas()["processos"] == 2
+
+    pool.fechar()
+    print("✅ Teste concluído!")
@@ -0,0 +1,299 @@
+"""
+Reconhecedor de Chamada de Ferramenta do JARVIS
+Lê a resposta do modelo token a token e decide cedo se ela é fala
+ou uma chamada de ferramenta - nativa (tool_calls da API) ou no
+formato de texto {"tool": ..., "arguments": {...}}
+"""
+
+import json
+from typing import Optional
+
+
+class VarredorJSON:
+    """
+    Acompanha um JSON caractere a caractere (profundidade, strings e escapes)
+    sem reprocessar o que já chegou
+    """
+
+    def __init__(self):
+        self.profundidade = 0
+        self._caracteres = []
+        self._em_string = False
+        self._escape = False
+
+    @property
+    def texto(self) -> str:
+        return "".join(self._caracteres)
+
+    def avancar(self, caractere: str) -> bool:
+        """
+        Consome um caractere
+
+        Returns:
+            True se ele fechou um objeto/lista (fora de string)
+        """
+        self._caracteres.append(caractere)
+
+        if self._em_string:
+            if self._escape:
+                self._escape = False
+            elif caractere == "\\":
+                self._escape = True
+            elif caractere == '"':
+                self._em_string = False
+            return False
+
+        if caractere == '"':
+            self._em_string = True
+        elif caractere in "{[":
+            self.profundidade += 1
+        elif caractere in "}]":
+            self.profundidade -= 1
+            return True
+        return False
+
+
+class ReconhecedorArgumentos:
+    """
+    Argumentos de uma chamada nativa chegando aos poucos
+    (delta.tool_calls[i].function.arguments)
+    """
+
+    def __init__(self):
+        self._varredor = VarredorJSON()
+        self.argumentos = None  # dict quando o objeto fecha
+
+    def adicionar(self, pedaco: str) -> Optional[dict]:
+        """
+        Returns:
+            Os argumentos no pedaço em que o objeto fecha; None nos demais
+        """
+        if self.argumentos is not None:
+            return None
+        for caractere in pedaco:
+            if self._varredor.profundidade == 0 and caractere.isspace():
+                continue
+            if self._varredor.avancar(caractere) and self._varredor.profundidade == 0:
+                self.finalizar()
+                return self.argumentos
+        return None
+
+    def finalizar(self) -> dict:
+        """Interpreta o que chegou ({} se vazio ou inválido)"""
+        if self.argumentos is None:
+            try:
+                argumentos = json.loads(self._varredor.texto or "{}")
+            except ValueError:
+                argumentos = {}
+            self.argumentos = argumentos if isinstance(argumentos, dict) else {}
+        return self.argumentos
+
+
+class ChamadaFerramenta:
+    """Uma chamada de ferramenta montada a partir do fluxo da resposta"""
+
+    def __init__(self, id_chamada: str = None, nome: str = ""):
+        self.id = id_chamada
+        self.nome = nome
+        self._argumentos = ReconhecedorArgumentos()
+        self.execucao = None  # Future da execução no pool
+
+    @classmethod
+    def de_texto(cls, chamada: dict, indice: int) -> "ChamadaFerramenta":
+        """Chamada no formato de texto antigo ({"tool", "arguments"})"""
+        nova = cls(f"chamada_texto_{indice}", chamada["tool"])
+        nova._argumentos.argumentos = chamada["arguments"]
+        return nova
+
+    def receber(self, id_chamada: Optional[str], nome: Optional[str], argumentos: Optional[str]) -> None:
+        """Acrescenta um delta de tool_calls"""
+        if id_chamada:
+            self.id = id_chamada
+        if nome:
+            self.nome += nome
+        if argumentos:
+            self._argumentos.adicionar(argumentos)
+
+    @property
+    def argumentos(self) -> Optional[dict]:
+        return self._argumentos.argumentos
+
+    @property
+    def pronta(self) -> bool:
+        """Nome e argumentos completos - já dá para executar"""
+        return bool(self.nome) and self.argumentos is not None
+
+    def finalizar(self) -> None:
+        """A resposta acabou: usa os argumentos que chegaram"""
+        self._argumentos.finalizar()
+
+    def como_tool_call(self) -> dict:
+        """Formato de tool_calls da mensagem do assistente no histórico"""
+        return {
+            "id": self.id,
+            "type": "function",
+            "function": {
+                "name": self.nome,
+                "arguments": json.dumps(self.argumentos or {}, ensure_ascii=False)
+            }
+        }
+
+
+class ReconhecedorChamada:
+    """
+    Reconhecedor incremental da chamada em texto ({"tool", "arguments"})
+
+    - Decide no primeiro caractere visível: '{' (ou uma cerca ```json)
+      é chamada de ferramenta; qualquer outra coisa é fala
+    - A chamada é entregue assim que "tool" e "arguments" estão
+      completos - em geral quando o objeto "arguments" fecha, antes do
+      modelo terminar a resposta
+    """
+
+    INDEFINIDO = "indefinido"
+    FALA = "fala"
+    FERRAMENTA = "ferramenta"
+
+    def __init__(self):
+        self.tipo = self.INDEFINIDO
+        self.chamada = None  # {"tool": ..., "arguments": {...}} quando pronta
+        self._partes = []
+        self._json = VarredorJSON()  # A partir do '{' de abertura
+        self._cerca = ""             # Prefixo ``` antes do JSON
+
+    @property
+    def texto(self) -> str:
+        """Tudo o que já chegou"""
+        return "".join(self._partes)
+
+    def _decidir(self, caractere: str) -> bool:
+        """Consome prefixo antes do JSON; True quando o '{' de abertura chegou"""
+        if caractere == "{":
+            self.tipo = self.FERRAMENTA
+            return True
+        if caractere.isspace():
+            return False
+        # Cerca de código: ``` seguido opcionalmente de "json"
+        cerca = self._cerca + caractere
+        if "```json".startswith(cerca.lower()):
+            self._cerca = cerca
+            return False
+        self.tipo = self.FALA
+        return False
+
+    def _tentar_chamada(self, candidato: str) -> None:
+        """Tenta interpretar o JSON (completo ou completado com '}')"""
+        try:
+            dados = json.loads(candidato)
+        except ValueError:
+            return
+        if not isinstance(dados, dict) or "tool" not in dados:
+            return
+        if "arguments" not in dados and self._json.profundidade > 0:
+            return  # "arguments" ainda pode vir
+        argumentos = dados.get("arguments", {})
+        if isinstance(argumentos, dict):
+            self.chamada = {"tool": dados["tool"], "arguments": argumentos}
+
+    def adicionar(self, pedaco: str) -> Optional[dict]:
+        """
+        Processa mais um pedaço da resposta
+
+        Returns:
+            A chamada ({"tool", "arguments"}) no pedaço em que ela fica
+            completa; None nos demais
+        """
+        self._partes.append(pedaco)
+        if self.tipo == self.FALA or self.chamada is not None:
+            return None
+
+        for caractere in pedaco:
+            if self.tipo == self.INDEFINIDO:
+                if not self._decidir(caractere):
+                    if self.tipo == self.FALA:
+                        return None
+                    continue
+
+            if not self._json.avancar(caractere):
+                continue
+
+            if self._json.profundidade == 1 and caractere == "}":
+                # Um valor do objeto principal acabou de fechar ("arguments"?)
+                self._tentar_chamada(self._json.texto + "}")
+            elif self._json.profundidade == 0:
+                self._tentar_chamada(self._json.texto)
+                if self.chamada is None:
+                    # JSON que não é chamada: trata como fala
+                    self.tipo = self.FALA
+                    return None
+
+            if self.chamada is not None:
+                return self.chamada
+
+        return None
+
+    def finalizar(self) -> Optional[dict]:
+        """
+        A resposta acabou
+
+        Returns:
+            A chamada, se a resposta era uma (None se era fala ou JSON inválido)
+        """
+        if self.tipo == self.FERRAMENTA and self.chamada is None:
+            self.tipo = self.FALA
+        return self.chamada
+
+
+def reconhecer_chamada(texto: str) -> Optional[dict]:
+    """Reconhece a chamada de ferramenta numa resposta completa"""
+    reconhecedor = ReconhecedorChamada()
+    reconhecedor.adicionar(texto)
+    return reconhecedor.finalizar()
+
+
+# Teste rápido
+if __name__ == "__main__":
+    print("🧪 Testando reconhecedor de chamada...")
+
+    def em_tokens(texto, tamanho=3):
+        reconhecedor = ReconhecedorChamada()
+        for inicio in range(0, len(texto), tamanho):
+            chamada = reconhecedor.adicionar(texto[inicio:inicio + tamanho])
+            if chamada is not None:
+                return reconhecedor, chamada, inicio + tamanho
+        return reconhecedor, reconhecedor.finalizar(), len(texto)
+
+    resposta = '{\n  "tool": "clima",\n  "arguments": {"cidade": "São Paulo"}\n}'
+    reconhecedor, chamada, posicao = em_tokens(resposta)
+    print(f"Chamada: {chamada} (pronta em {posicao}/{len(resposta)} caracteres)")
+    assert chamada == {"tool": "clima", "arguments": {"cidade": "São Paulo"}}
+    assert posicao < len(resposta)
+
+    # Strings com chaves e aspas escapadas não confundem a profundidade
+    _, chamada, _ = em_tokens('{"tool": "buscar_web", "arguments": {"consulta": "o que é \\"{}\\"?"}}')
+    assert chamada["arguments"]["consulta"] == 'o que é "{}"?'
+
+    # "arguments" antes de "tool": só no fim do objeto
+    _, chamada, _ = em_tokens('{"arguments": {"formato": "hora"}, "tool": "hora"}')
+    assert chamada == {"tool": "hora", "arguments": {"formato": "hora"}}
+
+    # Cerca de código
+    _, chamada, _ = em_tokens('```json\n{"tool": "hora", "arguments": {}}\n```')
+    assert chamada == {"tool": "hora", "arguments": {}}
+
+    # Fala decidida no primeiro caractere visível
+    reconhecedor = ReconhecedorChamada()
+    reconhecedor.adicionar("  Ol")
+    assert reconhecedor.tipo == ReconhecedorChamada.FALA
+    assert reconhecer_chamada('{"nota": 10}') is None
+
+    # Chamada nativa: argumentos chegando em pedaços
+    chamada = ChamadaFerramenta()
+    chamada.receber("call_1", "clima", None)
+    for pedaco in ['{"cid', 'ade": "Ri', 'o de Janeiro"', '}']:
+        assert not chamada.pronta
+        chamada.receber(None, None, pedaco)
+    assert chamada.pronta and chamada.argumentos == {"cidade": "Rio de Janeiro"}
+    assert chamada.como_tool_call()["function"]["arguments"] == '{"cidade": "Rio de Janeiro"}'
+
+    print("✅ Teste concluído!")
@@ -0,0 +1,200 @@
+"""
+Registro de Ferramentas do JARVIS
+Manifesto com os metadados de cada ferramenta (nome, descrição,
+parâmetros, onde ela mora) - o módulo da ferramenta só é importado
+na primeira chamada
+"""
+
+import importlib
+import sys
+import threading
+from typing import Dict, List
+
+
+# Mesmos dados de nome()/descricao()/parametros() de cada classe.
+# Ao mudar uma ferramenta, atualize aqui (validar_manifesto() aponta diferenças).
+MANIFESTO = [
+    {
+        "nome": "obter_hora",
+        "descricao": "Retorna a hora/data atual em diferentes formatos",
+        "parametros": {
+            "formato": {
+                "type": "string",
+                "description": "Formato: 'completo' (data e hora), 'hora' (só hora), 'data' (só data)",
+                "default": "completo",
+                "optional": True
+            }
+        },
+        "modulo": "tools.hora",
+        "classe": "FerramentaHora"
+    },
+    {
+        "nome": "obter_clima",
+        "descricao": "Retorna informações de clima em tempo real usando API wttr.in (gratuita)",
+        "parametros": {
+            "cidade": {
+                "type": "string",
+                "description": "Nome da cidade",
+                "default": "São Paulo",
+                "optional": True
+            }
+        },
+        "modulo": "tools.clima",
+        "classe": "FerramentaClima"
+    },
+    {
+        "nome": "buscar_web",
+        "descricao": "Busca informações atualizadas na web sobre qualquer assunto usando Perplexity AI",
+        "parametros": {
+            "consulta": {
+                "type": "string",
+                "description": "Pergunta ou termo para buscar na web"
+            }
+        },
+        "modulo": "tools.buscar_web",
+        "classe": "FerramentaBuscarWeb"
+    },
+    {
+        "nome": "criar_pasta",
+        "descricao": "Cria uma nova pasta no diretório de trabalho (mesa_de_trabalho)",
+        "parametros": {
+            "nome_pasta": {
+                "type": "string",
+                "description": "Nome da pasta a criar"
+            }
+        },
+        "modulo": "tools.sistema_arquivos",
+        "classe": "FerramentaCriarPasta"
+    },
+    {
+        "nome": "criar_arquivo",
+        "descricao": "Cria um novo arquivo no diretório de trabalho com conteúdo opcional",
+        "parametros": {
+            "nome_arquivo": {
+                "type": "string",
+                "description": "Nome do arquivo (ex: 'nota.txt', 'codigo.py')"
+            },
+            "conteudo": {
+                "type": "string",
+                "description": "Conteúdo do arquivo",
+                "default": "",
+                "optional": True
+            }
+        },
+        "modulo": "tools.sistema_arquivos",
+        "classe": "FerramentaCriarArquivo"
+    },
+    {
+        "nome": "listar_arquivos",
+        "descricao": "Lista arquivos e pastas no diretório de trabalho",
+        "parametros": {
+            "pasta": {
+                "type": "string",
+                "description": "Subpasta para listar (padrão: raiz do diretório de trabalho)",
+                "default": ".",
+                "optional": True
+            }
+        },
+        "modulo": "tools.sistema_arquivos",
+        "classe": "FerramentaListarArquivos"
+    },
+]
+
+
+class FerramentaPreguicosa:
+    """
+    Entrada do registro: metadados disponíveis na hora, classe carregada
+    (import do módulo) só quando alguém precisa executar a ferramenta
+    """
+
+    def __init__(self, nome: str, descricao: str, parametros: Dict, modulo: str, classe: str):
+        self.nome = nome
+        self.descricao = descricao
+        self.parametros = parametros
+        self.modulo = modulo
+        self.nome_classe = classe
+        self._classe = None
+        self._lock = threading.Lock()
+
+    @property
+    def carregada(self) -> bool:
+        return self._classe is not None
+
+    @property
+    def classe(self):
+        """Classe da ferramenta (importa o módulo na primeira vez)"""
+        if self._classe is None:
+            with self._lock:
+                if self._classe is None:
+                    classe = getattr(importlib.import_module(self.modulo), self.nome_classe)
+                    for problema in self.comparar(classe):
+                        print(f"⚠️ Manifesto desatualizado: {problema}", file=sys.stderr)
+                    self._classe = classe
+        return self._classe
+
+    def comparar(self, classe) -> List[str]:
+        """Diferenças entre o manifesto e o que a classe declara"""
+        problemas = []
+        if classe.nome() != self.nome:
+            problemas.append(f"{self.nome}: a classe {self.nome_classe} se chama '{classe.nome()}'")
+        if classe.descricao() != self.descricao:
+            problemas.append(f"{self.nome}: descrição diferente da classe")
+        if classe.parametros() != self.parametros:
+            problemas.append(f"{self.nome}: parâmetros diferentes da classe")
+        return problemas
+
+
+def carregar_registro(manifesto: List[Dict] = None) -> Dict[str, FerramentaPreguicosa]:
+    """
+    Monta o registro nome -> FerramentaPreguicosa sem importar nenhuma ferramenta
+
+    Raises:
+        ValueError: entrada sem campo obrigatório ou nome repetido
+    """
+    registro = {}
+    for entrada in manifesto if manifesto is not None else MANIFESTO:
+        faltando = {"nome", "descricao", "parametros", "modulo", "classe"} - set(entrada)
+        if faltando:
+            raise ValueError(f"Entrada do manifesto sem {sorted(faltando)}: {entrada}")
+        if entrada["nome"] in registro:
+            raise ValueError(f"Ferramenta '{entrada['nome']}' repetida no manifesto")
+        registro[entrada["nome"]] = FerramentaPreguicosa(**entrada)
+    return registro
+
+
+def validar_manifesto(manifesto: List[Dict] = None) -> List[str]:
+    """
+    Importa todas as ferramentas e compara com o manifesto
+
+    Returns:
+        Lista de problemas (vazia se tudo confere)
+    """
+    problemas = []
+    for ferramenta in carregar_registro(manifesto).values():
+        try:
+            classe = getattr(importlib.import_module(ferramenta.modulo), ferramenta.nome_classe)
+        except Exception as e:
+            problemas.append(f"{ferramenta.nome}: não foi possível importar "
+                             f"{ferramenta.modulo}.{ferramenta.nome_classe} ({e})")
+            continue
+        problemas.extend(ferramenta.comparar(classe))
+    return problemas
+
+
+# Teste rápido
+if __name__ == "__main__":
+    print("🧪 Testando registro de ferramentas...")
+
+    registro = carregar_registro()
+    print(f"Registradas: {', '.join(registro)}")
+    assert not any(ferramenta.carregada for ferramenta in registro.values())
+    assert "tools.buscar_web" not in sys.modules
+
+    hora = registro["obter_hora"]
+    assert hora.classe.executar("data").count("/") == 2
+    assert hora.carregada and "tools.buscar_web" not in sys.modules
+
+    problemas = validar_manifesto()
+    for problema in problemas:
+        print(f"  ⚠️ {problema}")
+    print("✅ Teste concluído!" if not problemas else "⚠️ Manifesto com problemas (veja acima)")
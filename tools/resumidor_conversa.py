@@ -0,0 +1,167 @@
+"""
+Resumidor de Conversa do JARVIS
+Condensa em segundo plano as mensagens antigas num resumo acumulado,
+guardado na JarvisMemoria - o contexto inicial fica do mesmo tamanho
+por mais que o histórico cresça
+"""
+
+import threading
+from typing import Callable, Dict, List
+
+from tools.jarvis_memoria import JarvisMemoria
+
+
+PROMPT_RESUMO = """Você mantém a memória de longo prazo do JARVIS, um assistente pessoal.
+Atualize o resumo abaixo incorporando as novas mensagens da conversa.
+
+Guarde o que será útil em conversas futuras: fatos sobre o usuário,
+preferências, pedidos recorrentes, decisões e assuntos em aberto.
+Descarte cumprimentos e detalhes sem importância. Escreva em português,
+em tópicos curtos, com no máximo {palavras} palavras."""
+
+
+def montar_pedido_resumo(resumo_atual: str, mensagens: List[Dict], palavras: int = 250) -> List[Dict]:
+    """
+    Monta as mensagens do pedido de resumo para o modelo
+
+    Args:
+        resumo_atual: resumo anterior ("" se ainda não há)
+        mensagens: mensagens novas a incorporar (role/content)
+        palavras: tamanho máximo do resumo
+
+    Returns:
+        Lista de mensagens no formato da API de chat
+    """
+    conversa = "\n".join(f"[{m['role'].upper()}] {m['content']}" for m in mensagens)
+    return [
+        {"role": "system", "content": PROMPT_RESUMO.format(palavras=palavras)},
+        {"role": "user", "content": f"RESUMO ATUAL:\n{resumo_atual or '(vazio)'}\n\nNOVAS MENSAGENS:\n{conversa}"}
+    ]
+
+
+class ResumidorConversa:
+    """
+    Resumo incremental do histórico
+
+    - Só as mensagens que saíram da "cauda" recente são resumidas
+    - Espera juntar `lote_minimo` mensagens antes de chamar o modelo
+      (uma chamada a cada poucos turnos, não a cada mensagem)
+    - Roda numa thread própria com conexão própria ao banco; pedidos
+      feitos enquanto já está rodando geram uma nova passada no fim
+    """
+
+    def __init__(self, completar: Callable[[List[Dict]], str], db_path: str = "jarvis_memoria.db",
+                 cauda: int = 10, lote_minimo: int = 20, palavras: int = 250):
+        """
+        Args:
+            completar: função mensagens -> texto (chamada ao modelo)
+            db_path: banco da JarvisMemoria
+            cauda: mensagens recentes que ficam fora do resumo (vão cruas no prompt)
+            lote_minimo: mensagens novas necessárias para atualizar o resumo
+            palavras: tamanho máximo do resumo
+        """
+        self.completar = completar
+        self.db_path = db_path
+        self.cauda = cauda
+        self.lote_minimo = lote_minimo
+        self.palavras = palavras
+
+        self._lock = threading.Lock()
+        self._rodando = False
+        self._pendente = False
+        self.atualizacoes = 0
+
+    def atualizar(self) -> bool:
+        """
+        Incorpora ao resumo as mensagens que já saíram da cauda (bloqueante)
+
+        Returns:
+            True se o resumo foi atualizado
+        """
+        memoria = JarvisMemoria(self.db_path)
+        try:
+            resumo = memoria.obter_resumo()
+            ate = resumo["ate_mensagem"] if resumo else 0
+            novas = memoria.obter_mensagens_apos(ate)[:-self.cauda or None]
+            if len(novas) < self.lote_minimo:
+                return False
+
+            conteudo = self.completar(montar_pedido_resumo(
+                resumo["conteudo"] if resumo else "", novas, self.palavras
+            ))
+            if not conteudo:
+                return False
+            if not memoria.salvar_resumo(conteudo.strip(), novas[-1]["id"]):
+                print("🗜️ Histórico limpo durante o resumo - descartado")
+                return False
+            self.atualizacoes += 1
+            print(f"🗜️ Resumo atualizado ({len(novas)} mensagens incorporadas)")
+            return True
+        finally:
+            memoria.fechar()
+
+    def _rodar(self):
+        while True:
+            try:
+                self.atualizar()
+            except Exception as e:
+                print(f"⚠️ Erro ao resumir conversa: {e}")
+            with self._lock:
+                if not self._pendente:
+                    self._rodando = False
+                    return
+                self._pendente = False
+
+    def agendar(self) -> None:
+        """Pede uma atualização em segundo plano (não bloqueia)"""
+        with self._lock:
+            if self._rodando:
+                self._pendente = True
+                return
+            self._rodando = True
+        threading.Thread(target=self._rodar, daemon=True, name="resumidor").start()
+
+
+# Teste rápido
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    print("🧪 Testando resumidor de conversa...")
+
+    caminho = os.path.join(tempfile.mkdtemp(), "teste_resumo.db")
+    memoria = JarvisMemoria(caminho)
+    for i in range(25):
+        memoria.adicionar_mensagem("user", f"Pergunta {i}")
+        memoria.adicionar_mensagem("assistant", f"Resposta {i}")
+
+    pedidos = []
+
+    def completar(mensagens):
+        pedidos.append(mensagens)
+        return f"Resumo com {mensagens[1]['content'].count('[USER]')} perguntas"
+
+    resumidor = ResumidorConversa(completar, caminho, cauda=10, lote_minimo=20)
+    assert resumidor.atualizar()
+    resumo = memoria.obter_resumo()
+    print(f"Resumo: {resumo}")
+    assert len(memoria.obter_mensagens_apos(resumo["ate_mensagem"])) == 10
+
+    # Poucas mensagens novas: não chama o modelo de novo
+    memoria.adicionar_mensagem("user", "Mais uma")
+    assert not resumidor.atualizar() and len(pedidos) == 1
+
+    # "Limpar memória" no meio do resumo: o resumo velho é descartado
+    for i in range(25):
+        memoria.adicionar_mensagem("user", f"Outra {i}")
+
+    def completar_e_limpar(mensagens):
+        memoria.limpar_historico()
+        return "Resumo que não pode voltar"
+
+    resumidor.completar = completar_e_limpar
+    assert not resumidor.atualizar() and memoria.obter_resumo() is None
+
+    memoria.fechar()
+    os.remove(caminho)
+    print("✅ Teste concluído!")
@@ -0,0 +1,267 @@
+"""
+Roteador de Intenções do JARVIS
+Responde pedidos simples e inequívocos (hora, data, clima de uma cidade,
+listar arquivos) chamando a ferramenta direto, sem passar pelo modelo
+"""
+
+import re
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+
+MESES = ["janeiro", "fevereiro", "março", "abril", "maio", "junho", "julho",
+         "agosto", "setembro", "outubro", "novembro", "dezembro"]
+DIAS_SEMANA = ["segunda-feira", "terça-feira", "quarta-feira", "quinta-feira",
+               "sexta-feira", "sábado", "domingo"]
+
+# "Jarvis, ...", "por favor" e pontuação final não mudam a intenção
+_PREFIXO = re.compile(r"^(?:(?:ei|oi|ô)\s+)?(?:jarvis[,!]?\s+)?(?:por favor[,]?\s+)?")
+_SUFIXO = re.compile(r"(?:[,]?\s+por favor)?\s*[?.!]*$")
+
+
+def normalizar_comando(comando: str) -> str:
+    """Minúsculas, espaços simples, sem vocativo/"por favor"/pontuação final"""
+    texto = " ".join(comando.lower().split())
+    texto = _PREFIXO.sub("", texto)
+    return _SUFIXO.sub("", texto).strip()
+
+
+# Palavras de tempo que caem no lugar da cidade ("clima no momento", "tempo em dezembro")
+_NAO_CIDADE = (r"hoje|amanhã|ontem|agora|momento|fim de semana|semana|mês|ano|manhã|tarde|noite|madrugada"
+               r"|próxim[oa]s?|segunda|terça|quarta|quinta|sexta|sábado|domingo|" + "|".join(MESES))
+
+
+def _nome_cidade(texto: str) -> str:
+    """'rio de janeiro' -> 'Rio de Janeiro'"""
+    return " ".join(p if p in ("de", "do", "da", "dos", "das", "e") else p.capitalize() for p in texto.split())
+
+
+def _falar_hora(resultado: str) -> Optional[str]:
+    """'14:05:09' -> 'São 14 horas e 5 minutos.'"""
+    try:
+        hora, minuto = (int(parte) for parte in resultado.split(":")[:2])
+    except ValueError:
+        return None
+    frase = "É 1 hora" if hora == 1 else f"São {hora} horas"
+    if minuto:
+        frase += " e 1 minuto" if minuto == 1 else f" e {minuto} minutos"
+    return frase + "."
+
+
+def _falar_data(resultado: str) -> Optional[str]:
+    """'18/10/2026' -> 'Hoje é domingo, 18 de outubro de 2026.'"""
+    try:
+        data = datetime.strptime(resultado.strip(), "%d/%m/%Y")
+    except ValueError:
+        return None
+    return f"Hoje é {DIAS_SEMANA[data.weekday()]}, {data.day} de {MESES[data.month - 1]} de {data.year}."
+
+
+_CLIMA = re.compile(r"^Clima em (?P<cidade>.+?): (?P<condicao>.*?)\s*(?P<temperatura>[+-]?\d+)°C\s+(?P<umidade>\d+)%")
+
+
+def _falar_clima(resultado: str) -> Optional[str]:
+    """'Clima em Recife: Ensolarado +29°C 70% ↑15km/h' -> frase com temperatura e umidade"""
+    encontrado = _CLIMA.match(resultado or "")
+    if not encontrado:
+        return None  # Erro da API ou formato inesperado: o modelo explica melhor
+    temperatura = int(encontrado["temperatura"])
+    frase = f"Em {encontrado['cidade']} agora faz {temperatura} graus, com umidade de {encontrado['umidade']}%"
+    if encontrado["condicao"]:
+        frase += f". Condição: {encontrado['condicao']}"
+    return frase + "."
+
+
+def _falar_lista(resultado: str) -> Optional[str]:
+    """Resultado de listar_arquivos -> frase com as pastas e os arquivos"""
+    if not resultado or resultado.startswith("❌"):
+        return None
+    if "vazia" in resultado:
+        return "A pasta está vazia."
+
+    secoes = {"pastas": [], "arquivos": []}
+    atual = None
+    for linha in resultado.splitlines():
+        linha = linha.strip()
+        if linha.startswith("📁"):
+            atual = "pastas"
+        elif linha.startswith("📄"):
+            atual = "arquivos"
+        elif linha.startswith("- ") and atual:
+            secoes[atual].append(linha[2:].split(" (")[0].rstrip("/"))
+
+    partes = []
+    for nome, itens in secoes.items():
+        if itens:
+            rotulo = nome if len(itens) > 1 else nome[:-1]
+            partes.append(f"{len(itens)} {rotulo}: {', '.join(itens)}")
+    if not partes:
+        return None
+    return f"Encontrei {' e '.join(partes)}."
+
+
+class Intencao:
+    """Um padrão de pedido ligado a uma ferramenta e a um modelo de resposta"""
+
+    def __init__(self, nome: str, padrao: str, ferramenta: str,
+                 argumentos: Callable[[re.Match], Dict],
+                 responder: Callable[[str], Optional[str]]):
+        """
+        Args:
+            nome: nome da intenção (estatísticas)
+            padrao: regex que precisa casar com o comando normalizado INTEIRO
+            ferramenta: ferramenta do orquestrador
+            argumentos: match -> argumentos da ferramenta
+            responder: resultado -> frase falada (None = deixa para o modelo)
+        """
+        self.nome = nome
+        self.padrao = re.compile(padrao)
+        self.ferramenta = ferramenta
+        self.argumentos = argumentos
+        self.responder = responder
+
+
+INTENCOES_PADRAO = [
+    Intencao(
+        "hora",
+        r"(?:que horas? (?:são|é|e)(?: agora)?|qual (?:é )?a hora(?: agora)?|me (?:diz|diga) (?:as|a) horas?)",
+        "obter_hora", lambda m: {"formato": "hora"}, _falar_hora
+    ),
+    Intencao(
+        "data",
+        r"(?:que dia é hoje|que data é hoje|qual (?:é )?a data(?: de hoje)?|(?:em )?que dia (?:estamos|nós estamos))",
+        "obter_hora", lambda m: {"formato": "data"}, _falar_data
+    ),
+    Intencao(
+        "clima",
+        # Só o clima de AGORA num lugar, com em/no/na ("tempo de cozimento", "clima da
+        # reunião" não são clima); "previsão" (futuro) e palavras de tempo no lugar
+        # da cidade ficam com o modelo
+        r"(?:(?:como (?:está|tá) |qual (?:é )?)?(?:o |a )?(?:clima|tempo|temperatura) (?:em|no|na) "
+        rf"(?!(?:o |a |os |as )?(?:{_NAO_CIDADE})\b)"
+        r"(?P<cidade>[a-zà-ÿ][a-zà-ÿ' -]{1,40}?)(?: hoje| agora)?)",
+        "obter_clima", lambda m: {"cidade": _nome_cidade(m["cidade"])}, _falar_clima
+    ),
+    Intencao(
+        "listar_arquivos",
+        r"(?:(?:liste|listar|lista|mostre|mostra|quais são) (?:os |meus |os meus )?arquivos"
+        r"(?: da mesa de trabalho| da pasta (?P<pasta>[\w.-]+))?)",
+        "listar_arquivos", lambda m: {"pasta": m["pasta"]} if m["pasta"] else {}, _falar_lista
+    ),
+]
+
+
+class RoteadorIntencoes:
+    """
+    Atalho determinístico antes do modelo
+
+    - Só responde quando o comando inteiro casa com um padrão
+      e o resultado da ferramenta cabe no modelo de resposta
+    - Qualquer outra coisa (ou erro) segue para o modelo
+    - Mede acertos e o tempo economizado em relação ao modelo
+    """
+
+    def __init__(self, chamar_ferramenta: Callable[[str, Dict], Any],
+                 intencoes: List[Intencao] = None):
+        """
+        Args:
+            chamar_ferramenta: função (nome, argumentos) -> resultado (None se falhou)
+            intencoes: intenções reconhecidas (padrão: INTENCOES_PADRAO)
+        """
+        self.chamar_ferramenta = chamar_ferramenta
+        self.intencoes = intencoes if intencoes is not None else INTENCOES_PADRAO
+
+        self.consultas = 0
+        self.acertos = {}
+        self._tempo_atalho = 0.0
+        self._tempo_modelo = 0.0
+        self._respostas_modelo = 0
+
+    def rotear(self, comando: str) -> Optional[str]:
+        """
+        Tenta responder sem o modelo
+
+        Returns:
+            Resposta pronta para falar, ou None para seguir para o modelo
+        """
+        inicio = time.monotonic()
+        self.consultas += 1
+        texto = normalizar_comando(comando)
+
+        for intencao in self.intencoes:
+            encontrado = intencao.padrao.fullmatch(texto)
+            if not encontrado:
+                continue
+            resultado = self.chamar_ferramenta(intencao.ferramenta, intencao.argumentos(encontrado))
+            resposta = intencao.responder(resultado) if isinstance(resultado, str) else None
+            if resposta is None:
+                return None
+            self.acertos[intencao.nome] = self.acertos.get(intencao.nome, 0) + 1
+            self._tempo_atalho += time.monotonic() - inicio
+            return resposta
+        return None
+
+    def registrar_tempo_modelo(self, segundos: float) -> None:
+        """Informa quanto o modelo levou para responder (base da economia)"""
+        self._tempo_modelo += segundos
+        self._respostas_modelo += 1
+
+    def estatisticas(self) -> dict:
+        acertos = sum(self.acertos.values())
+        medio_atalho = self._tempo_atalho / acertos if acertos else 0.0
+        medio_modelo = self._tempo_modelo / self._respostas_modelo if self._respostas_modelo else 0.0
+        return {
+            "consultas": self.consultas,
+            "acertos": acertos,
+            "taxa_acerto": acertos / self.consultas if self.consultas else 0.0,
+            "por_intencao": dict(self.acertos),
+            "tempo_medio_atalho": medio_atalho,
+            "tempo_medio_modelo": medio_modelo,
+            "tempo_economizado": acertos * max(medio_modelo - medio_atalho, 0.0) if self._respostas_modelo else None,
+        }
+
+
+# Teste rápido
+if __name__ == "__main__":
+    print("🧪 Testando roteador de intenções...")
+
+    def chamar(nome, argumentos):
+        if nome == "obter_hora":
+            return "14:05:09" if argumentos["formato"] == "hora" else "18/10/2026"
+        if nome == "obter_clima":
+            return f"Clima em {argumentos['cidade']}: Ensolarado +29°C 70% ↑15km/h"
+        if nome == "listar_arquivos":
+            return "📂 Conteúdo de mesa_de_trabalho/.:\n\n📁 Pastas:\n  - notas/\n\n📄 Arquivos:\n  - a.txt (10 bytes)\n  - b.py (20 bytes)\n"
+        return None
+
+    roteador = RoteadorIntencoes(chamar)
+    casos = {
+        "Que horas são?": "São 14 horas e 5 minutos.",
+        "Jarvis, que dia é hoje?": "Hoje é domingo, 18 de outubro de 2026.",
+        "como está o clima em são paulo": "Em São Paulo agora faz 29 graus, com umidade de 70%. Condição: Ensolarado.",
+        "como está o tempo em recife": "Em Recife agora faz 29 graus, com umidade de 70%. Condição: Ensolarado.",
+        "qual o tempo de cozimento do arroz": None,
+        "qual a temperatura de fusão do ferro": None,
+        "qual a previsão do tempo para amanhã": None,
+        "qual a previsão do tempo em recife": None,
+        "como está o clima de hoje": None,
+        "qual a previsão para o fim de semana": None,
+        "qual é a temperatura no momento": None,
+        "qual o clima da reunião": None,
+        "como está o tempo em dezembro": None,
+        "liste os arquivos": "Encontrei 1 pasta: notas e 2 arquivos: a.txt, b.py.",
+        "que horas são em Tóquio?": None,
+        "me conta uma piada sobre o clima em paris e a hora": None,
+    }
+    for comando, esperado in casos.items():
+        resposta = roteador.rotear(comando)
+        print(f"  {comando!r} -> {resposta!r}")
+        assert resposta == esperado, resposta
+
+    roteador.registrar_tempo_modelo(2.0)
+    estatisticas = roteador.estatisticas()
+    print(f"Estatísticas: {estatisticas}")
+    assert estatisticas["acertos"] == 5 and estatisticas["tempo_economizado"] > 7
+
+    print("✅ Teste concluído!")
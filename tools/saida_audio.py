@@ -0,0 +1,232 @@
+"""
+Saída de Áudio do JARVIS
+Toca PCM direto numa saída do PyAudio, conforme os bytes chegam
+(sem arquivo temporário e sem decodificar MP3)
+"""
+
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+import pyaudio
+
+
+class SaidaAudio:
+    """
+    Saída de áudio em fluxo, movida pelo callback do PortAudio
+
+    - tocar() só enfileira os blocos; o callback puxa um buffer por vez
+    - Fim e cancelamento viram eventos: quem espera acorda na hora,
+      sem ficar consultando o estado em intervalos
+    - parar() (barge-in) esvazia a fila: o próximo callback já entrega
+      silêncio, ou seja, a voz some em no máximo um buffer; se a fonte dos
+      blocos tem cancelar() (ex.: AudioEmFluxo), parar() a chama - tocar()
+      não fica preso esperando o próximo bloco da síntese
+    - `ao_tocar` recebe cada pedaço entregue ao dispositivo
+      (usado como referência pelo cancelador de eco)
+    """
+
+    def __init__(self, pyaudio_instancia: pyaudio.PyAudio, taxa: int = 24000,
+                 tamanho_buffer: int = 512,
+                 ao_tocar: Optional[Callable[[bytes, float], None]] = None):
+        """
+        Args:
+            pyaudio_instancia: instância do PyAudio já criada
+            taxa: taxa do PCM recebido (Hz)
+            tamanho_buffer: amostras por callback (512 = ~21 ms a 24 kHz)
+            ao_tocar: função (pedaço, instante) chamada a cada buffer com áudio
+        """
+        self.pyaudio = pyaudio_instancia
+        self.taxa = taxa
+        self.tamanho_buffer = tamanho_buffer
+        self.ao_tocar = ao_tocar
+        self.fluxo = None
+
+        self._lock = threading.Lock()
+        self._pendente = bytearray()
+        self._escrita_terminou = False
+        self._cancelado = False
+        self._soltar_escrita = None  # cancelar() da fonte que tocar() está lendo
+        self._terminou = threading.Event()  # Fila tocada até o fim ou cancelada
+        self._terminou.set()
+
+        # Medição: pedido de parada -> primeiro buffer em silêncio
+        self._pedido_parada = None
+        self.latencias_parada: List[float] = []
+
+    def _abrir(self):
+        """Abre o fluxo de saída (se ainda não estiver aberto)"""
+        if self.fluxo is None:
+            self.fluxo = self.pyaudio.open(
+                format=pyaudio.paInt16,
+                channels=1,
+                rate=self.taxa,
+                output=True,
+                frames_per_buffer=self.tamanho_buffer,
+                stream_callback=self._callback
+            )
+        elif self.fluxo.is_stopped():
+            self.fluxo.start_stream()
+        return self.fluxo
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        """Entrega o próximo buffer (thread do PortAudio - não pode bloquear)"""
+        tamanho = frame_count * 2
+        with self._lock:
+            pedaco = bytes(self._pendente[:tamanho])
+            del self._pendente[:tamanho]
+            if not self._pendente and self._escrita_terminou:
+                self._terminou.set()
+            if self._pedido_parada is not None:
+                self.latencias_parada.append(time.monotonic() - self._pedido_parada)
+                self._pedido_parada = None
+
+        if pedaco and self.ao_tocar:
+            self.ao_tocar(pedaco, time.monotonic())
+        if len(pedaco) < tamanho:
+            # Rede atrasou ou acabou a fala: completa com silêncio
+            pedaco += b"\x00" * (tamanho - len(pedaco))
+        return pedaco, pyaudio.paContinue
+
+    def tocar(self, blocos: Iterable[bytes], interromper: threading.Event) -> bool:
+        """
+        Toca os blocos PCM conforme chegam e espera o fim
+
+        Args:
+            blocos: bytes PCM 16 bits mono (qualquer tamanho de bloco)
+            interromper: evento de interrupção (checado entre blocos;
+                         a parada imediata vem de parar())
+
+        Returns:
+            True se foi interrompido
+        """
+        with self._lock:
+            self._pendente.clear()
+            self._escrita_terminou = False
+            self._cancelado = False
+            self._soltar_escrita = getattr(blocos, "cancelar", None)
+            self._terminou.clear()
+        try:
+            self._abrir()
+
+            sobra = b""
+            for bloco in blocos:
+                if self._cancelado or interromper.is_set():
+                    self.parar()
+                    return True
+                # Só amostras inteiras na fila (um byte ímpar espera o próximo bloco)
+                bloco = sobra + bloco
+                corte = len(bloco) - len(bloco) % 2
+                sobra = bloco[corte:]
+                with self._lock:
+                    if self._cancelado:
+                        break
+                    self._pendente.extend(bloco[:corte])
+
+            with self._lock:
+                self._escrita_terminou = True
+                if not self._pendente:
+                    self._terminou.set()
+
+            self._terminou.wait()
+            return self._cancelado or interromper.is_set()
+        finally:
+            with self._lock:
+                self._soltar_escrita = None
+
+    def parar(self, instante: Optional[float] = None) -> None:
+        """
+        Cancela o que está tocando (pode ser chamada de qualquer thread)
+
+        Args:
+            instante: time.monotonic() da decisão de parar (para medir a latência)
+        """
+        with self._lock:
+            if self._terminou.is_set():
+                return
+            self._cancelado = True
+            self._pendente.clear()
+            self._pedido_parada = time.monotonic() if instante is None else instante
+            self._terminou.set()
+            soltar, self._soltar_escrita = self._soltar_escrita, None
+        if soltar is not None:
+            soltar()  # Acorda tocar() se ele espera o próximo bloco
+
+    def drenar(self):
+        """Espera o dispositivo tocar o que ainda está na fila"""
+        if self.fluxo is not None and not self.fluxo.is_stopped():
+            self.fluxo.stop_stream()
+
+    def fechar(self):
+        """Libera o dispositivo de saída"""
+        self.parar()
+        if self.fluxo is not None:
+            try:
+                self.fluxo.close()
+            finally:
+                self.fluxo = None
+
+
+# Teste rápido (precisa de um dispositivo de saída)
+if __name__ == "__main__":
+    import numpy as np
+
+    print("🧪 Testando saída de áudio...")
+
+    taxa = 24000
+    tempo = np.arange(3 * taxa) / taxa
+    tom = (np.sin(2 * np.pi * 440 * tempo) * 3000).astype(np.int16).tobytes()
+    blocos = [tom[i:i + 4096] for i in range(0, len(tom), 4096)]
+    instancia = pyaudio.PyAudio()
+
+    def interromper_depois(evento, segundos, acao):
+        def disparar():
+            time.sleep(segundos)
+            acao(time.monotonic())
+            evento.set()
+        threading.Thread(target=disparar, daemon=True).start()
+
+    # Antes: escrita bloqueante, interrupção vista só entre escritas
+    fluxo = instancia.open(format=pyaudio.paInt16, channels=1, rate=taxa,
+                           output=True, frames_per_buffer=1024)
+    evento = threading.Event()
+    marcas = {}
+    interromper_depois(evento, 0.5, lambda inicio: marcas.setdefault("inicio", inicio))
+    for bloco in blocos:
+        if evento.is_set():
+            break
+        fluxo.write(bloco)
+    antes = time.monotonic() - marcas["inicio"]
+    fluxo.close()
+
+    # Depois: callback + parar()
+    saida = SaidaAudio(instancia, taxa)
+    evento = threading.Event()
+    interromper_depois(evento, 0.5, saida.parar)
+    assert saida.tocar(blocos, evento)
+    time.sleep(0.1)
+    depois = saida.latencias_parada[-1]
+
+    print(f"Parada com escrita bloqueante: {antes * 1000:.1f} ms")
+    print(f"Parada com callback:           {depois * 1000:.1f} ms")
+    assert depois <= 2 * saida.tamanho_buffer / taxa
+
+    # Síntese travada no meio da frase: parar() solta tocar() na hora
+    from tools.fala_pipeline import AudioEmFluxo
+    audio = AudioEmFluxo("frase lenta")
+    audio.escrever(tom[:4096])  # E o próximo bloco nunca chega
+    evento = threading.Event()
+    interromper_depois(evento, 0.3, saida.parar)
+    inicio = time.monotonic()
+    assert saida.tocar(audio, evento) and audio.cancelado
+    print(f"Síntese travada interrompida em {time.monotonic() - inicio:.2f}s")
+    assert time.monotonic() - inicio < 0.5
+
+    # Fim normal: tocar() acorda pelo evento de conclusão
+    inicio = time.monotonic()
+    assert not saida.tocar([tom[:taxa // 2 * 2]], threading.Event())
+    print(f"Meio segundo de áudio tocado em {time.monotonic() - inicio:.2f}s")
+
+    saida.fechar()
+    instancia.terminate()
+    print("✅ Teste concluído!")
@@ -4,22 +4,15 @@ Ferramentas para manipulação de arquivos e pastas no diretório de trabalho
 """
 
 import os
-import sys
 from pathlib import Path
 from typing import Dict
 
 
 # Diretório de trabalho (mesa_de_trabalho na pasta do projeto)
 # Usa o caminho absoluto a partir da localização deste arquivo
+# (criado pelas ferramentas na primeira vez que precisam dele)
 DIRETORIO_TRABALHO = Path(__file__).parent.parent / "mesa_de_trabalho"
 
-# Cria o diretório se não existir
-try:
-    DIRETORIO_TRABALHO.mkdir(exist_ok=True)
-    print(f"📂 Diretório de trabalho: {DIRETORIO_TRABALHO.absolute()}", file=sys.stderr)
-except Exception as e:
-    print(f"⚠️ Erro ao criar diretório de trabalho: {e}", file=sys.stderr)
-
 
 class FerramentaCriarPasta:
     """Ferramenta para criar pastas"""
@@ -170,6 +163,9 @@ class FerramentaListarArquivos:
             Lista formatada de arquivos e pastas
         """
         try:
+            if not DIRETORIO_TRABALHO.exists():
+                DIRETORIO_TRABALHO.mkdir(parents=True, exist_ok=True)
+            
             if pasta == ".":
                 caminho = DIRETORIO_TRABALHO
             else: